@@ -0,0 +1,277 @@
+"""Benchmark the Python-side cost of `select_icons` by catalog size.
+
+Each scenario calls `select_icons` with the Streamlit runtime stubbed out
+and times the phases of one rerun separately:
+
+- ``build_args``: `select_icons` up to the component call (validation,
+  per-item transforms, catalog payloads)
+- ``json``: encoding the JSON args the way Streamlit does
+- ``protobuf``: building and serializing the ``ComponentInstance`` message
+  sent to the browser
+- ``decode``: parsing the JSON value posted by the frontend and turning it
+  back into the result
+
+and records the size of the serialized message. Run it from the repository
+root::
+
+    python benchmarks/bench_select_icons.py
+    python benchmarks/bench_select_icons.py --sizes 100 1000 --output /tmp/branch.json \
+        --compare benchmarks/results/0.1.0.json
+
+Results are written to ``benchmarks/results/<version>.json`` so runs for
+different releases can be compared. ``--compare`` refuses to overwrite the
+baseline it reads, so compare against a release of the same version with
+``--output`` pointing elsewhere.
+
+The script also runs against older releases: copy it into a checkout of the
+release and run it there. Scenarios the release does not support (catalogs,
+compact selection encodings) are skipped, and releases whose frontend echoes
+the items map back are measured with that value.
+"""
+
+import argparse
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+import tomllib
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import streamlit  # noqa: E402
+from streamlit.proto.Components_pb2 import ComponentInstance, SpecialArg  # noqa: E402
+
+import streamlit_select_icons  # noqa: E402
+from streamlit_select_icons import select_icons  # noqa: E402
+
+# Missing from releases older than the features they measure
+IconCatalog = getattr(streamlit_select_icons, "IconCatalog", None)
+_build_result = getattr(streamlit_select_icons, "_build_result", None)
+HAS_ENCODINGS = "selection_encoding" in inspect.signature(select_icons).parameters
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+# Share of the catalog selected in the value posted back by the frontend
+SELECTED_FRACTION = 0.1
+# Each phase is repeated until it has run this long, or `max_runs` times
+MIN_SECONDS = 0.5
+
+
+def make_items(count: int) -> Dict[str, Dict[str, Any]]:
+    return {
+        f"item_{i}": {
+            "label": f"Item {i}",
+            "icon": "static/icon.png",
+            "properties": {"category": f"group_{i % 10}", "priority": i},
+        }
+        for i in range(count)
+    }
+
+
+def frontend_value(items, item_ids: List[str], encoding: str) -> Dict[str, Any]:
+    """Return the value the frontend posts for a selection of every tenth item."""
+    step = int(1 / SELECTED_FRACTION)
+    indices = range(0, len(item_ids), step)
+    if _build_result is None:
+        # Releases before the slim return value echo the items map
+        return {
+            "items": items,
+            "selected_items": [item_ids[index] for index in indices],
+        }
+    if encoding == "bitset":
+        import base64
+
+        data = bytearray((len(item_ids) + 7) // 8)
+        for index in indices:
+            data[index >> 3] |= 1 << (index & 7)
+        return {"selected_bitset": base64.b64encode(bytes(data)).decode("ascii")}
+    if encoding == "ranges":
+        return {"selected_ranges": [[index, index + 1] for index in indices]}
+    return {"selected_items": [item_ids[index] for index in indices]}
+
+
+# Component call kwargs Streamlit handles itself instead of sending as args
+NON_ARG_KWARGS = frozenset(("key", "default", "on_change"))
+
+
+def split_args(kwargs: Dict[str, Any]):
+    """Split component kwargs into JSON args and special (bytes) args, like Streamlit."""
+    json_args, special_args = {}, []
+    for name, value in kwargs.items():
+        if name in NON_ARG_KWARGS:
+            continue
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            arg = SpecialArg()
+            arg.key = name
+            arg.bytes = bytes(value)
+            special_args.append(arg)
+        else:
+            json_args[name] = value
+    return json_args, special_args
+
+
+def component_message(json_args: str, special_args) -> bytes:
+    instance = ComponentInstance()
+    instance.component_name = "streamlit_select_icons"
+    instance.json_args = json_args
+    instance.special_args.extend(special_args)
+    return instance.SerializeToString()
+
+
+@contextmanager
+def stubbed_component() -> Iterator[List[Dict[str, Any]]]:
+    """Replace the declared component with a recorder, as in bare mode."""
+    calls: List[Dict[str, Any]] = []
+    original = streamlit_select_icons._component_func
+
+    def fake_component_func(**kwargs):
+        calls.append(kwargs)
+        return None
+
+    streamlit_select_icons._component_func = fake_component_func
+    try:
+        yield calls
+    finally:
+        streamlit_select_icons._component_func = original
+
+
+def time_phase(func: Callable[[], Any], max_runs: int) -> Dict[str, float]:
+    """Return the median and minimum wall time of `func` in milliseconds."""
+    timings = []
+    deadline = time.perf_counter() + MIN_SECONDS
+    while len(timings) < max_runs and (len(timings) < 3 or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(timings), 4),
+        "min_ms": round(min(timings), 4),
+        "runs": len(timings),
+    }
+
+
+def bench_scenario(items, item_ids: List[str], encoding: str, max_runs: int) -> Dict[str, Any]:
+    posted = json.dumps(frontend_value(items, item_ids, encoding))
+    options = {"selection_encoding": encoding} if HAS_ENCODINGS else {}
+    with stubbed_component() as calls:
+        build_args = time_phase(lambda: select_icons(items, **options), max_runs)
+    kwargs = dict(calls[-1])
+    json_args, special_args = split_args(kwargs)
+    serialized = json.dumps(json_args)
+    message = component_message(serialized, special_args)
+
+    return {
+        "build_args": build_args,
+        "json": time_phase(lambda: json.dumps(split_args(kwargs)[0]), max_runs),
+        "protobuf": time_phase(lambda: component_message(serialized, special_args), max_runs),
+        # Releases without `_build_result` return the parsed value as is
+        "decode": time_phase(
+            (lambda: _build_result(items, json.loads(posted))) if _build_result else (lambda: json.loads(posted)),
+            max_runs,
+        ),
+        "json_bytes": len(serialized.encode("utf-8")),
+        "special_bytes": sum(len(arg.bytes) for arg in special_args),
+        "message_bytes": len(message),
+        "value_bytes": len(posted.encode("utf-8")),
+    }
+
+
+def run(sizes, max_runs: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for count in sizes:
+        items = make_items(count)
+        item_ids = list(items)
+        scenarios = {"dict/ids": (items, "ids")}
+        if HAS_ENCODINGS:
+            scenarios["dict/bitset"] = (items, "bitset")
+        if IconCatalog is not None:
+            catalog = IconCatalog.from_items(items)
+            scenarios["catalog/ids"] = (catalog, "ids")
+            if HAS_ENCODINGS:
+                scenarios["catalog/bitset"] = (catalog, "bitset")
+        for name, (scenario_items, encoding) in scenarios.items():
+            key = f"{name}/{count}"
+            print(f"  {key} ...", file=sys.stderr, flush=True)
+            results[key] = bench_scenario(scenario_items, item_ids, encoding, max_runs)
+    return results
+
+
+def package_version() -> str:
+    with open(ROOT / "pyproject.toml", "rb") as f:
+        return tomllib.load(f)["project"]["version"]
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print the change of each median and byte count against a baseline run."""
+    print(f"\nCompared with {baseline['version']} ({baseline['timestamp']}):")
+    for key, phases in current.items():
+        previous = baseline["results"].get(key)
+        if previous is None:
+            continue
+        changes = []
+        for phase, measurement in phases.items():
+            old = previous.get(phase)
+            if old is None:
+                continue
+            new_value = measurement["median_ms"] if isinstance(measurement, dict) else measurement
+            old_value = old["median_ms"] if isinstance(old, dict) else old
+            if old_value:
+                changes.append(f"{phase} {100 * (new_value - old_value) / old_value:+.1f}%")
+        print(f"  {key:24} " + ", ".join(changes))
+
+
+def print_table(results: Dict[str, Any]) -> None:
+    print(f"\n{'scenario':24} {'build ms':>10} {'json ms':>10} {'proto ms':>10} {'decode ms':>10} {'message B':>12}")
+    for key, result in results.items():
+        print(
+            f"{key:24} {result['build_args']['median_ms']:>10.3f} {result['json']['median_ms']:>10.3f} "
+            f"{result['protobuf']['median_ms']:>10.3f} {result['decode']['median_ms']:>10.3f} "
+            f"{result['message_bytes']:>12,}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--max-runs", type=int, default=50)
+    parser.add_argument("--output", type=Path, help="results file (default: results/<version>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    version = package_version()
+    output = args.output or RESULTS_DIR / f"{version}.json"
+    # Read the baseline before anything is written: it may be this version's file
+    baseline = None
+    if args.compare:
+        if args.compare.resolve() == output.resolve():
+            parser.error(f"--compare {args.compare} is the results file of this run; pass --output elsewhere")
+        baseline = json.loads(args.compare.read_text())
+
+    results = run(args.sizes, args.max_runs)
+    report = {
+        "version": version,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print_table(results)
+    print(f"\nResults written to {output}")
+
+    if baseline is not None:
+        compare(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Streamlit app driven by `bench_component.py`.
+
+The catalog size, layout and icon delivery come from the ``items``,
+``layout`` and ``icons`` query parameters. Each item gets its own PNG file
+under ``static/bench/``, served by Streamlit from ``/app/static/``, so icon
+loading goes over the network; the harness gives every case a fresh
+browser context, so nothing comes from the browser cache. ``icons`` picks
+how those files reach the browser:
+
+- ``files``: one request per icon (the default)
+- ``inline``: embedded as data URIs (``inline_icons=True``)
+- ``thumbnails``: pre-scaled thumbnails through ``srcset``
+- ``atlas``: one sprite sheet (``build_icon_atlas``)
+- ``fingerprint``: content-hashed URLs plus first-screen preloading
+
+Run with the app's folder as the working directory and static serving on,
+as the harness does.
+"""
+
+import colorsys
+import sys
+from pathlib import Path
+from typing import List
+
+import streamlit as st
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from streamlit_select_icons import build_icon_atlas, select_icons  # noqa: E402
+
+ICON_MODES = ("files", "inline", "thumbnails", "atlas", "fingerprint")
+ICON_DIR = Path("static") / "bench"
+ICON_SIZE = 64
+
+
+@st.cache_resource
+def make_icons(count: int) -> List[str]:
+    """Write one distinct icon per item (once per size) and return their paths."""
+    from PIL import Image, ImageDraw
+
+    ICON_DIR.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = ICON_DIR / f"icon_{i}.png"
+        if not path.exists():
+            red, green, blue = colorsys.hls_to_rgb(i * 37 % 360 / 360, 0.5, 0.7)
+            image = Image.new("RGBA", (ICON_SIZE, ICON_SIZE), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(image)
+            draw.ellipse((4, 4, ICON_SIZE - 4, ICON_SIZE - 4), fill=(int(red * 255), int(green * 255), int(blue * 255)))
+            draw.text((ICON_SIZE // 2, ICON_SIZE // 2), str(i % 1000), fill="black", anchor="mm")
+            image.save(path)
+        paths.append(path.as_posix())
+    return paths
+
+
+@st.cache_data
+def make_items(count: int):
+    return {
+        f"item_{i}": {"label": f"Item {i}", "icon": icon, "properties": {"category": f"group_{i % 10}"}}
+        for i, icon in enumerate(make_icons(count))
+    }
+
+
+count = int(st.query_params.get("items", 1000))
+layout = st.query_params.get("layout", "column")
+icons = st.query_params.get("icons", "files")
+if icons not in ICON_MODES:
+    st.error(f"icons must be one of {ICON_MODES}")
+    st.stop()
+
+items = make_items(count)
+result = select_icons(
+    items,
+    layout=layout,
+    columns=6,
+    rows=3,
+    width=720,
+    height=480,
+    size=96,
+    inline_icons=icons == "inline",
+    thumbnails=icons == "thumbnails",
+    fingerprint_icons=icons == "fingerprint",
+    atlas=build_icon_atlas(item["icon"] for item in items.values()) if icons == "atlas" else None,
+    key="bench",
+)
+
+# Read by the harness to detect the end of the rerun a click triggered
+st.text(f"bench-selected:{len(result['selected_items'])};")
@@ -0,0 +1,280 @@
+"""Headless browser benchmark for the select_icons component.
+
+Serves `bench_app.py` with `StreamlitRunner` and, for each catalog size,
+layout and icon delivery mode, loads the app in headless Chromium and
+records:
+
+- time to first card: navigation start to the first card in the iframe
+- time to icons loaded: navigation start to every card in view showing its
+  decoded icon, fetched from ``/app/static`` (each case runs in a fresh
+  browser context, so with an empty HTTP cache)
+- click to value: a card click to the component posting its value
+- click to rerun: a card click to the app finishing the rerun it triggered
+- scroll frames: frames drawn while the grid scrolls end to end
+
+The frontend must be built (``npm run build`` in the frontend folder).
+Run from the repository root::
+
+    python e2e/bench_component.py
+    python e2e/bench_component.py --sizes 100 1000 --layouts column
+    python e2e/bench_component.py --icons files atlas fingerprint
+
+The report is written as JSON to ``benchmarks/results/browser-<version>.json``.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tomllib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from playwright.sync_api import Frame, Page, sync_playwright
+
+from e2e_utils import StreamlitRunner
+
+ROOT_DIRECTORY = Path(__file__).parent.parent.absolute()
+BENCH_APP_FILE = Path(__file__).resolve().parent / "bench_app.py"
+RESULTS_DIR = ROOT_DIRECTORY / "benchmarks" / "results"
+
+DEFAULT_SIZES = (100, 1_000, 10_000)
+DEFAULT_LAYOUTS = ("column", "row")
+ICON_MODES = ("files", "inline", "thumbnails", "atlas", "fingerprint")
+COMPONENT_IFRAME = 'iframe[title^="streamlit_select_icons"]'
+TIMEOUT_MS = 120_000
+SETTLE_MS = 1_000
+
+# Installed in every frame before any page script runs. Timestamps are
+# `timeOrigin + now()` so the page and the component iframe share a clock.
+INIT_SCRIPT = """
+(() => {
+  const now = () => performance.timeOrigin + performance.now()
+  window.__bench = { now, firstCardAt: null, values: [] }
+  if (window === window.top) {
+    window.addEventListener("message", event => {
+      if (event.data && event.data.type === "streamlit:setComponentValue") {
+        window.__bench.values.push(now())
+      }
+    })
+  } else {
+    const observer = new MutationObserver(() => {
+      if (document.querySelector(".ssi-card")) {
+        window.__bench.firstCardAt = now()
+        observer.disconnect()
+      }
+    })
+    observer.observe(document, { childList: true, subtree: true })
+  }
+})()
+"""
+
+# Resolves once every card inside the grid's viewport shows a decoded icon.
+# Atlas cards draw a sprite as a CSS background: it counts once its sheet
+# has finished downloading.
+ICONS_LOADED = """
+() => {
+  const cards = Array.from(document.querySelectorAll(".ssi-card"))
+  if (cards.length === 0) return false
+  const view = cards[0].parentElement.getBoundingClientRect()
+  const visible = cards.filter(card => {
+    const box = card.getBoundingClientRect()
+    return box.right > view.left && box.left < view.right && box.bottom > view.top && box.top < view.bottom
+  })
+  const loaded = visible.every(card => {
+    const sprite = card.querySelector("[role=img]")
+    if (sprite) {
+      const match = /url\\("?([^")]+)"?\\)/.exec(sprite.style.backgroundImage)
+      const url = match && new URL(match[1], document.baseURI).href
+      return url && performance.getEntriesByName(url).some(entry => entry.responseEnd > 0)
+    }
+    const img = card.querySelector("img")
+    return img && img.complete && img.naturalWidth > 0
+  })
+  return loaded ? window.__bench.now() : false
+}
+"""
+
+CLICK_CARD = """
+index => {
+  const cards = document.querySelectorAll(".ssi-card")
+  const at = window.__bench.now()
+  cards[index % cards.length].click()
+  return at
+}
+"""
+
+# Scroll the grid end to end over `durationMs` and time every frame
+SCROLL_FRAMES = """
+({ horizontal, durationMs }) => new Promise(resolve => {
+  const container = document.querySelector(".ssi-card").parentElement
+  const extent = horizontal
+    ? container.scrollWidth - container.clientWidth
+    : container.scrollHeight - container.clientHeight
+  const frames = []
+  let start = null
+  const step = time => {
+    if (start === null) start = time
+    frames.push(time)
+    const progress = Math.min(1, (time - start) / durationMs)
+    if (horizontal) container.scrollLeft = progress * extent
+    else container.scrollTop = progress * extent
+    if (progress < 1) {
+      requestAnimationFrame(step)
+      return
+    }
+    const intervals = frames.slice(1).map((t, i) => t - frames[i])
+    resolve({
+      frames: frames.length,
+      duration_ms: time - start,
+      fps: (frames.length - 1) / ((time - start) / 1000),
+      long_frames: intervals.filter(interval => interval > 50).length,
+      max_frame_ms: Math.max(0, ...intervals),
+      scroll_extent_px: extent,
+    })
+  }
+  requestAnimationFrame(step)
+})
+"""
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "max_ms": round(max(samples), 2),
+        "samples": len(samples),
+    }
+
+
+def component_frame(page: Page) -> Frame:
+    element = page.wait_for_selector(COMPONENT_IFRAME, timeout=TIMEOUT_MS)
+    frame = element.content_frame()
+    if frame is None:
+        raise RuntimeError("Component iframe has no content frame")
+    return frame
+
+
+def wait_for_selected(page: Page, selected: int) -> float:
+    """Wait for the app to report `selected` items and return when it did."""
+    handle = page.wait_for_function(
+        "selected => document.body.innerText.includes(`bench-selected:${selected};`) && window.__bench.now()",
+        arg=selected,
+        timeout=TIMEOUT_MS,
+    )
+    return handle.json_value()
+
+
+def bench_case(
+    page: Page, server_url: str, count: int, layout: str, icons: str, clicks: int, scroll_ms: int
+) -> Dict[str, Any]:
+    page.goto(f"{server_url}/?items={count}&layout={layout}&icons={icons}")
+    navigation_start = page.evaluate("performance.timeOrigin")
+    frame = component_frame(page)
+
+    frame.wait_for_function("window.__bench.firstCardAt !== null", timeout=TIMEOUT_MS)
+    first_card_at = frame.evaluate("window.__bench.firstCardAt")
+    icons_loaded_at = frame.wait_for_function(ICONS_LOADED, timeout=TIMEOUT_MS, polling="raf").json_value()
+    # The component posts its initial value on mount, which reruns the app
+    # once; let that rerun finish before timing clicks
+    page.wait_for_function("window.__bench.values.length > 0", timeout=TIMEOUT_MS)
+    wait_for_selected(page, 0)
+    page.wait_for_timeout(SETTLE_MS)
+
+    # Each click selects a new card, so the n-th rerun reports n selected
+    to_value, to_rerun = [], []
+    for click in range(clicks):
+        values_before = page.evaluate("window.__bench.values.length")
+        clicked_at = frame.evaluate(CLICK_CARD, click)
+        value_at = page.wait_for_function(
+            "count => window.__bench.values.length > count && window.__bench.values[count]",
+            arg=values_before,
+            timeout=TIMEOUT_MS,
+        ).json_value()
+        rerun_at = wait_for_selected(page, click + 1)
+        to_value.append(value_at - clicked_at)
+        to_rerun.append(rerun_at - clicked_at)
+
+    scroll = frame.evaluate(SCROLL_FRAMES, {"horizontal": layout == "row", "durationMs": scroll_ms})
+
+    return {
+        "items": count,
+        "layout": layout,
+        "icons": icons,
+        "time_to_first_card_ms": round(first_card_at - navigation_start, 2),
+        "time_to_icons_loaded_ms": round(icons_loaded_at - navigation_start, 2),
+        "click_to_value": summarize(to_value),
+        "click_to_rerun": summarize(to_rerun),
+        "scroll": {key: round(value, 2) for key, value in scroll.items()},
+    }
+
+
+def package_version() -> str:
+    with open(ROOT_DIRECTORY / "pyproject.toml", "rb") as f:
+        return tomllib.load(f)["project"]["version"]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--layouts", nargs="+", choices=DEFAULT_LAYOUTS, default=list(DEFAULT_LAYOUTS))
+    parser.add_argument("--icons", nargs="+", choices=ICON_MODES, default=["files"], help="icon delivery modes")
+    parser.add_argument("--clicks", type=int, default=5, help="clicks timed per case")
+    parser.add_argument("--scroll-ms", type=int, default=2000, help="duration of the scroll pass")
+    parser.add_argument("--output", type=Path, help="report file (default: benchmarks/results/browser-<version>.json)")
+    args = parser.parse_args(argv)
+
+    results = []
+    # Icons are written to, and served from, the app folder's static/
+    runner = StreamlitRunner(
+        BENCH_APP_FILE, options=["--server.enableStaticServing=true"], cwd=str(BENCH_APP_FILE.parent)
+    )
+    with runner, sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        try:
+            for count in args.sizes:
+                for layout in args.layouts:
+                    for icons in args.icons:
+                        print(f"  {count} items, {layout} layout, {icons} icons ...", file=sys.stderr, flush=True)
+                        # A fresh context per case starts with an empty HTTP cache
+                        context = browser.new_context(viewport={"width": 1280, "height": 900})
+                        page = context.new_page()
+                        page.add_init_script(INIT_SCRIPT)
+                        try:
+                            results.append(bench_case(
+                                page, runner.server_url, count, layout, icons, args.clicks, args.scroll_ms
+                            ))
+                        finally:
+                            context.close()
+            browser_version = browser.version
+        finally:
+            browser.close()
+
+    version = package_version()
+    report = {
+        "version": version,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "browser": f"chromium {browser_version}",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"browser-{version}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+
+    for result in results:
+        print(
+            f"{result['items']:>7} {result['layout']:7} {result['icons']:11} first card {result['time_to_first_card_ms']:>8.1f} ms"
+            f"  icons {result['time_to_icons_loaded_ms']:>8.1f} ms"
+            f"  click->value {result['click_to_value']['median_ms']:>7.1f} ms"
+            f"  click->rerun {result['click_to_rerun']['median_ms']:>7.1f} ms"
+            f"  scroll {result['scroll']['fps']:>5.1f} fps"
+        )
+    print(f"\nReport written to {output}")
+
+
+if __name__ == "__main__":
+    main()
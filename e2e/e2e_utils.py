@@ -98,17 +98,23 @@ class StreamlitRunner:
     """A context manager for running Streamlit scripts."""
 
     def __init__(
-            self, script_path: os.PathLike, server_port: typing.Optional[int] = None
+            self, script_path: os.PathLike, server_port: typing.Optional[int] = None,
+            options: typing.Sequence[str] = (), cwd: typing.Optional[str] = None
     ):
         """Initialize a StreamlitRunner instance.
 
         Args:
             script_path (os.PathLike): Path to the Streamlit script to run.
             server_port (int, optional): Port for the Streamlit server. Defaults to None.
+            options (Sequence[str], optional): Extra `streamlit run` options,
+                e.g. "--server.enableStaticServing=true". Defaults to none.
+            cwd (str, optional): Working directory of the server. Defaults to None.
         """
         self._process = None
         self.server_port = server_port
         self.script_path = script_path
+        self.options = list(options)
+        self.cwd = cwd
 
     def __enter__(self) -> "StreamlitRunner":
         """Start the Streamlit server when entering the context."""
@@ -133,7 +139,9 @@ class StreamlitRunner:
                 "--server.headless=true",
                 "--browser.gatherUsageStats=false",
                 "--global.developmentMode=false",
-            ]
+                *self.options,
+            ],
+            cwd=self.cwd,
         )
         self._process.start()
         if not self.is_server_running():
@@ -481,4 +481,22 @@ st.write("- **Clean Design**: Items without icons have a cleaner, more focused a
 if result0_5:
     st.write("**Selected items:**", result0_5.get("selected_items", []))
 
-st.markdown("---")
\ No newline at end of file
+st.markdown("---")
+# Demo: Grouped sections
+st.subheader("🗂️ Grouped by Category")
+st.write("One component with a collapsible section per category, instead of one component per category.")
+
+result_grouped = select_icons(
+    items=items,
+    multi_select=True,
+    layout="column",
+    columns=4,
+    width=480,
+    height=360,
+    size=80,
+    group_by="category",
+    key="grouped_demo",
+)
+
+if result_grouped:
+    st.write("**Selected items:**", result_grouped.get("selected_items", []))
@@ -1,6 +1,23 @@
+import functools
+import itertools
+import math
 import os
-from typing import Any, Dict, List, Optional
-import streamlit.components.v1 as components
+import re
+import time
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from ._controlled import record_result, reported_value, reported_version, selection_version
+from ._groups import group_indices
+from ._pages import PageLoader, PagedItems, is_page_source, paged_items, requested_page
+from ._search import search_text
+from ._selection import SELECTION_ENCODINGS, decode_selection
+from ._static import fingerprinted_icon, icon_files_stamp, inline_icon
+from .atlas import IconAtlas, build_icon_atlas
+from .catalog import IconCatalog
+from .registry import catalog_file, register_catalog, registered_catalog
+from .table import TableItems, is_table
+from .thumbnails import icon_display_size, icon_srcset
 
 # Create a _RELEASE constant. We'll set this to False while we're developing
 # the component, and True when we're ready to package and distribute it.
@@ -9,8 +26,8 @@ import streamlit.components.v1 as components
 _RELEASE = True
 
 # Declare a Streamlit component. `declare_component` returns a function
-# that is used to create instances of the component. We're naming this
-# function "_component_func", with an underscore prefix, because we don't want
+# that is used to create instances of the component. We're wrapping it in
+# "_component_func", with an underscore prefix, because we don't want
 # to expose it directly to users. Instead, we will create a custom wrapper
 # function, below, that will serve as our component's public API.
 
@@ -19,24 +36,54 @@ _RELEASE = True
 # your component frontend. Everything else we do in this file is simply a
 # best practice.
 
-if not _RELEASE:
-    _component_func = components.declare_component(
-        # We give the component a simple, descriptive name ("my_component"
-        # does not fit this bill, so please choose something better for your
-        # own component :)
-        "streamlit_select_icons",
-        # Pass `url` here to tell Streamlit that the component will be served
-        # by the local dev server that you run via `npm run start`.
-        # (This is useful while your component is in development.)
-        url="http://localhost:3001",
-    )
-else:
+# The declaration (and the import of `streamlit.components.v1`) is deferred
+# to the first render and cached, so importing this package stays cheap for
+# processes that never draw the widget.
+@functools.cache
+def _declared_component():
+    import streamlit.components.v1 as components
+
+    if not _RELEASE:
+        return components.declare_component(
+            # We give the component a simple, descriptive name ("my_component"
+            # does not fit this bill, so please choose something better for your
+            # own component :)
+            "streamlit_select_icons",
+            # Pass `url` here to tell Streamlit that the component will be served
+            # by the local dev server that you run via `npm run start`.
+            # (This is useful while your component is in development.)
+            url="http://localhost:3001",
+        )
     # When we're distributing a production version of the component, we'll
     # replace the `url` param with `path`, and point it to the component's
     # build directory:
     parent_dir = os.path.dirname(os.path.abspath(__file__))
     build_dir = os.path.join(parent_dir, "frontend/build")
-    _component_func = components.declare_component("streamlit_select_icons", path=build_dir)
+    return components.declare_component("streamlit_select_icons", path=build_dir)
+
+
+def _component_func(**kwargs: Any) -> Any:
+    """Render an instance of the component, declaring it on first use."""
+    return _declared_component()(**kwargs)
+
+
+# When the frontend sends selection changes back to Python; see `commit_mode`
+COMMIT_MODES = ("immediate", "debounced", "submit")
+
+# Item fields the frontend draws. Everything else, such as "properties",
+# stays in Python and is returned from the caller's own items.
+_RENDER_FIELDS = ("label", "icon", "alt_text")
+_RENDER_FIELD_SET = frozenset(_RENDER_FIELDS)
+
+# Ids a JavaScript object enumerates before all others, in numeric order
+_JS_INDEX_KEY = re.compile(r"0|[1-9][0-9]{0,9}")
+_JS_MAX_INDEX = 2**32 - 2
+
+# Most icons listed for preloading with `fingerprint_icons`; the rest load
+# lazily as their cards scroll into view
+PRELOAD_LIMIT = 48
+# Gap between cards in the frontend grid, for estimating the first screen
+_GRID_GAP = 12
 
 
 # Create a wrapper function for the component. This is an optional
@@ -45,10 +92,21 @@ else:
 # our component's API: we can pre-process its input args, post-process its
 # output value, and add a docstring for users.
 def select_icons(
-    items: Dict[str, Dict[str, Any]],
+    items: Union[
+        Dict[str, Dict[str, Any]],
+        IconCatalog,
+        "pandas.DataFrame",
+        "pyarrow.Table",
+        PageLoader,
+        Iterator[Dict[str, Dict[str, Any]]],
+        None,
+    ] = None,
     *,
+    catalog: Optional[str] = None,
+    visible: Optional[Sequence[str]] = None,
     selected_items: Optional[List[str]] = None,
     multi_select: bool = True,
+    bulk_actions: bool = False,
     layout: str = "column",
     height: Optional[int] = None,
     width: Optional[int] = None,
@@ -57,20 +115,62 @@ def select_icons(
     rows: Optional[int] = None,
     item_style: Optional[Dict[str, Dict[str, str]]] = None,
     bold_selected: bool = False,
+    selection_encoding: str = "ids",
+    commit_mode: str = "immediate",
+    debounce_ms: int = 300,
+    atlas: Optional[IconAtlas] = None,
+    inline_icons: bool = False,
+    inline_max_bytes: int = 4096,
+    thumbnails: bool = False,
+    fingerprint_icons: bool = False,
+    searchable: bool = False,
+    search_properties: Optional[Sequence[str]] = None,
+    group_by: Optional[str] = None,
+    profile: bool = False,
     key: Optional[str] = None,
 ):
     """Icon selection component for labelled icons.
 
     Parameters
     ----------
-    items: dict
+    items: dict, IconCatalog, DataFrame or Arrow table
         Mapping of item id -> {"label": str, "icon": Optional[str], "alt_text": Optional[str], "properties": dict}
         - icon: Path to icon image. Can be None for no icon.
         - alt_text: Text to display instead of icon when icon is None. Displayed in larger font than label.
+        - properties: Arbitrary metadata. Kept in Python: it is not sent to
+          the browser, and the result returns it from these items.
+        Pass an `IconCatalog` to validate and serialize a large catalog once
+        and reuse it across reruns and sessions.
+        Pass a pandas DataFrame or pyarrow Table with an "id" column and
+        optional "label", "icon" and "alt_text" columns to send the items
+        column-wise as Arrow, without building a dict per row; the other
+        columns are the items' properties.
+        Pass a page loader, `loader(page_index) -> dict or None`, or an
+        iterator of item dicts to load a large library in chunks: the next
+        page is requested as the user scrolls near the end of the grid, and
+        pages already delivered are cached in the browser. An empty or None
+        page ends the source. Requires `key`; the source given on the first
+        run is kept for the session.
+    catalog: Optional[str]
+        Id returned by `register_catalog`, instead of `items`. The component
+        receives only the id and the URL of the catalog file, which the
+        browser fetches once and caches for the session, so many selectors
+        over the same catalog ship it only once.
+    visible: Optional[Sequence[str]]
+        Ids of the items to show, in display order (default: all items).
+        Selection and the returned "items" still cover the whole catalog.
     selected_items: Optional[List[str]]
-        Initially selected item ids
+        Selected item ids. With a `key` this is a controlled input: passing
+        a different selection (for example from a "reset" button) updates
+        the component in place. Passing back the selection the user made
+        has no effect, so clicks are never lost.
     multi_select: bool
-        Whether to allow multiple selections (default: True)
+        Whether to allow multiple selections (default: True). Shift-click
+        then selects every item from the previously clicked one.
+    bulk_actions: bool
+        Show "Select all", "Select none" and "Invert" buttons above the grid
+        (default: False). They act on the items currently shown, after
+        search, and each sends one selection change. Requires `multi_select`.
     layout: str
         Layout orientation: "row" or "column" (default: "column")
     height: Optional[int]
@@ -88,6 +188,58 @@ def select_icons(
         "selected_border_color": str, "selected_background_color": str}
     bold_selected: bool
         Whether to make item labels bold when selected (default: False)
+    selection_encoding: str
+        How the frontend encodes the selection it sends back: "ids" (default),
+        "ranges" (runs over the item order) or "bitset" (base64 bitmap over the
+        item order). The compact encodings keep large selections small on the
+        wire; they are decoded back into ids, returned in item order.
+    commit_mode: str
+        When selection changes are sent to Python, each one rerunning the
+        script: "immediate" (default) on every click, "debounced" once clicks
+        pause for `debounce_ms`, or "submit" when the user presses an "Apply"
+        button below the grid. Until then clicks only update the component.
+    debounce_ms: int
+        Quiet period in milliseconds for the "debounced" commit mode
+        (default: 300)
+    atlas: Optional[IconAtlas]
+        Sprite sheet from `build_icon_atlas`. Icons found in it are drawn from
+        the single sprite image instead of one request per icon.
+    inline_icons: bool
+        Embed local icon files as `data:` URIs instead of serving them from
+        /app/static, saving one request per small icon (default: False)
+    inline_max_bytes: int
+        Largest icon file, in bytes, that is inlined when `inline_icons` is
+        set (default: 4096). Larger files are still served by path.
+    thumbnails: bool
+        Serve local icons as thumbnails pre-scaled to the card's icon size at
+        1x/2x/3x device pixel ratios through `srcset` (default: False).
+        Thumbnails are cached under static/_select_icons/. Requires Pillow.
+    fingerprint_icons: bool
+        Add a content hash to local icon URLs (``static/a.png?v=<hash>``), so
+        they can be cached indefinitely and still change on deploy, and have
+        the browser preload the icons of the first screen (default: False).
+        Hashes are computed once per file per process and redone only when
+        the file's mtime changes.
+    searchable: bool
+        Show a search box that filters the cards in the browser, without a
+        rerun (default: False). Matches the start of words in labels.
+    search_properties: Optional[Sequence[str]]
+        Names of `properties` whose values the search box also matches. For
+        an `IconCatalog`, pass them to `IconCatalog.from_items` instead; for
+        a table, they name columns.
+    group_by: Optional[str]
+        Name of a `properties` field to group items by. Each group is drawn
+        as a collapsible section with its selected count; cards of collapsed
+        sections are not rendered. Items without the field are grouped under
+        "Other". Requires the "column" layout and a dict, `IconCatalog` or
+        table (grouped by a column of that name).
+    profile: bool
+        Add a "metrics" dict to the result (default: False). It holds
+        "python_args_ms", the time spent building the component args, and,
+        once the frontend has posted a value, "mount_ms" and "render_ms"
+        (render through DOM commit), "cards_rendered", "args_bytes" (size of
+        the args received) and "click_to_post_ms" (from the latest click to
+        posting its value). Frontend metrics are as of the latest posted value.
     key: Optional[str]
         Streamlit component key
 
@@ -96,20 +248,92 @@ def select_icons(
     dict
         {
           "items": { item_id: {"label": str, "icon": Optional[str], "alt_text": Optional[str], "properties": dict}, ... },
-          "selected_items": [item_id, ...]
+          "selected_items": [item_id, ...],
+          "metrics": {...},  # only with profile=True
         }
+
+        Only the selection state is sent back by the frontend; "items" is the
+        same mapping that was passed in, re-attached on the Python side.
     """
+    started = time.perf_counter()
+    # Kept as given: controlled selection recognizes the list it returned
+    passed_selection = selected_items
     selected_items = selected_items or []
-    
+    if selection_encoding not in SELECTION_ENCODINGS:
+        raise ValueError(
+            f"selection_encoding must be one of {SELECTION_ENCODINGS}, got {selection_encoding!r}"
+        )
+    if commit_mode not in COMMIT_MODES:
+        raise ValueError(f"commit_mode must be one of {COMMIT_MODES}, got {commit_mode!r}")
+    if bulk_actions and not multi_select:
+        raise ValueError("bulk_actions requires multi_select=True")
+    if catalog is not None:
+        if items is not None:
+            raise ValueError("Pass either items or catalog to select_icons, not both")
+        items = registered_catalog(catalog)
+    if isinstance(items, IconCatalog) and search_properties:
+        raise ValueError("Pass search_properties to IconCatalog.from_items for a catalog")
+    if group_by is not None and layout != "column":
+        raise ValueError("group_by requires layout='column'")
+    render = _RenderOptions(
+        inline_max_bytes=inline_max_bytes if inline_icons else None,
+        thumbnail_size=icon_display_size(size) if thumbnails else None,
+        fingerprint=True if fingerprint_icons else None,
+        search_properties=tuple(search_properties) if searchable and search_properties else None,
+    )
+
+    if is_page_source(items):
+        if key is None:
+            raise ValueError("select_icons needs a key when items is a page loader")
+        if group_by is not None or visible is not None:
+            raise ValueError("group_by and visible are not supported when items is a page loader")
+        pages = paged_items(key, items)
+        items = pages.items
+        item_args = _page_args(pages, requested_page(key), render)
+    else:
+        if is_table(items):
+            items = TableItems.from_table(items)
+        items = items or {}
+        if catalog is not None:
+            item_args = _catalog_ref_args(items, catalog, render)
+        else:
+            item_args = _item_args(items, render)
+        if visible is not None:
+            item_args["visible"] = _visible_indices(items, visible)
+        if group_by is not None:
+            item_args["groups"] = _group_args(items, group_by)
+        if render.fingerprint:
+            if visible is not None:
+                shown_ids: Iterable[str] = visible
+            elif group_by is not None:
+                item_ids = _item_ids(items)
+                shown_ids = (item_ids[i] for _, indices in item_args["groups"] for i in indices)
+            else:
+                shown_ids = iter(items)
+            first_screen = _first_screen_count(layout, columns, rows, height, width, size)
+            sprites = atlas.offsets if atlas is not None else {}
+            item_args["preload"] = _preload_icons(items, shown_ids, first_screen, render, sprites)
+
+    # The default value is serialized alongside the args, so keep it to the
+    # selection state only. The items map is re-attached in `_build_result`.
     default_value = {
-        "items": items or {},
         "selected_items": selected_items,
     }
+    # With a key, `selected_items` is controlled: a change made here, rather
+    # than an echo of the user's clicks, gets a new version that the frontend
+    # adopts in place
+    version = 0
+    if key is not None:
+        value = reported_value(key)
+        reported = decode_selection(value, _item_ids(items)) if isinstance(value, Mapping) else None
+        version = selection_version(key, passed_selection, reported)
 
-    return _component_func(
-        items=items or {},
+    args_ms = (time.perf_counter() - started) * 1000
+    component_value = _component_func(
+        **item_args,
         selected_items=selected_items,
         multi_select=multi_select,
+        bulk_actions=bulk_actions,
         layout=layout,
         height=height,
         width=width,
@@ -118,6 +342,255 @@ def select_icons(
         rows=rows,
         item_style=item_style or {},
         bold_selected=bold_selected,
+        selection_encoding=selection_encoding,
+        selection_version=version,
+        commit_mode=commit_mode,
+        debounce_ms=debounce_ms,
+        searchable=searchable,
+        atlas=_atlas_args(atlas, render) if atlas is not None else None,
+        profile=profile,
         key=key,
         default=default_value,
     )
+
+    if reported_version(component_value) < version:
+        # The frontend has not adopted the new selection yet
+        component_value = default_value
+    result = _build_result(items, component_value)
+    if key is not None:
+        record_result(key, result["selected_items"])
+    if profile:
+        result["metrics"] = _metrics(component_value, args_ms)
+    return result
+
+
+class _RenderOptions(NamedTuple):
+    """Per-item transforms applied before items are sent to the frontend."""
+
+    inline_max_bytes: Optional[int] = None
+    thumbnail_size: Optional[int] = None
+    fingerprint: Optional[bool] = None
+    search_properties: Optional[Sequence[str]] = None
+
+    def changes_items(self) -> bool:
+        return any(option is not None for option in self)
+
+    def changes_icons(self) -> bool:
+        return self.inline_max_bytes is not None or self.thumbnail_size is not None or self.fingerprint is not None
+
+
+def _item_args(items: Union[Dict[str, Dict[str, Any]], IconCatalog, TableItems], render: _RenderOptions) -> Dict[str, Any]:
+    """Return the component args describing the items.
+
+    Plain dicts are sent as the `items` JSON arg. Catalogs are sent as their
+    memoized serialized payload (a bytes arg, which Streamlit ships without
+    re-encoding) plus its hash, which the frontend uses to skip re-parsing.
+    Tables are sent the same way, as an Arrow IPC stream.
+    """
+    if isinstance(items, IconCatalog):
+        payload, content_hash = _catalog_payload(items, render)
+        return {"items": None, "catalog": payload, "catalog_hash": content_hash}
+    if isinstance(items, TableItems):
+        payload, content_hash = items.payload(
+            (lambda icon: _icon_updates(icon, render)) if render.changes_icons() else None,
+            render.search_properties,
+        )
+        return {"items": None, "table": payload, "table_hash": content_hash}
+    return {"items": _render_items(items, render), **_item_order_arg(items)}
+
+
+def _catalog_ref_args(items: IconCatalog, catalog_id: str, render: _RenderOptions) -> Dict[str, Any]:
+    """Return the component args referencing a registered catalog by id.
+
+    The payload is written once to a static file named by its hash; the
+    frontend fetches it and caches it in session storage by that hash.
+    """
+    payload, content_hash = _catalog_payload(items, render)
+    return {
+        "items": None,
+        "catalog_ref": {"id": catalog_id, "hash": content_hash, "url": catalog_file(catalog_id, payload, content_hash)},
+    }
+
+
+def _catalog_payload(items: IconCatalog, render: _RenderOptions) -> Tuple[bytes, str]:
+    """Return a catalog's serialized payload and hash, with `render` transforms applied.
+
+    With `fingerprint_icons`, whose URLs must follow every edit of an icon
+    file, the memoized payload is rebuilt when any of the files changes.
+    Other payloads are memoized for the catalog's lifetime, so reruns
+    without fingerprints stat no icon files.
+    """
+    if not render.changes_items():
+        return items.payload, items.content_hash
+    return items.rendered_payload(
+        (render.inline_max_bytes, render.thumbnail_size, render.fingerprint),
+        lambda icon: _icon_updates(icon, render),
+        icon_files_stamp(items.icons) if render.fingerprint else None,
+    )
+
+
+def _visible_indices(items: Union[Dict[str, Dict[str, Any]], IconCatalog, TableItems], visible: Sequence[str]) -> List[int]:
+    """Return the catalog positions of the `visible` ids, in the given order.
+
+    Raises ValueError for ids that are not in the items.
+    """
+    if isinstance(items, (IconCatalog, TableItems)):
+        position = items.position
+    else:
+        position = {item_id: i for i, item_id in enumerate(items)}.__getitem__
+    try:
+        return [position(item_id) for item_id in visible]
+    except KeyError as ex:
+        raise ValueError(f"visible contains unknown item id {ex.args[0]!r}") from None
+
+
+def _page_args(pages: PagedItems, page_index: int, render: _RenderOptions) -> Dict[str, Any]:
+    """Return the component args for a paginated source.
+
+    Only the requested page is sent; the frontend caches the pages it has
+    received and asks for the next one through the component value.
+    """
+    page_index = pages.load_through(page_index)
+    page = None
+    if page_index is not None:
+        page_items = pages.pages[page_index]
+        page = {"index": page_index, "items": _render_items(page_items, render), **_item_order_arg(page_items)}
+    return {"items": None, "page": page, "has_more": not pages.exhausted}
+
+
+def _group_args(items: Union[Dict[str, Dict[str, Any]], IconCatalog, TableItems], group_by: str) -> List[Tuple[str, List[int]]]:
+    """Return the `groups` arg: ``[(group name, [item index, ...]), ...]``.
+
+    Groups refer to items by their position, so the frontend can keep
+    per-group counts from the index-based selection without looking up ids.
+    """
+    if isinstance(items, (IconCatalog, TableItems)):
+        return items.groups(group_by)
+    return group_indices((item.get("properties") for item in items.values()), group_by)
+
+
+def _render_items(items: Dict[str, Dict[str, Any]], render: _RenderOptions) -> Dict[str, Dict[str, Any]]:
+    """Return the items as sent to the frontend, with `render` transforms applied.
+
+    Only the render fields are kept; "properties" never leave Python. If no
+    item carries other fields or needs a change, `items` is passed through.
+    """
+    rendered = {}
+    changed = False
+    changes_items = render.changes_items()
+    for item_id, item in items.items():
+        updates = _icon_updates(item.get("icon"), render) if changes_items else {}
+        text = search_text(item, render.search_properties)
+        if text:
+            updates["search_text"] = text
+        if updates or not item.keys() <= _RENDER_FIELD_SET:
+            item = {**{field: item[field] for field in _RENDER_FIELDS if field in item}, **updates}
+            changed = True
+        rendered[item_id] = item
+    return rendered if changed else items
+
+
+def _item_order_arg(items: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Return ``{"item_order": [id, ...]}`` if the frontend would reorder the items.
+
+    A JavaScript object lists integer-like keys ("2", "10") before the
+    others, in numeric order, whatever order they were inserted in. Indices
+    in the selection encodings, groups and `visible` follow the dict order,
+    so for such ids the order is sent explicitly.
+    """
+    if any(_JS_INDEX_KEY.fullmatch(str(item_id)) and int(item_id) <= _JS_MAX_INDEX for item_id in items):
+        return {"item_order": list(items)}
+    return {}
+
+
+def _icon_updates(icon: Optional[str], render: _RenderOptions) -> Dict[str, Any]:
+    """Return the fields to override for one item's icon.
+
+    Small local icons are replaced by data URIs when `inline_max_bytes` is
+    set; other local icons get an `icon_srcset` of thumbnails when
+    `thumbnail_size` is set, and a fingerprinted path when `fingerprint` is.
+    """
+    if render.inline_max_bytes is not None:
+        data_uri = inline_icon(icon, render.inline_max_bytes)
+        if data_uri:
+            return {"icon": data_uri}
+    updates: Dict[str, Any] = {}
+    if render.thumbnail_size is not None:
+        srcset = icon_srcset(icon, render.thumbnail_size)
+        if srcset:
+            updates["icon_srcset"] = srcset
+    if render.fingerprint:
+        url = fingerprinted_icon(icon)
+        if url:
+            updates["icon"] = url
+    return updates
+
+
+def _atlas_args(atlas: IconAtlas, render: _RenderOptions) -> Dict[str, Any]:
+    """Return the atlas arg, keyed by the icon paths the frontend receives."""
+    args = atlas.to_args()
+    if render.fingerprint:
+        args["offsets"] = {fingerprinted_icon(icon) or icon: offset for icon, offset in args["offsets"].items()}
+    return args
+
+
+def _first_screen_count(
+    layout: str, columns: Optional[int], rows: Optional[int], height: Optional[int], width: Optional[int], size: Optional[int]
+) -> int:
+    """Estimate how many cards the grid shows before any scrolling.
+
+    Mirrors the frontend's card sizes; without a fixed height (or width in
+    the "row" layout) the grid is not scrolled and `PRELOAD_LIMIT` applies.
+    """
+    card_size = size or 96
+    if layout == "row":
+        lanes, extent, track = rows or 1, width, card_size + 24
+    else:
+        lanes, extent, track = columns or 1, height, max(110, card_size + 14)
+    tracks = math.ceil(extent / (track + _GRID_GAP)) if extent else PRELOAD_LIMIT
+    return min(PRELOAD_LIMIT, lanes * tracks)
+
+
+def _preload_icons(
+    items: Mapping, item_ids: Iterable[str], count: int, render: _RenderOptions, sprites: Mapping
+) -> List[Dict[str, Any]]:
+    """Return the distinct icons of the first `count` shown items, for the
+    frontend to preload. Inlined icons and icons drawn from the atlas
+    (`sprites`) need no request of their own and are skipped.
+    """
+    preload, seen = [], set()
+    for item_id in itertools.islice(item_ids, count):
+        icon = items[item_id].get("icon")
+        if not icon or icon in sprites:
+            continue
+        updates = _icon_updates(icon, render)
+        src = updates.get("icon", icon)
+        if src in seen or src.startswith("data:"):
+            continue
+        seen.add(src)
+        entry: Dict[str, Any] = {"src": src}
+        if updates.get("icon_srcset"):
+            entry["srcset"] = updates["icon_srcset"]
+        preload.append(entry)
+    return preload
+
+
+def _metrics(component_value: Optional[Dict[str, Any]], args_ms: float) -> Dict[str, Any]:
+    """Merge the frontend's posted metrics with the Python-side timing."""
+    frontend = component_value.get("metrics") if isinstance(component_value, Mapping) else None
+    return {**(frontend or {}), "python_args_ms": round(args_ms, 3)}
+
+
+def _build_result(
+    items: Union[Dict[str, Dict[str, Any]], IconCatalog, TableItems], component_value: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Rebuild the public return value from the slim value posted by the frontend."""
+    return {
+        "items": items,
+        "selected_items": decode_selection(component_value, _item_ids(items)),
+    }
+
+
+def _item_ids(items: Union[Dict[str, Dict[str, Any]], IconCatalog, TableItems]) -> Sequence[str]:
+    """Return the item ids in catalog order, which selection encodings index into."""
+    return items.ids if isinstance(items, (IconCatalog, TableItems)) else list(items)
@@ -0,0 +1,82 @@
+"""Controlled `selected_items`: versions that mark changes made in Python.
+
+The frontend keeps the selection in local state. When the script passes a
+different `selected_items` (say, from a "reset" button), the version for the
+component key is bumped and the frontend adopts the new selection once,
+without remounting. Reruns that merely pass back what the user clicked are
+echoes and keep the version, so in-flight clicks are never overwritten, and
+an unchanging `selected_items` acts as the initial selection only.
+"""
+
+from collections.abc import Mapping
+from typing import Any, FrozenSet, List, NamedTuple, Optional, Sequence
+
+
+def reported_value(key: str) -> Optional[Any]:
+    """Return the value the frontend last posted for a component key, if any."""
+    import streamlit as st
+
+    return st.session_state.get(key) if key in st.session_state else None
+
+
+def _state_key(key: str) -> str:
+    return f"_select_icons_selection:{key}"
+
+
+class _SelectionState(NamedTuple):
+    """What `select_icons` last saw and returned for one component key."""
+
+    passed: FrozenSet[str]
+    returned: FrozenSet[str]
+    returned_list: Optional[List[str]]
+    fed_back: bool
+    version: int
+
+
+def selection_version(
+    key: str, selected_items: Optional[Sequence[str]], reported: Optional[Sequence[str]]
+) -> int:
+    """Return the version of the controlled selection for a component key.
+
+    Scripts that feed the result back as `selected_items` (passing the list
+    `select_icons` returned, or later following a change in it) lag the
+    frontend by a rerun. For them, a selection that differs from the
+    previous result and from `reported`, the one the frontend last posted,
+    is a change and bumps the version. Any other input, such as a constant
+    initial selection, only bumps it on runs where it changed since the
+    previous one, so reruns never undo the user's clicks.
+    """
+    import streamlit as st
+
+    selected = frozenset(selected_items or ())
+    state: Optional[_SelectionState] = st.session_state.get(_state_key(key))
+    if state is None:
+        st.session_state[_state_key(key)] = _SelectionState(selected, selected, None, False, 0)
+        return 0
+
+    fed_back = state.fed_back or (
+        selected_items is not None and selected_items is state.returned_list
+    ) or (selected == state.returned != state.passed)
+    changed = fed_back or selected != state.passed
+    version = state.version
+    if changed and selected != state.returned and (reported is None or selected != frozenset(reported)):
+        version += 1
+    st.session_state[_state_key(key)] = state._replace(passed=selected, fed_back=fed_back, version=version)
+    return version
+
+
+def record_result(key: str, selected_items: List[str]) -> None:
+    """Remember the selection list `select_icons` returned for a component key."""
+    import streamlit as st
+
+    state = st.session_state[_state_key(key)]
+    st.session_state[_state_key(key)] = state._replace(
+        returned=frozenset(selected_items), returned_list=selected_items
+    )
+
+
+def reported_version(component_value: Optional[Any]) -> int:
+    """Return the selection version a posted component value is based on."""
+    if isinstance(component_value, Mapping) and isinstance(component_value.get("selection_version"), int):
+        return component_value["selection_version"]
+    return 0
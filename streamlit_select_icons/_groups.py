@@ -0,0 +1,30 @@
+"""Grouping of items into the collapsible sections drawn by the frontend."""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Section for items that lack the `group_by` property
+UNGROUPED = "Other"
+
+
+def group_indices(
+    properties: Iterable[Optional[Mapping]], group_by: str
+) -> List[Tuple[str, List[int]]]:
+    """Return ``[(group name, [item index, ...]), ...]`` for a `group_by` property.
+
+    `properties` yields each item's properties dict in item order. Groups
+    are listed in order of first appearance and indices are ascending.
+    """
+    return group_values((item_properties or {}).get(group_by) for item_properties in properties)
+
+
+def group_values(values: Iterable[Any]) -> List[Tuple[str, List[int]]]:
+    """Return ``[(group name, [item index, ...]), ...]`` for each item's group value.
+
+    None values fall in the `UNGROUPED` section.
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, value in enumerate(values):
+        name = UNGROUPED if value is None else str(value)
+        groups.setdefault(name, []).append(index)
+    return list(groups.items())
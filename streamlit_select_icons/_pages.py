@@ -0,0 +1,66 @@
+"""Paginated item sources that are pulled one chunk at a time."""
+
+from collections.abc import Iterator, Mapping
+from typing import Any, Callable, Dict, List, Optional
+
+PageLoader = Callable[[int], Optional[Dict[str, Dict[str, Any]]]]
+
+
+def is_page_source(items: Any) -> bool:
+    """Return True if `items` is a page loader or an iterator of item chunks."""
+    return not isinstance(items, Mapping) and (callable(items) or isinstance(items, Iterator))
+
+
+class PagedItems:
+    """Pages pulled from a loader so far, kept in session state across reruns.
+
+    `source` is either a callable ``loader(page_index) -> dict or None`` or an
+    iterator yielding item dicts. An empty or None page ends the source.
+    """
+
+    def __init__(self, source: Any):
+        if callable(source):
+            self._load: PageLoader = source
+        else:
+            self._load = lambda page_index: next(source, None)
+        self.pages: List[Dict[str, Dict[str, Any]]] = []
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.exhausted = False
+
+    def load_through(self, page_index: int) -> Optional[int]:
+        """Load pages up to `page_index` and return the last available index at or below it."""
+        while len(self.pages) <= page_index and not self.exhausted:
+            page = self._load(len(self.pages))
+            if not page:
+                self.exhausted = True
+                break
+            page = dict(page)
+            self.pages.append(page)
+            self.items.update(page)
+        if not self.pages:
+            return None
+        return min(page_index, len(self.pages) - 1)
+
+
+def paged_items(key: str, source: Any) -> PagedItems:
+    """Return the session's `PagedItems` for a component key, creating it on first use.
+
+    The source passed on the first run is kept for the life of the session,
+    so a loader re-created on every rerun doesn't restart pagination.
+    """
+    import streamlit as st
+
+    state_key = f"_select_icons_pages:{key}"
+    if state_key not in st.session_state:
+        st.session_state[state_key] = PagedItems(source)
+    return st.session_state[state_key]
+
+
+def requested_page(key: str) -> int:
+    """Return the page the frontend last asked for through the component value."""
+    import streamlit as st
+
+    value = st.session_state.get(key) if key in st.session_state else None
+    if isinstance(value, Mapping) and isinstance(value.get("page_request"), int):
+        return max(0, value["page_request"])
+    return 0
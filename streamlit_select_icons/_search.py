@@ -0,0 +1,37 @@
+"""Search text and prefix index for the component's built-in search box."""
+
+import re
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Sequence
+
+# Must match `tokenize` in the frontend's search.ts
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return [token for token in _SEPARATORS.split(text.lower()) if token]
+
+
+def search_text(item: Mapping, search_properties: Optional[Sequence[str]]) -> Optional[str]:
+    """Return the searchable text from an item's selected properties, if any."""
+    if not search_properties:
+        return None
+    properties = item.get("properties") or {}
+    values = [str(properties[name]) for name in search_properties if properties.get(name) is not None]
+    return " ".join(values) or None
+
+
+def build_search_index(labels: Sequence[str], search_texts: Sequence[Optional[str]]) -> Dict[str, Any]:
+    """Build the prefix index the frontend searches.
+
+    Returns ``{"tokens": [...], "postings": [[item index, ...], ...]}`` with
+    tokens sorted by UTF-16 code units, the order JavaScript compares
+    strings in, so the frontend can binary search it.
+    """
+    postings: Dict[str, List[int]] = {}
+    for index, (label, text) in enumerate(zip(labels, search_texts)):
+        for token in dict.fromkeys(tokenize(f"{label} {text}" if text else label)):
+            postings.setdefault(token, []).append(index)
+    tokens = sorted(postings, key=lambda token: token.encode("utf-16-be"))
+    return {"tokens": tokens, "postings": [postings[token] for token in tokens]}
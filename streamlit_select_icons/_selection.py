@@ -0,0 +1,51 @@
+"""Decoding of the selection state posted back by the frontend."""
+
+import base64
+from typing import Any, Dict, List, Optional, Sequence
+
+# Wire encodings the frontend can use for the selection it posts back.
+# "ids" is the plain list of item ids; "ranges" and "bitset" index into the
+# item order and are much smaller when most of a large catalog is selected.
+SELECTION_ENCODINGS = ("ids", "ranges", "bitset")
+
+
+def decode_ranges(ranges: Sequence[Sequence[int]], item_ids: Sequence[str]) -> List[str]:
+    """Expand half-open ``[start, end)`` runs over the item order into ids."""
+    selected: List[str] = []
+    for start, end in ranges:
+        selected.extend(item_ids[max(0, start):min(end, len(item_ids))])
+    return selected
+
+
+def decode_bitset(bitset: str, item_ids: Sequence[str]) -> List[str]:
+    """Expand a base64 bitmap over the item order into ids.
+
+    Bit ``i`` lives in byte ``i >> 3`` at position ``i & 7``, least
+    significant bit first.
+    """
+    selected: List[str] = []
+    count = len(item_ids)
+    for byte_index, byte in enumerate(base64.b64decode(bitset)):
+        if not byte:
+            continue
+        base = byte_index * 8
+        for bit in range(8):
+            if byte & (1 << bit) and base + bit < count:
+                selected.append(item_ids[base + bit])
+    return selected
+
+
+def decode_selection(component_value: Optional[Dict[str, Any]], item_ids: Sequence[str]) -> List[str]:
+    """Return the selected item ids from a component value in any encoding.
+
+    Selected ids the frontend could not find among the items (hidden ones,
+    or ids on pages it has not received) are posted as "unresolved_items"
+    with the compact encodings, and follow the indexed ones.
+    """
+    component_value = component_value or {}
+    unresolved = list(component_value.get("unresolved_items") or [])
+    if component_value.get("selected_ranges") is not None:
+        return decode_ranges(component_value["selected_ranges"], item_ids) + unresolved
+    if component_value.get("selected_bitset") is not None:
+        return decode_bitset(component_value["selected_bitset"], item_ids) + unresolved
+    return list(component_value.get("selected_items") or [])
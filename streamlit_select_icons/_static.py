@@ -0,0 +1,153 @@
+"""Helpers for icon files served from the app's ``static/`` folder."""
+
+import base64
+import hashlib
+import mimetypes
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+# Generated files (atlases, thumbnails, ...) are written here by default so
+# Streamlit's static file serving picks them up as /app/static/_select_icons/...
+# The path is relative to the app's folder; see `served_path`.
+DEFAULT_CACHE_DIR = os.path.join("static", "_select_icons")
+
+# Hex digits of the content hash appended to fingerprinted icon URLs
+FINGERPRINT_LENGTH = 12
+
+_REMOTE_ICON = re.compile(r"^((https?:)?//|data:)", re.IGNORECASE)
+
+
+def local_icon_path(icon: Optional[str]) -> Optional[Path]:
+    """Return the file behind a local icon path, or None for URLs and missing files.
+
+    Paths are resolved the same way the frontend does: leading slashes are
+    dropped and the rest is taken relative to the app's working directory.
+    """
+    if not icon:
+        return None
+    trimmed = icon.strip()
+    if _REMOTE_ICON.match(trimmed):
+        return None
+    path = Path(trimmed.lstrip("/"))
+    return path if path.is_file() else None
+
+
+def served_path(path: Union[str, Path]) -> Path:
+    """Return where a generated ``static/...`` file must be written to be served.
+
+    Streamlit serves the ``static/`` folder next to the main script, not the
+    one in the working directory, so relative paths under ``static/`` are
+    resolved against the running script's folder. Outside a script run (and
+    for other paths) `path` is returned unchanged. The relative path remains
+    the file's URL.
+    """
+    path = Path(path)
+    if path.is_absolute() or not path.parts or path.parts[0] != "static":
+        return path
+    main_script = _main_script_path()
+    if main_script is None:
+        return path
+    return Path(main_script).parent / path
+
+
+def _main_script_path() -> Optional[str]:
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:  # pragma: no cover - older Streamlit
+        return None
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return getattr(ctx, "main_script_path", None) if ctx is not None else None
+
+
+def icon_files_stamp(icons: Iterable[Optional[str]]) -> Tuple[Tuple[str, int, int], ...]:
+    """Return the (path, mtime, size) of each distinct local icon file, sorted.
+
+    The stamp changes when any of the files is edited, added or removed, so
+    results derived from their contents can be memoized on it. It costs one
+    stat per file and reads nothing.
+    """
+    stamp = set()
+    for icon in set(icons):
+        path = local_icon_path(icon)
+        if path is not None:
+            stat = path.stat()
+            stamp.add((path.as_posix(), stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(stamp))
+
+
+# Content digests by file path: (mtime_ns, size, digest). Unbounded, one
+# entry per file, so catalogs of any size are hashed once per process.
+_DIGESTS: Dict[str, Tuple[int, int, str]] = {}
+
+
+def file_digest(path: Path) -> str:
+    """Return the sha256 hex digest of a file's contents.
+
+    Digests are memoized per process by path and rehashed only when the
+    file's mtime or size changes, so unchanged files are only read once.
+    """
+    stat = path.stat()
+    key = str(path)
+    memoized = _DIGESTS.get(key)
+    if memoized is not None and memoized[:2] == (stat.st_mtime_ns, stat.st_size):
+        return memoized[2]
+    digest = _hash_file(key)
+    _DIGESTS[key] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprinted_icon(icon: Optional[str]) -> Optional[str]:
+    """Return a local icon's path with a ``?v=<content hash>`` query.
+
+    The URL changes whenever the file does, so browsers and proxies can
+    cache it indefinitely. Digests come from `file_digest`, so each file is
+    hashed once per process and again only when its mtime or size changes.
+    Returns None for remote icons and missing files.
+    """
+    path = local_icon_path(icon)
+    if path is None:
+        return None
+    return f"{path.as_posix()}?v={file_digest(path)[:FINGERPRINT_LENGTH]}"
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def inline_icon(icon: Optional[str], max_bytes: int) -> Optional[str]:
+    """Return a ``data:`` URI for a local icon no larger than ``max_bytes``.
+
+    Returns None for remote icons, missing files and files over the limit.
+    Encoded payloads are shared process-wide in an LRU cache keyed by path
+    and mtime, so busy apps don't re-read and re-encode files on every rerun.
+    """
+    path = local_icon_path(icon)
+    if path is None:
+        return None
+    stat = path.stat()
+    if stat.st_size > max_bytes:
+        return None
+    return _encode_data_uri(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _encode_data_uri(path: str, mtime_ns: int, size: int) -> str:
+    mime_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    with open(path, "rb") as f:
+        data = f.read()
+    return f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
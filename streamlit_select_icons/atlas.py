@@ -0,0 +1,195 @@
+"""Pack local icon files into a single sprite image.
+
+A page with hundreds of distinct icons otherwise fires one request per icon
+at Streamlit's static file handler. The atlas replaces them with a single
+image plus an offset table that the frontend renders by background-position.
+
+Requires Pillow (``pip install streamlit-select-icons[images]``).
+"""
+
+import hashlib
+import io
+import math
+from functools import lru_cache
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from ._static import (
+    DEFAULT_CACHE_DIR,
+    file_digest,
+    local_icon_path,
+    served_path,
+    write_atomic,
+)
+
+
+@dataclass(frozen=True)
+class IconAtlas:
+    """A sprite sheet of icons laid out on a grid of square cells.
+
+    Attributes
+    ----------
+    src: str
+        Path of the sprite image, e.g. "static/_select_icons/atlas-<hash>.png"
+    cell_size: int
+        Edge length of each cell in pixels
+    width: int
+        Width of the sprite image in pixels
+    height: int
+        Height of the sprite image in pixels
+    offsets: Dict[str, Tuple[int, int]]
+        Icon path (as used in ``items``) -> (x, y) of its cell in the sprite
+    """
+
+    src: str
+    cell_size: int
+    width: int
+    height: int
+    offsets: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+    def to_args(self) -> Dict[str, Any]:
+        """Return the JSON-serializable form shipped to the frontend."""
+        return {
+            "src": self.src,
+            "cell_size": self.cell_size,
+            "width": self.width,
+            "height": self.height,
+            "offsets": {icon: list(offset) for icon, offset in self.offsets.items()},
+        }
+
+
+def build_icon_atlas(
+    icons: Iterable[Optional[str]],
+    *,
+    cell_size: int = 64,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+) -> IconAtlas:
+    """Pack local icon files into one sprite image, cached on disk.
+
+    Parameters
+    ----------
+    icons: Iterable[Optional[str]]
+        Icon paths as used in ``items``, e.g.
+        ``(item["icon"] for item in items.values())``. URLs, data URIs,
+        None, missing files and images Pillow cannot read (e.g. SVG) are
+        skipped and keep rendering as before.
+    cell_size: int
+        Edge length in pixels each icon is scaled to fit (default: 64, the
+        largest size cards draw icons at)
+    cache_dir: str
+        Directory the sprite is written to. Must be inside the app's
+        ``static/`` folder so Streamlit serves it (default: "static/_select_icons")
+
+    Returns
+    -------
+    IconAtlas
+        Pass it to ``select_icons(..., atlas=atlas)``.
+
+    The sprite file name is derived from the icons' contents and the cell
+    size, so it is only rebuilt when an icon changes. Results are memoized
+    per process by each icon's path, mtime and size, so calling it on every
+    rerun costs one stat per distinct icon.
+    """
+    stamp: Dict[Optional[str], Optional[Tuple[str, int, int]]] = {}
+    for icon in icons:
+        if icon in stamp:
+            continue
+        path = local_icon_path(icon)
+        if path is None:
+            stamp[icon] = None
+        else:
+            stat = path.stat()
+            stamp[icon] = (str(path), stat.st_mtime_ns, stat.st_size)
+    files = tuple(sorted((icon, file) for icon, file in stamp.items() if file))
+    atlas = _build_icon_atlas(files, cell_size, cache_dir)
+    if not served_path(atlas.src).is_file():
+        # The sprite was deleted since it was memoized
+        atlas = _build_icon_atlas.__wrapped__(files, cell_size, cache_dir)
+    return atlas
+
+
+@lru_cache(maxsize=32)
+def _build_icon_atlas(
+    files: Tuple[Tuple[str, Tuple[str, int, int]], ...],
+    cell_size: int,
+    cache_dir: str,
+) -> IconAtlas:
+    Image = _pillow()
+    sources: Dict[str, Path] = {}
+    for icon, (path, _, _) in files:
+        if _is_image(Image, Path(path)):
+            sources[icon] = Path(path)
+
+    icon_paths = sorted(sources)
+    columns = max(1, math.ceil(math.sqrt(len(icon_paths))))
+    rows = max(1, math.ceil(len(icon_paths) / columns))
+    offsets = {
+        icon: ((i % columns) * cell_size, (i // columns) * cell_size)
+        for i, icon in enumerate(icon_paths)
+    }
+
+    key = hashlib.sha256(f"cell={cell_size}".encode())
+    for icon in icon_paths:
+        key.update(f"\0{icon}\0{file_digest(sources[icon])}".encode())
+    sprite_path = Path(cache_dir) / f"atlas-{key.hexdigest()[:16]}.png"
+
+    disk_path = served_path(sprite_path)
+    if not disk_path.is_file():
+        write_atomic(disk_path, _render_sprite(sources, offsets, cell_size, columns, rows))
+
+    return IconAtlas(
+        src=sprite_path.as_posix(),
+        cell_size=cell_size,
+        width=columns * cell_size,
+        height=rows * cell_size,
+        offsets=offsets,
+    )
+
+
+def _pillow():
+    try:
+        from PIL import Image
+    except ImportError as ex:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "build_icon_atlas requires Pillow. Install it with "
+            "`pip install streamlit-select-icons[images]`."
+        ) from ex
+    return Image
+
+
+def _is_image(Image, path: Path) -> bool:
+    """Return whether Pillow can read the file; only its header is parsed."""
+    try:
+        with Image.open(path):
+            return True
+    except OSError:
+        return False
+
+
+def _render_sprite(
+    sources: Dict[str, Path],
+    offsets: Dict[str, Tuple[int, int]],
+    cell_size: int,
+    columns: int,
+    rows: int,
+) -> bytes:
+    Image = _pillow()
+    sprite = Image.new("RGBA", (columns * cell_size, rows * cell_size), (0, 0, 0, 0))
+    for icon, (x, y) in offsets.items():
+        with Image.open(sources[icon]) as image:
+            image = image.convert("RGBA")
+            # Scale to fit the cell and center it, like object-fit: contain
+            scale = cell_size / max(image.width, image.height)
+            image = image.resize(
+                (max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+                Image.LANCZOS,
+            )
+            sprite.paste(
+                image,
+                (x + (cell_size - image.width) // 2, y + (cell_size - image.height) // 2),
+            )
+
+    buffer = io.BytesIO()
+    sprite.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
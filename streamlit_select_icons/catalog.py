@@ -0,0 +1,231 @@
+"""Immutable icon catalogs that are validated and serialized once."""
+
+import copy
+import hashlib
+import json
+import threading
+import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ._groups import group_indices
+from ._search import build_search_index, search_text
+
+# Catalogs are interned by content hash so identical catalogs built by many
+# sessions share one instance (and one serialized payload).
+_CATALOGS: "weakref.WeakValueDictionary[str, IconCatalog]" = weakref.WeakValueDictionary()
+_CATALOGS_LOCK = threading.Lock()
+
+
+class IconCatalog(Mapping):
+    """An immutable mapping of item id -> item, ready to send to the frontend.
+
+    Build one with `IconCatalog.from_items(items)` and pass it to
+    `select_icons(items=catalog)`. Items are validated and normalized once,
+    stored column-wise, and serialized once; reruns and other sessions
+    reuse that work. Catalogs with the same content share one instance.
+
+    It behaves like the read-only dict it was built from, so the "items"
+    entry of the `select_icons` result can be used as before. Properties
+    are deep-copied when the catalog is built and every lookup returns a
+    fresh copy, so neither the caller's items nor a session editing a
+    looked-up item can change a catalog other sessions share.
+    """
+
+    __slots__ = (
+        "ids",
+        "labels",
+        "icons",
+        "alt_texts",
+        "properties",
+        "search_texts",
+        "search_index",
+        "content_hash",
+        "_payload",
+        "_index",
+        "_rendered",
+        "_groups",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        ids: Tuple[str, ...],
+        labels: Tuple[str, ...],
+        icons: Tuple[Optional[str], ...],
+        alt_texts: Tuple[Optional[str], ...],
+        properties: Tuple[Mapping[str, Any], ...],
+        search_texts: Tuple[Optional[str], ...],
+        search_index: Optional[Dict[str, Any]],
+        payload: bytes,
+        content_hash: str,
+    ):
+        # Use `IconCatalog.from_items`, which validates and interns catalogs
+        self.ids = ids
+        self.labels = labels
+        self.icons = icons
+        self.alt_texts = alt_texts
+        self.properties = properties
+        self.search_texts = search_texts
+        self.search_index = search_index
+        self.content_hash = content_hash
+        self._payload = payload
+        self._index = {item_id: i for i, item_id in enumerate(ids)}
+        self._rendered: Dict[Tuple[Any, ...], Tuple[Any, Tuple[bytes, str]]] = {}
+        self._groups: Dict[str, List[Tuple[str, List[int]]]] = {}
+
+    @classmethod
+    def from_items(
+        cls,
+        items: "Mapping[str, Mapping[str, Any]]",
+        *,
+        search_properties: Optional[Sequence[str]] = None,
+        search_index: bool = False,
+    ) -> "IconCatalog":
+        """Validate and normalize an items dict into a shared catalog.
+
+        `search_properties` names the `properties` whose values the built-in
+        search box matches in addition to labels. With `search_index=True`
+        the search index is built here, once, and shipped with the catalog
+        instead of being built in the browser.
+
+        Raises TypeError if an item or one of its fields has the wrong type.
+        """
+        if isinstance(items, IconCatalog):
+            return items
+
+        ids, labels, icons, alt_texts, properties, search_texts = [], [], [], [], [], []
+        for item_id, item in items.items():
+            if not isinstance(item_id, str):
+                raise TypeError(f"Item ids must be str, got {type(item_id).__name__}")
+            if not isinstance(item, Mapping):
+                raise TypeError(f"Item {item_id!r} must be a dict, got {type(item).__name__}")
+            label = item.get("label", item_id)
+            if not isinstance(label, str):
+                raise TypeError(f"Item {item_id!r}: label must be a str")
+            for field in ("icon", "alt_text"):
+                if item.get(field) is not None and not isinstance(item[field], str):
+                    raise TypeError(f"Item {item_id!r}: {field} must be a str or None")
+            item_properties = item.get("properties") or {}
+            if not isinstance(item_properties, Mapping):
+                raise TypeError(f"Item {item_id!r}: properties must be a dict")
+            ids.append(item_id)
+            labels.append(label)
+            icons.append(item.get("icon"))
+            alt_texts.append(item.get("alt_text"))
+            properties.append(copy.deepcopy(dict(item_properties)))
+            search_texts.append(search_text(item, search_properties))
+
+        index = build_search_index(labels, search_texts) if search_index else None
+        payload = _serialize(ids, labels, icons, alt_texts, search_texts=search_texts, search_index=index)
+        content_hash = _content_hash(payload, properties)
+
+        with _CATALOGS_LOCK:
+            catalog = _CATALOGS.get(content_hash)
+            if catalog is None:
+                catalog = cls(
+                    tuple(ids),
+                    tuple(labels),
+                    tuple(icons),
+                    tuple(alt_texts),
+                    tuple(MappingProxyType(item_properties) for item_properties in properties),
+                    tuple(search_texts),
+                    index,
+                    payload,
+                    content_hash,
+                )
+                _CATALOGS[content_hash] = catalog
+        return catalog
+
+    @property
+    def payload(self) -> bytes:
+        """The serialized catalog, as UTF-8 JSON columns (without properties)."""
+        return self._payload
+
+    def rendered_payload(self, key: Tuple[Any, ...], render_icon, stamp: Any = None) -> Tuple[bytes, str]:
+        """Return ``(payload, hash)`` with the icon column rewritten by `render_icon`.
+
+        `render_icon(icon)` returns the updates for one item's icon (see
+        `select_icons`'s `inline_icons`/`thumbnails`). Results are memoized
+        per `key` and rebuilt when `stamp` changes, e.g. when the icon files
+        they were derived from do.
+        """
+        memoized = self._rendered.get(key)
+        if memoized is not None and memoized[0] == stamp:
+            rendered = memoized[1]
+        else:
+            # Read the icon column directly: item lookups copy properties
+            icons, srcsets = list(self.icons), []
+            for i, icon in enumerate(self.icons):
+                updates = render_icon(icon)
+                icons[i] = updates.get("icon", icon)
+                srcsets.append(updates.get("icon_srcset"))
+            payload = _serialize(
+                self.ids,
+                self.labels,
+                icons,
+                self.alt_texts,
+                search_texts=self.search_texts,
+                search_index=self.search_index,
+                icon_srcsets=srcsets,
+            )
+            rendered = (payload, hashlib.sha256(payload).hexdigest())
+            self._rendered[key] = (stamp, rendered)
+        return rendered
+
+    def position(self, item_id: str) -> int:
+        """Return the index of an item in the catalog order; KeyError if missing."""
+        return self._index[item_id]
+
+    def groups(self, group_by: str) -> List[Tuple[str, List[int]]]:
+        """Return the item indices grouped by the `group_by` property, memoized."""
+        groups = self._groups.get(group_by)
+        if groups is None:
+            groups = self._groups[group_by] = group_indices(self.properties, group_by)
+        return groups
+
+    def __getitem__(self, item_id: str) -> Dict[str, Any]:
+        i = self._index[item_id]
+        return {
+            "label": self.labels[i],
+            "icon": self.icons[i],
+            "alt_text": self.alt_texts[i],
+            "properties": copy.deepcopy(dict(self.properties[i])),
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._index
+
+    def __repr__(self) -> str:
+        return f"IconCatalog({len(self)} items, hash={self.content_hash[:12]})"
+
+
+def _serialize(ids, labels, icons, alt_texts, search_texts=None, search_index=None, icon_srcsets=None) -> bytes:
+    # Properties are not serialized: the frontend never reads them
+    columns = {
+        "ids": list(ids),
+        "labels": list(labels),
+        "icons": list(icons),
+        "alt_texts": list(alt_texts),
+    }
+    if search_texts is not None and any(search_texts):
+        columns["search_texts"] = list(search_texts)
+    if search_index is not None:
+        columns["search_index"] = search_index
+    if icon_srcsets is not None and any(icon_srcsets):
+        columns["icon_srcsets"] = icon_srcsets
+    return json.dumps(columns, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _content_hash(payload: bytes, properties: Sequence[Dict[str, Any]]) -> str:
+    # Properties stay out of the payload but still tell catalogs apart
+    digest = hashlib.sha256(payload)
+    digest.update(json.dumps(list(properties), separators=(",", ":"), sort_keys=True, default=repr).encode("utf-8"))
+    return digest.hexdigest()
@@ -0,0 +1,98 @@
+import { cleanup, fireEvent, render, screen } from "@testing-library/react"
+import { ComponentProps } from "streamlit-component-lib"
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest"
+import MyComponent from "./MyComponent"
+import { ItemsMap } from "./catalog"
+
+// Streamlit is replaced by a connection that passes the props straight
+// through, so the test renders the selector the way the iframe does
+vi.mock("streamlit-component-lib", () => ({
+  Streamlit: { setComponentValue: vi.fn(), setFrameHeight: vi.fn() },
+  withStreamlitConnection: <P,>(component: P) => component,
+}))
+
+// Count renders per card through the icon each card draws
+const iconRenders = vi.hoisted(() => new Map<string, number>())
+vi.mock("./LazyIcon", () => ({
+  default: ({ alt }: { alt: string }) => {
+    iconRenders.set(alt, (iconRenders.get(alt) ?? 0) + 1)
+    return null
+  },
+}))
+
+const ITEM_COUNT = 500
+const ITEMS: ItemsMap = Object.fromEntries(Array.from({ length: ITEM_COUNT }, (_, i) => [
+  `item_${i}`,
+  { label: `Item ${i}`, icon: `static/item_${i}.png` },
+]))
+
+// Args as a rerun delivers them: equal content, freshly parsed objects.
+// jsdom reports no client height, so the grid windows to its first rows;
+// the cards clicked below are among them.
+const rerunArgs = (multiSelect = true, items: ItemsMap = ITEMS): ComponentProps["args"] =>
+  JSON.parse(JSON.stringify({
+    items,
+    multi_select: multiSelect,
+    columns: 10,
+    item_style: { item_1: { color: "red" } },
+  }))
+
+const props = (args: ComponentProps["args"]): ComponentProps =>
+  ({ args, disabled: false, width: 800, theme: undefined }) as ComponentProps
+
+const totalRenders = () => Array.from(iconRenders.values()).reduce((sum, count) => sum + count, 0)
+
+describe("IconCard", () => {
+  beforeEach(() => iconRenders.clear())
+  afterEach(cleanup)
+
+  it("renders each mounted card once", () => {
+    render(<MyComponent {...props(rerunArgs())} />)
+    expect(iconRenders.size).toBeGreaterThan(0)
+    expect(Array.from(iconRenders.values()).every(count => count === 1)).toBe(true)
+  })
+
+  it("re-renders only the clicked card in multi-select mode", () => {
+    render(<MyComponent {...props(rerunArgs())} />)
+    fireEvent.click(screen.getByTitle("Item 3"))
+    fireEvent.click(screen.getByTitle("Item 12"))
+    iconRenders.clear()
+
+    fireEvent.click(screen.getByTitle("Item 3"))
+
+    expect(totalRenders()).toBe(1)
+    expect(iconRenders.get("Item 3")).toBe(1)
+  })
+
+  it("re-renders only the old and new selection in single-select mode", () => {
+    render(<MyComponent {...props(rerunArgs(false))} />)
+    fireEvent.click(screen.getByTitle("Item 10"))
+    iconRenders.clear()
+
+    fireEvent.click(screen.getByTitle("Item 15"))
+
+    expect(totalRenders()).toBe(2)
+    expect(iconRenders.get("Item 10")).toBe(1)
+    expect(iconRenders.get("Item 15")).toBe(1)
+  })
+
+  it("re-renders no card on a rerun with equal args", () => {
+    const { rerender } = render(<MyComponent {...props(rerunArgs())} />)
+    iconRenders.clear()
+
+    rerender(<MyComponent {...props(rerunArgs())} />)
+
+    expect(totalRenders()).toBe(0)
+  })
+
+  it("re-renders only the changed item on a rerun", () => {
+    const { rerender } = render(<MyComponent {...props(rerunArgs())} />)
+    iconRenders.clear()
+
+    const changed = { ...ITEMS, item_7: { label: "Item 7", icon: "static/new.png" } }
+    rerender(<MyComponent {...props(rerunArgs(true, changed))} />)
+
+    expect(totalRenders()).toBe(1)
+    expect(iconRenders.get("Item 7")).toBe(1)
+  })
+})
@@ -0,0 +1,89 @@
+import { CSSProperties, memo, MouseEvent, ReactElement, RefObject, useCallback } from "react"
+import LazyIcon from "./LazyIcon"
+import { LABEL_CLASS } from "./cardStyles"
+import { ItemRecord } from "./catalog"
+import { resolveIconSrc, resolveIconSrcSet } from "./iconSrc"
+
+// Styles and settings shared by every card. The grid memoizes this bundle,
+// so it only changes with the theme, card size, item styles or atlas, not
+// with the selection. Card and label colors live in the stylesheet built by
+// `buildCardStylesheet`; cards only switch class names.
+export type CardAppearance = {
+  cardClassName: (itemId: string, isSelected: boolean) => string
+  iconStyle: CSSProperties
+  iconImgStyle: CSSProperties
+  iconPlaceholderStyle: CSSProperties
+  altTextStyle: CSSProperties
+  spriteStyle: (offset: [number, number]) => CSSProperties
+  atlasOffsets?: Record<string, [number, number]>
+  scrollRoot: RefObject<HTMLElement> | null  // null: icons load by the browser viewport
+}
+
+type IconCardProps = {
+  index: number
+  itemId: string
+  item: ItemRecord
+  isSelected: boolean
+  gridRow: number
+  gridColumn: number
+  appearance: CardAppearance
+  onSelect: (index: number, extend: boolean) => void  // `extend`: shift-click
+}
+
+// One selectable card. Every prop is a primitive or a reference that is
+// stable across clicks, so toggling the selection re-renders only the cards
+// whose `isSelected` changed.
+const IconCard = ({
+  index,
+  itemId,
+  item,
+  isSelected,
+  gridRow,
+  gridColumn,
+  appearance,
+  onSelect,
+}: IconCardProps): ReactElement => {
+  const handleClick = useCallback(
+    (event: MouseEvent) => onSelect(index, event.shiftKey),
+    [onSelect, index]
+  )
+  const spriteOffset = item.icon ? appearance.atlasOffsets?.[item.icon] : undefined
+  return (
+    <div
+      className={appearance.cardClassName(itemId, isSelected)}
+      style={{ gridRow, gridColumn }}
+      onClick={handleClick}
+      title={item.label}
+    >
+      {(item.icon || item.alt_text) ? (
+        <div style={appearance.iconStyle}>
+          {spriteOffset ? (
+            <div
+              role="img"
+              aria-label={item.label}
+              style={appearance.spriteStyle(spriteOffset)}
+            />
+          ) : item.icon ? (
+            <LazyIcon
+              src={resolveIconSrc(item.icon)}
+              srcSet={resolveIconSrcSet(item.icon_srcset)}
+              alt={item.label}
+              style={appearance.iconImgStyle}
+              placeholderStyle={appearance.iconPlaceholderStyle}
+              scrollRoot={appearance.scrollRoot}
+            />
+          ) : (
+            <div style={appearance.altTextStyle}>
+              {item.alt_text}
+            </div>
+          )}
+        </div>
+      ) : null}
+      <div className={LABEL_CLASS}>
+        {item.label}
+      </div>
+    </div>
+  )
+}
+
+export default memo(IconCard)
@@ -0,0 +1,83 @@
+import { act, cleanup, render } from "@testing-library/react"
+import { createRef } from "react"
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest"
+import LazyIcon from "./LazyIcon"
+
+type Callback = (entries: Array<{ target: Element; isIntersecting: boolean }>) => void
+
+// Records every observer created and the root it watches against. LazyIcon
+// shares observers across icons, so they outlive each test.
+const created: Array<{ root: Element | null; callback: Callback; targets: Element[] }> = []
+
+class FakeIntersectionObserver {
+  private record: { root: Element | null; callback: Callback; targets: Element[] }
+  constructor(callback: Callback, options: { root?: Element | null } = {}) {
+    this.record = { root: options.root ?? null, callback, targets: [] }
+    created.push(this.record)
+  }
+  observe(target: Element) {
+    this.record.targets.push(target)
+  }
+  unobserve(target: Element) {
+    this.record.targets = this.record.targets.filter(t => t !== target)
+  }
+  disconnect() {
+    this.record.targets = []
+  }
+}
+
+const ICON = {
+  src: "static/a.png",
+  alt: "a",
+  style: {},
+  placeholderStyle: {},
+}
+
+beforeEach(() => {
+  vi.stubGlobal("IntersectionObserver", FakeIntersectionObserver)
+})
+
+afterEach(() => {
+  cleanup()
+  vi.unstubAllGlobals()
+})
+
+describe("LazyIcon", () => {
+  it("observes against the browser viewport without a scroll root", () => {
+    render(<LazyIcon {...ICON} scrollRoot={null} />)
+
+    const viewportObserver = created.find(observer => observer.root === null)
+    expect(viewportObserver?.targets).toHaveLength(1)
+  })
+
+  it("observes against a scroll root that clips its cards", () => {
+    const scrollRoot = createRef<HTMLDivElement>()
+    const { container } = render(
+      <div ref={scrollRoot} style={{ height: 200, overflowY: "auto" }}>
+        <LazyIcon {...ICON} scrollRoot={scrollRoot} />
+      </div>
+    )
+
+    const rootObserver = created.find(observer => observer.root === container.firstChild)
+    expect(rootObserver?.targets).toHaveLength(1)
+  })
+
+  it("starts loading when the viewport reaches the icon", () => {
+    const decode = vi.fn(() => Promise.resolve())
+    vi.stubGlobal("Image", class {
+      decoding = ""
+      srcset = ""
+      src = ""
+      decode = decode
+    })
+    render(<LazyIcon {...ICON} scrollRoot={null} />)
+    expect(decode).not.toHaveBeenCalled()
+
+    const viewportObserver = created.find(observer => observer.root === null)!
+    act(() => {
+      viewportObserver.callback(viewportObserver.targets.map(target => ({ target, isIntersecting: true })))
+    })
+
+    expect(decode).toHaveBeenCalledTimes(1)
+  })
+})
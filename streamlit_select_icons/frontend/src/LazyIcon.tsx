@@ -0,0 +1,94 @@
+import {
+  CSSProperties,
+  ReactElement,
+  RefObject,
+  useEffect,
+  useRef,
+  useState,
+} from "react"
+
+// Start loading icons this far before their card scrolls into view
+const ROOT_MARGIN = "200px"
+
+type Listener = (isNear: boolean) => void
+
+// One IntersectionObserver per scroll container, shared by all its icons.
+// Icons observed against the viewport share the observer keyed by VIEWPORT.
+const observers = new WeakMap<object, { observer: IntersectionObserver; listeners: Map<Element, Listener> }>()
+const VIEWPORT = {}
+
+const observe = (root: Element | null, target: Element, listener: Listener): (() => void) => {
+  let shared = observers.get(root ?? VIEWPORT)
+  if (!shared) {
+    const listeners = new Map<Element, Listener>()
+    const observer = new IntersectionObserver(
+      entries => entries.forEach(entry => listeners.get(entry.target)?.(entry.isIntersecting)),
+      { root, rootMargin: ROOT_MARGIN }
+    )
+    shared = { observer, listeners }
+    observers.set(root ?? VIEWPORT, shared)
+  }
+  shared.listeners.set(target, listener)
+  shared.observer.observe(target)
+  const { observer, listeners } = shared
+  return () => {
+    observer.unobserve(target)
+    listeners.delete(target)
+  }
+}
+
+type LazyIconProps = {
+  src?: string
+  srcSet?: string
+  alt: string
+  style: CSSProperties
+  placeholderStyle: CSSProperties
+  scrollRoot: RefObject<HTMLElement> | null
+}
+
+// Icon image that starts loading only when its card nears the scroll
+// viewport: that of `scrollRoot`, or with a null `scrollRoot` the browser
+// viewport, which the page's own scrolling moves across the frame. Until then, and while the image decodes off the main thread,
+// a placeholder of the same size holds its place.
+const LazyIcon = ({ src, srcSet, alt, style, placeholderStyle, scrollRoot }: LazyIconProps): ReactElement => {
+  const placeholderRef = useRef<HTMLDivElement>(null)
+  const [isNear, setIsNear] = useState(false)
+  const [isDecoded, setIsDecoded] = useState(false)
+
+  useEffect(() => {
+    const root = scrollRoot ? scrollRoot.current : null
+    const target = placeholderRef.current
+    if (isNear || !target) return
+    if ((scrollRoot && !root) || typeof IntersectionObserver === "undefined") {
+      setIsNear(true)
+      return
+    }
+    return observe(root, target, near => {
+      if (near) setIsNear(true)
+    })
+  }, [isNear, scrollRoot])
+
+  useEffect(() => {
+    if (!isNear || !src) return
+    let cancelled = false
+    const image = new Image()
+    image.decoding = "async"
+    if (srcSet) image.srcset = srcSet
+    image.src = src
+    // Broken images reject decode(); show the <img> anyway so its alt text renders
+    const reveal = () => {
+      if (!cancelled) setIsDecoded(true)
+    }
+    image.decode().then(reveal, reveal)
+    return () => {
+      cancelled = true
+    }
+  }, [isNear, src, srcSet])
+
+  if (!isDecoded) {
+    return <div ref={placeholderRef} style={placeholderStyle} aria-hidden="true" />
+  }
+  return <img src={src} srcSet={srcSet} alt={alt} style={style} decoding="async" />
+}
+
+export default LazyIcon
@@ -6,56 +6,139 @@ import {
 import React, {
   useCallback,
   useEffect,
+  useDeferredValue,
   useMemo,
+  useRef,
   useState,
   ReactElement,
 } from "react"
+import IconCard, { CardAppearance } from "./IconCard"
+import { parseArrowItems } from "./arrowItems"
+import { CatalogEntry, entriesFromItems, parseCatalogPayload, ItemsMap, ParsedCatalog } from "./catalog"
+import { buildCardStylesheet, ItemStyle } from "./cardStyles"
+import { useFrameHeight } from "./frameHeight"
+import { resolveIconSrc } from "./iconSrc"
+import { useProfiler } from "./profile"
+import { ItemGroup, layoutGroups, SelectionToggle, useGroupCounts, useStableGroups } from "./groups"
+import { useEndInView, usePagedEntries } from "./pages"
+import { PreloadIcon, usePreloadIcons } from "./preload"
+import { CatalogRef, useRegisteredCatalog } from "./registeredCatalog"
+import { useStableArg, useStableEntries } from "./stable"
+import { buildSearchIndex, searchItems, SearchIndex } from "./search"
+import {
+  applyBulkAction,
+  BulkAction,
+  encodeSelection,
+  reconcileSelection,
+  sameIds,
+  sameMembers,
+  selectRange,
+  toggleSelection,
+  unresolvedIds,
+  useSelection,
+  SelectionEncoding,
+} from "./selection"
+import {
+  computeGridWindow,
+  gridPlacement,
+  useScrollViewport,
+} from "./virtualGrid"
 
-// Resolve icon paths passed from Python. Supports absolute URLs and
-// maps "static/icon.png" and "static/group.png" to Streamlit's /app/static folder.
-const resolveIconSrc = (iconPath?: string): string | undefined => {
-  if (!iconPath) return undefined
-  const trimmed = iconPath.trim()
-  // If it's already an absolute URL (http/https/data), use as-is
-  if (/^(https?:)?\/\//i.test(trimmed) || /^data:/i.test(trimmed)) {
-    return trimmed
-  }
-  // Normalize leading slashes
-  const normalized = trimmed.replace(/^\/+/, "")
-  if (normalized === "static/icon.png") {
-    return "/app/static/icon.png"
-  }
-  if (normalized === "static/group.png") {
-    return "/app/static/group.png"
-  }
-  // For other static files, assume they're in Streamlit's /app/static folder
-  if (normalized.startsWith("static/")) {
-    return `/app/${normalized}`
-  }
-  // Fallback: try relative to current module (will 404 if not bundled)
-  try {
-    return new URL(normalized, import.meta.url).toString()
-  } catch {
-    return undefined
-  }
+// Sprite sheet built by `build_icon_atlas` on the Python side
+type IconAtlas = {
+  src: string
+  cell_size: number
+  width: number
+  height: number
+  offsets: Record<string, [number, number]>  // icon path -> (x, y) of its cell
 }
 
-type ItemRecord = {
-  label: string
-  icon?: string | null  // Can be None/null for no icon
-  alt_text?: string     // Text to display instead of icon when icon is None
-  properties?: Record<string, unknown>
-}
+// When selection changes are sent to Python (each one triggers a rerun)
+type CommitMode = "immediate" | "debounced" | "submit"
+
+// Grid spacing in pixels, shared by the container style and the windowing math
+const GRID_GAP = 12
+const GRID_PADDING = 16
+// Height of the search box row, shown above the grid when `searchable` is set
+const SEARCH_BAR_HEIGHT = 44
+// Height of the "Apply" row, shown below the grid in "submit" commit mode
+const SUBMIT_BAR_HEIGHT = 44
+// Height of the "Select all / none / Invert" row, shown with `bulk_actions`
+const BULK_BAR_HEIGHT = 40
+// Height of a group's section header in the grouped view
+const GROUP_HEADER_HEIGHT = 32
+const NO_GROUPS: ItemGroup[] = []
+const NO_ENTRIES: CatalogEntry[] = []
+const NO_ITEM_STYLES: Record<string, ItemStyle> = {}
 
-type ItemsMap = Record<string, ItemRecord>
+type SelectorProps = ComponentProps & {
+  registeredCatalog?: ParsedCatalog
+}
 
-function MyComponent({ args, disabled, theme }: ComponentProps): ReactElement {
+function MyComponent({ args, disabled, theme, registeredCatalog }: SelectorProps): ReactElement {
+  // `profile=True`: render timings and sizes posted along with the value
+  const { recordCards, markClick, takeMetrics } = useProfiler(args.profile === true, args)
   const items: ItemsMap = useMemo(() => args.items || {}, [args.items])
-  const initialSelectedItems: string[] = useMemo(() => args.selected_items || [], [args.selected_items])
+  const itemOrder = useStableArg((args.item_order as string[] | undefined) || undefined)
+  const selectedItems: string[] = useMemo(() => args.selected_items || [], [args.selected_items])
   const multiSelect: boolean = useMemo(() => args.multi_select !== false, [args.multi_select])
   const layout: string = useMemo(() => args.layout || "column", [args.layout])
-  
-  const [selectedItems, setSelectedItems] = useState<string[]>(initialSelectedItems)
+  const selectionEncoding: SelectionEncoding = args.selection_encoding || "ids"
+
+  // An `IconCatalog` arrives as a serialized bytes payload with its content
+  // hash; it is only re-parsed when the hash changes, not on every rerun.
+  const catalogHash: string | undefined = args.catalog_hash || undefined
+  const catalogPayload = useRef<Uint8Array | undefined>(undefined)
+  catalogPayload.current = args.catalog || undefined
+  // A DataFrame or Arrow table arrives the same way, as an Arrow IPC stream
+  const tableHash: string | undefined = args.table_hash || undefined
+  const tablePayload = useRef<Uint8Array | undefined>(undefined)
+  tablePayload.current = args.table || undefined
+  // A paginated source sends one page at a time; pages are cached here
+  const isPaged = typeof args.has_more === "boolean"
+  const hasMorePages = args.has_more === true
+  const { entries: pagedEntries, loadedPages } = usePagedEntries(args.page)
+  usePreloadIcons(useStableArg((args.preload as PreloadIcon[] | null) || undefined))
+  const payloadCatalog = useMemo(
+    () => catalogHash && catalogPayload.current ? parseCatalogPayload(catalogPayload.current) : undefined,
+    [catalogHash]
+  )
+  const tableCatalog = useMemo(
+    () => tableHash && tablePayload.current ? parseArrowItems(tablePayload.current) : undefined,
+    [tableHash]
+  )
+  const parsedCatalog = registeredCatalog ?? payloadCatalog ?? tableCatalog
+  // A plain dict is re-parsed on every rerun; unchanged items keep their
+  // objects so their memoized cards don't re-render
+  const dictEntries = useStableEntries(useMemo(
+    () => isPaged || parsedCatalog ? NO_ENTRIES : entriesFromItems(items, itemOrder),
+    [isPaged, parsedCatalog, items, itemOrder]
+  ))
+  const itemEntries = isPaged ? pagedEntries : parsedCatalog ? parsedCatalog.entries : dictEntries
+  const itemIds = useMemo(() => itemEntries.map(([itemId]) => itemId), [itemEntries])
+  const indexById = useMemo(() => new Map(itemIds.map((itemId, index) => [itemId, index])), [itemIds])
+
+  const [selection, setSelection, unresolved] = useSelection(itemIds, indexById, selectedItems)
+
+  // `selected_items` is controlled: a newer `selection_version` means Python
+  // changed it, and it replaces the local selection (committed at once).
+  // Equal versions are echoes of the user's own clicks and are ignored, so
+  // clicks made while a rerun is in flight are kept.
+  const selectionVersion = typeof args.selection_version === "number" ? (args.selection_version as number) : 0
+  const [appliedVersion, setAppliedVersion] = useState(selectionVersion)
+  const adoptedRef = useRef(false)
+  if (selectionVersion > appliedVersion) {
+    // Adjusting state during render: React re-renders before committing
+    setAppliedVersion(selectionVersion)
+    const reconciled = reconcileSelection(selection, selectedItems, indexById)
+    const adoptedUnresolved = unresolvedIds(selectedItems, indexById)
+    if (reconciled !== selection || !sameIds(adoptedUnresolved, unresolved)) {
+      adoptedRef.current = true
+      setSelection(() => reconciled, adoptedUnresolved)
+    }
+  }
+  const appliedVersionRef = useRef(appliedVersion)
+  appliedVersionRef.current = appliedVersion
 
   const borderColor = theme?.primaryColor || "#1f77b4"
   const componentHeight = typeof args.height === "number" ? (args.height as number) : undefined
@@ -63,49 +146,224 @@ function MyComponent({ args, disabled, theme }: ComponentProps): ReactElement {
   const cardSize = typeof args.size === "number" ? (args.size as number) : 96
   const maxColumns = typeof args.columns === "number" ? (args.columns as number) : 1
   const maxRows = typeof args.rows === "number" ? (args.rows as number) : 1
-  const itemStyles = (args.item_style as Record<string, Record<string, string>>) || {}
+  // Compared by content: the args are new objects on every rerun
+  const itemStyles = useStableArg((args.item_style as Record<string, ItemStyle> | null) || NO_ITEM_STYLES)
   const boldSelected = args.bold_selected === true
+  const atlas = useStableArg((args.atlas as IconAtlas | null) || undefined)
 
-  // Set frame height
-  useEffect(() => {
-    if (componentHeight && Number.isFinite(componentHeight)) {
-      Streamlit.setFrameHeight(componentHeight)
-    } else {
-    Streamlit.setFrameHeight()
-    }
-  }, [componentHeight, selectedItems])
+  const searchable = args.searchable === true
+  const bulkActions = args.bulk_actions === true && multiSelect
+  const commitMode: CommitMode = args.commit_mode || "immediate"
+  const debounceMs = typeof args.debounce_ms === "number" ? (args.debounce_ms as number) : 300
+  // `group_by` arrives as the item indices of each group
+  const grouped = Array.isArray(args.groups)
+  const groups = useStableGroups((args.groups as ItemGroup[] | null) || NO_GROUPS)
+
+  // Size the iframe to the rendered content, including the search box and
+  // "Apply" row
+  const rootRef = useRef<HTMLDivElement>(null)
+  useFrameHeight(rootRef)
+
+  // Send state back to Streamlit whenever it changes. Only the selection
+  // crosses the wire; the Python wrapper re-attaches the items map it
+  // already holds, so large catalogs are not echoed back on every click.
+  // The ids are read through a ref so a rerun that leaves the selection
+  // untouched doesn't post a new value.
+  // A pending page request for a paginated source rides along with the
+  // selection, so it stays in the value until the page has been delivered.
+  // Only the committed selection is posted: in "debounced" mode it follows
+  // the selection once clicks pause for `debounceMs`, and in "submit" mode
+  // it changes when the user presses "Apply". Clicks in between only
+  // update local state and don't rerun the script.
+  const itemIdsRef = useRef(itemIds)
+  itemIdsRef.current = itemIds
+  const selectionRef = useRef(selection)
+  selectionRef.current = selection
+  const unresolvedRef = useRef(unresolved)
+  unresolvedRef.current = unresolved
+  const [committedSelection, setCommittedSelection] = useState(selection)
+  const committedRef = useRef(committedSelection)
+  const committedUnresolvedRef = useRef(unresolved)
+  const pageRequestRef = useRef<number | undefined>(undefined)
+  const postValue = useCallback(() => {
+    const metrics = takeMetrics()
+    Streamlit.setComponentValue({
+      ...encodeSelection(committedRef.current, itemIdsRef.current, selectionEncoding, committedUnresolvedRef.current),
+      selection_version: appliedVersionRef.current,
+      ...(pageRequestRef.current !== undefined ? { page_request: pageRequestRef.current } : {}),
+      ...(metrics ? { metrics } : {}),
+    })
+  }, [selectionEncoding, takeMetrics])
+
+  const commitSelection = useCallback(() => {
+    committedRef.current = selectionRef.current
+    committedUnresolvedRef.current = unresolvedRef.current
+    setCommittedSelection(selectionRef.current)
+    postValue()
+  }, [postValue])
 
-  // Send state back to Streamlit whenever it changes
   useEffect(() => {
-    const payload = {
-      items,
-      selected_items: selectedItems,
+    if (adoptedRef.current) {
+      adoptedRef.current = false
+      commitSelection()
+      return
+    }
+    if (commitMode === "submit") return
+    if (commitMode === "debounced") {
+      const timer = window.setTimeout(commitSelection, debounceMs)
+      return () => window.clearTimeout(timer)
     }
-    Streamlit.setComponentValue(payload)
-  }, [items, selectedItems])
+    commitSelection()
+  }, [selection, commitSelection, commitMode, debounceMs])
 
-  const handleItemClick = useCallback((itemId: string) => {
+  // Shift-click selects the range from the previous click in display
+  // order, as one state change. The order is read through a ref so the
+  // handler, and with it every memoized card, stays stable.
+  const anchorRef = useRef<number | undefined>(undefined)
+  // The last single-item toggle, so the group counts can follow it by +/-1
+  const lastToggleRef = useRef<SelectionToggle | undefined>(undefined)
+  const shownOrderRef = useRef<readonly number[] | undefined>(undefined)
+  const handleItemClick = useCallback((index: number, extend: boolean) => {
     if (disabled) return
-    
-    if (multiSelect) {
-      setSelectedItems(prev => 
-        prev.includes(itemId) 
-          ? prev.filter(id => id !== itemId)
-          : [...prev, itemId]
-        )
-      } else {
-      setSelectedItems([itemId])
+    markClick()
+    const anchor = anchorRef.current
+    anchorRef.current = index
+    if (extend && multiSelect && anchor !== undefined) {
+      setSelection(prev => selectRange(prev, anchor, index, shownOrderRef.current))
+    } else {
+      // A single selection replaces any hidden one as well
+      setSelection(prev => {
+        const next = toggleSelection(prev, index, multiSelect)
+        if (multiSelect) lastToggleRef.current = { previous: prev, next, index }
+        return next
+      }, multiSelect ? undefined : [])
     }
-  }, [multiSelect, disabled])
+  }, [multiSelect, disabled, setSelection, markClick])
 
   // Card dimensions - height scales proportionally with size
   const CARD_HEIGHT = Math.max(110, cardSize + 14) // Minimum 110px, or size + padding for label
 
+  // Client-side search: the prefix index is built on the first query (or
+  // shipped prebuilt with an `IconCatalog`) and reused until the catalog
+  // changes. Filtering never reruns the Python script.
+  const [query, setQuery] = useState("")
+  const deferredQuery = useDeferredValue(query)
+  const prebuiltSearchIndex = isPaged ? undefined : parsedCatalog?.searchIndex
+  const searchIndexCache = useRef<{ entries: CatalogEntry[]; index: SearchIndex } | undefined>(undefined)
+  // `visible` restricts the grid to a subset of the catalog, in its order;
+  // search then filters within that subset.
+  const subset = (args.visible as number[] | null) || undefined
+  const visibleIndices = useMemo(() => {
+    if (!searchable || deferredQuery.trim() === "") return subset
+    let cached = searchIndexCache.current
+    if (!cached || cached.entries !== itemEntries) {
+      cached = { entries: itemEntries, index: prebuiltSearchIndex ?? buildSearchIndex(itemEntries) }
+      searchIndexCache.current = cached
+    }
+    const matches = searchItems(cached.index, deferredQuery, itemEntries.length)
+    if (!subset) return matches
+    const matched = new Uint8Array(itemEntries.length)
+    for (const index of matches) matched[index] = 1
+    return subset.filter(index => matched[index] === 1)
+  }, [searchable, deferredQuery, itemEntries, prebuiltSearchIndex, subset])
+
+  // Number of cards in the grid, after filtering
+  const itemCount = visibleIndices ? visibleIndices.length : itemEntries.length
+  // Cards per track: columns per row in column layout, rows per column in row layout
+  const lanes = layout === "row" ? maxRows : maxColumns
+  const trackCount = Math.ceil(itemCount / Math.max(1, lanes))
+
+  // Windowed rendering: only cards inside the scroll viewport (plus overscan)
+  // are mounted. The grid keeps its full track count so the scroll extent
+  // is unchanged, and mounted cards are placed explicitly in their cells.
+  // Without a fixed `height` a column layout grows to fit every card, so
+  // its viewport covers them all and nothing is windowed.
+  const containerRef = useRef<HTMLDivElement>(null)
+  const viewport = useScrollViewport(containerRef)
+  // Only a container that clips its cards can serve as the lazy-loading
+  // root, or tell from its window when paged items run out; otherwise both
+  // follow the page scrolling the component into view
+  const clipsCards = Boolean(componentHeight) || (layout === "row" && !grouped)
+  const gridWindow = useMemo(() => computeGridWindow({
+    itemCount,
+    lanes,
+    trackSize: layout === "row" ? cardSize + 24 : CARD_HEIGHT,
+    gap: GRID_GAP,
+    padding: GRID_PADDING,
+    scrollOffset: layout === "row" ? viewport.scrollLeft : viewport.scrollTop,
+    viewportSize: layout === "row" ? viewport.width : viewport.height,
+  }), [itemCount, lanes, layout, cardSize, CARD_HEIGHT, viewport])
+
+  // Grouped view: collapsible sections stacked vertically. Collapsed
+  // sections mount no cards; expanded ones are windowed like the grid.
+  const [collapsedGroups, setCollapsedGroups] = useState<ReadonlySet<string>>(() => new Set())
+  const toggleGroup = useCallback((name: string) => {
+    setCollapsedGroups(prev => {
+      const next = new Set(prev)
+      if (!next.delete(name)) next.add(name)
+      return next
+    })
+  }, [])
+  const groupCounts = useGroupCounts(groups, selection, lastToggleRef.current)
+  const visibleMask = useMemo(() => {
+    if (!grouped || !visibleIndices) return undefined
+    const mask = new Uint8Array(itemEntries.length)
+    for (const index of visibleIndices) mask[index] = 1
+    return mask
+  }, [grouped, visibleIndices, itemEntries.length])
+  // Items shown, in display order, when that is not the catalog order:
+  // ranges and bulk actions apply to these only
+  const shownOrder = useMemo(() => {
+    if (!grouped) return visibleIndices
+    const order: number[] = []
+    for (const [, indices] of groups) {
+      for (const index of indices) {
+        if (!visibleMask || visibleMask[index]) order.push(index)
+      }
+    }
+    return order
+  }, [grouped, groups, visibleIndices, visibleMask])
+  shownOrderRef.current = shownOrder
+
+  const handleBulkAction = useCallback((action: BulkAction) => {
+    if (disabled) return
+    markClick()
+    setSelection(prev => applyBulkAction(prev, action, itemEntries.length, shownOrder))
+  }, [disabled, markClick, setSelection, itemEntries.length, shownOrder])
+
+  const groupSections = useMemo(() => grouped ? layoutGroups({
+    groups,
+    visible: visibleMask,
+    collapsed: collapsedGroups,
+    lanes: maxColumns,
+    trackSize: CARD_HEIGHT,
+    gap: GRID_GAP,
+    padding: GRID_PADDING,
+    headerHeight: GROUP_HEADER_HEIGHT,
+    scrollOffset: viewport.scrollTop,
+    viewportSize: viewport.height,
+  }) : undefined, [grouped, groups, visibleMask, collapsedGroups, maxColumns, CARD_HEIGHT, viewport])
+
+  // Ask Python for the next page once the end of the loaded items is near:
+  // the window (including its overscan) of a grid that scrolls itself, or
+  // else a marker after the grid nearing the browser viewport. Only one
+  // request is in flight.
+  const endMarkerRef = useRef<HTMLDivElement>(null)
+  const watchEndMarker = isPaged && hasMorePages && !clipsCards
+  const endMarkerInView = useEndInView(endMarkerRef, watchEndMarker)
+  const nearEnd = clipsCards ? gridWindow.end >= itemCount : endMarkerInView
+  useEffect(() => {
+    if (!isPaged || !hasMorePages || !nearEnd) return
+    if (pageRequestRef.current === loadedPages) return
+    pageRequestRef.current = loadedPages
+    postValue()
+  }, [isPaged, hasMorePages, nearEnd, loadedPages, postValue])
+
   const containerStyle: React.CSSProperties = useMemo(() => {
     const baseStyle: React.CSSProperties = {
       display: "grid",
-      gap: 12,
-      padding: 16,
+      gap: GRID_GAP,
+      padding: GRID_PADDING,
       background: theme?.backgroundColor || "#fff",
       boxSizing: "border-box",
       width: componentWidth ? `${componentWidth}px` : "100%",
@@ -116,14 +374,11 @@ function MyComponent({ args, disabled, theme }: ComponentProps): ReactElement {
 
     if (layout === "row") {
       // Row layout: icons flow in specified number of rows, then scroll horizontally
-      const itemCount = Object.keys(items).length
-      const columnsNeeded = Math.ceil(itemCount / maxRows)
-      
       return {
         ...baseStyle,
         display: "grid",
         gridTemplateRows: `repeat(${maxRows}, minmax(${CARD_HEIGHT}px, 1fr))`,
-        gridTemplateColumns: `repeat(${columnsNeeded}, ${cardSize + 24}px)`, // Explicit columns with gap
+        gridTemplateColumns: `repeat(${trackCount}, ${cardSize + 24}px)`, // Explicit columns with gap
         gridAutoFlow: "column",
         overflowX: "auto",     // Horizontal scrolling when content overflows
         overflowY: "hidden",   // No vertical scrolling
@@ -135,56 +390,76 @@ function MyComponent({ args, disabled, theme }: ComponentProps): ReactElement {
       return {
         ...baseStyle,
         gridTemplateColumns: `repeat(${maxColumns}, minmax(${cardSize}px, 1fr))`,
+        // Explicit rows so the scroll extent covers unmounted cards too
+        gridTemplateRows: trackCount > 0 ? `repeat(${trackCount}, ${CARD_HEIGHT}px)` : undefined,
         gridAutoFlow: "row",
         overflowX: "hidden",   // No horizontal scrolling
         overflowY: "auto",     // Vertical scrolling when columns are full
       }
     }
-  }, [layout, componentHeight, componentWidth, theme?.backgroundColor, maxColumns, maxRows, cardSize, CARD_HEIGHT])
-
-  const cardStyle = useCallback((isSelected: boolean, itemId: string): React.CSSProperties => {
-    const itemStyle = itemStyles[itemId] || {}
-    
-    // Default colors
-    const defaultBorderColor = isSelected ? borderColor : `${borderColor}33`
-    const defaultBackgroundColor = isSelected ? `${borderColor}15` : "#ffffff"
-    
-    // Custom colors from item_style (if provided)
-    const customBorderColor = isSelected 
-      ? itemStyle.selected_border_color || itemStyle.border_color 
-      : itemStyle.border_color
-    const customBackgroundColor = isSelected
-      ? itemStyle.selected_background_color || itemStyle.background_color
-      : itemStyle.background_color
-    
-    // Use custom colors if provided, otherwise use defaults
-    const finalBorderColor = customBorderColor || defaultBorderColor
-    const finalBackgroundColor = customBackgroundColor || defaultBackgroundColor
-    
-    return {
-      width: cardSize,
-      height: CARD_HEIGHT,
-      border: `2px solid ${finalBorderColor}`,
-      borderRadius: 8,
-      padding: 8,
-      textAlign: "center",
-      background: finalBackgroundColor,
-      cursor: disabled ? "not-allowed" : "pointer",
-      userSelect: "none",
-      display: "flex",
-      flexDirection: "column",
-      gap: 6,
-      alignItems: "center",
-      justifyContent: "center",
-      boxSizing: "border-box",
-      transition: "all 0.2s ease",
-      opacity: disabled ? 0.6 : 1,
-    }
-  }, [cardSize, CARD_HEIGHT, borderColor, disabled, itemStyles])
+  }, [layout, componentHeight, componentWidth, theme?.backgroundColor, maxColumns, maxRows, cardSize, CARD_HEIGHT, trackCount])
+
+  const groupedContainerStyle: React.CSSProperties = useMemo(() => ({
+    display: "block",
+    padding: GRID_PADDING,
+    background: theme?.backgroundColor || "#fff",
+    boxSizing: "border-box",
+    width: componentWidth ? `${componentWidth}px` : "100%",
+    maxWidth: componentWidth ? `${componentWidth}px` : "none",
+    height: componentHeight ? `${componentHeight}px` : "auto",
+    maxHeight: componentHeight ? `${componentHeight}px` : "none",
+    overflowX: "hidden",
+    overflowY: "auto",
+  }), [componentHeight, componentWidth, theme?.backgroundColor])
+
+  const groupHeaderStyle: React.CSSProperties = useMemo(() => ({
+    display: "flex",
+    alignItems: "center",
+    gap: 8,
+    width: "100%",
+    height: GROUP_HEADER_HEIGHT,
+    marginBottom: GRID_GAP,
+    padding: "0 8px",
+    boxSizing: "border-box",
+    border: "none",
+    borderBottom: `1px solid ${borderColor}33`,
+    background: "transparent",
+    color: theme?.textColor || "#333",
+    font: "inherit",
+    fontFamily: theme?.font,
+    fontSize: 14,
+    fontWeight: 600,
+    textAlign: "left",
+    cursor: "pointer",
+  }), [borderColor, theme?.textColor, theme?.font])
+
+  const groupBodyStyle = useCallback((bodyHeight: number, tracks: number): React.CSSProperties => ({
+    display: "grid",
+    gap: GRID_GAP,
+    gridTemplateColumns: `repeat(${maxColumns}, minmax(${cardSize}px, 1fr))`,
+    gridTemplateRows: `repeat(${tracks}, ${CARD_HEIGHT}px)`,
+    height: bodyHeight,
+    marginBottom: GRID_GAP,
+  }), [maxColumns, cardSize, CARD_HEIGHT])
+
+  // Card colors, including every distinct `item_style` combination, are
+  // compiled into one stylesheet; cards only carry class names
+  const cardStylesheet = useMemo(() => buildCardStylesheet({
+    itemStyles,
+    accentColor: borderColor,
+    textColor: theme?.textColor || "#333",
+    cardSize,
+    cardHeight: CARD_HEIGHT,
+    // Scale font size based on card size, with reasonable bounds
+    labelFontSize: Math.min(Math.max(cardSize * 0.125, 10), 16),
+    boldSelected,
+    disabled: disabled === true,
+  }), [itemStyles, borderColor, theme?.textColor, cardSize, CARD_HEIGHT, boldSelected, disabled])
+
+  // Scale icon size based on card size, with reasonable min/max bounds
+  const iconSize = Math.min(Math.max(cardSize * 0.4, 24), 64)
 
   const iconStyle: React.CSSProperties = useMemo(() => {
-    // Scale icon size based on card size, with reasonable min/max bounds
-    const iconSize = Math.min(Math.max(cardSize * 0.4, 24), 64)
     return {
       width: iconSize,
       height: iconSize,
@@ -194,7 +469,7 @@ function MyComponent({ args, disabled, theme }: ComponentProps): ReactElement {
       overflow: "hidden",
       flexShrink: 0,
     }
-  }, [cardSize])
+  }, [iconSize])
 
   const iconImgStyle: React.CSSProperties = useMemo(() => ({
       width: "100%",
@@ -205,6 +480,29 @@ function MyComponent({ args, disabled, theme }: ComponentProps): ReactElement {
       display: "block",
   }), [])
 
+  // Fixed-size stand-in shown until an icon is near the viewport and decoded
+  const iconPlaceholderStyle: React.CSSProperties = useMemo(() => ({
+    width: "100%",
+    height: "100%",
+    borderRadius: 4,
+    background: `${theme?.textColor || "#333333"}0d`,
+  }), [theme?.textColor])
+
+  // Draw an icon from the atlas by scaling the sprite so one cell matches
+  // the icon box, then shifting it to the icon's cell
+  const atlasSrc = useMemo(() => atlas ? resolveIconSrc(atlas.src) : undefined, [atlas?.src])
+  const spriteStyle = useCallback((offset: [number, number]): React.CSSProperties => {
+    const scale = atlas ? iconSize / atlas.cell_size : 1
+    return {
+      width: "100%",
+      height: "100%",
+      backgroundImage: `url("${atlasSrc}")`,
+      backgroundRepeat: "no-repeat",
+      backgroundSize: `${(atlas?.width ?? 0) * scale}px ${(atlas?.height ?? 0) * scale}px`,
+      backgroundPosition: `${-offset[0] * scale}px ${-offset[1] * scale}px`,
+    }
+  }, [atlas, atlasSrc, iconSize])
+
   const altTextStyle: React.CSSProperties = useMemo(() => {
     // Scale font size based on card size, with reasonable bounds
     // Alt text should be larger than the label but not too large
@@ -225,53 +523,230 @@ function MyComponent({ args, disabled, theme }: ComponentProps): ReactElement {
     }
   }, [cardSize, theme?.textColor])
 
-  const labelStyle = useCallback((isSelected: boolean): React.CSSProperties => {
-    // Scale font size based on card size, with reasonable bounds
-    const fontSize = Math.min(Math.max(cardSize * 0.125, 10), 16)
-    return {
-      fontSize: fontSize,
-      fontWeight: (boldSelected && isSelected) ? 700 : 500,
-      overflow: "hidden",
-      textOverflow: "ellipsis",
-      width: "100%",
-      textAlign: "center",
-      lineHeight: 1.3,
-      color: theme?.textColor || "#333",
-    }
-  }, [cardSize, theme?.textColor, boldSelected])
+  const searchInputStyle: React.CSSProperties = useMemo(() => ({
+    display: "block",
+    width: "100%",
+    height: SEARCH_BAR_HEIGHT - 8,
+    marginBottom: 8,
+    padding: "0 12px",
+    boxSizing: "border-box",
+    border: `1px solid ${borderColor}55`,
+    borderRadius: 8,
+    fontSize: 14,
+    fontFamily: theme?.font,
+    color: theme?.textColor || "#333",
+    background: theme?.backgroundColor || "#fff",
+  }), [borderColor, theme?.font, theme?.textColor, theme?.backgroundColor])
 
-  return (
-    <div style={containerStyle}>
-      {Object.entries(items).map(([itemId, item]) => {
-        const isSelected = selectedItems.includes(itemId)
-            return (
-              <div
-            key={itemId}
-            style={cardStyle(isSelected, itemId)}
-            onClick={() => handleItemClick(itemId)}
-            title={item.label}
-          >
-            {(item.icon || item.alt_text) ? (
-              <div style={iconStyle}>
-                {item.icon ? (
-                  <img 
-                    src={resolveIconSrc(item.icon)} 
-                    alt={item.label} 
-                    style={iconImgStyle} 
-                  />
-                ) : (
-                  <div style={altTextStyle}>
-                    {item.alt_text}
-                  </div>
-                )}
+  const submitBarStyle: React.CSSProperties = useMemo(() => ({
+    display: "flex",
+    alignItems: "center",
+    justifyContent: "flex-end",
+    gap: 12,
+    height: SUBMIT_BAR_HEIGHT - 8,
+    marginTop: 8,
+    fontSize: 14,
+    fontFamily: theme?.font,
+    color: theme?.textColor || "#333",
+  }), [theme?.font, theme?.textColor])
+
+  const bulkBarStyle: React.CSSProperties = useMemo(() => ({
+    display: "flex",
+    alignItems: "center",
+    gap: 8,
+    height: BULK_BAR_HEIGHT - 8,
+    marginBottom: 8,
+    fontSize: 14,
+    fontFamily: theme?.font,
+    color: theme?.textColor || "#333",
+  }), [theme?.font, theme?.textColor])
+
+  const bulkButtonStyle: React.CSSProperties = useMemo(() => ({
+    height: "100%",
+    padding: "0 12px",
+    border: `1px solid ${borderColor}55`,
+    borderRadius: 8,
+    background: "transparent",
+    color: "inherit",
+    font: "inherit",
+    cursor: disabled ? "not-allowed" : "pointer",
+  }), [borderColor, disabled])
+
+  // Toggling an item on and off again leaves nothing to apply
+  const hasPendingChanges = useMemo(
+    () => !sameMembers(selection, committedSelection),
+    [selection, committedSelection]
+  )
+  const applyButtonStyle: React.CSSProperties = useMemo(() => ({
+    height: "100%",
+    padding: "0 16px",
+    border: "none",
+    borderRadius: 8,
+    background: borderColor,
+    color: "#fff",
+    font: "inherit",
+    fontWeight: 600,
+    cursor: disabled || !hasPendingChanges ? "not-allowed" : "pointer",
+    opacity: disabled || !hasPendingChanges ? 0.5 : 1,
+  }), [borderColor, disabled, hasPendingChanges])
+
+  const handleQueryChange = useCallback((event: React.ChangeEvent<HTMLInputElement>) => {
+    setQuery(event.target.value)
+    containerRef.current?.scrollTo(0, 0)
+  }, [])
+
+  // Cards are memoized: `appearance` and `handleItemClick` keep their
+  // identity across clicks, so a toggle only re-renders the cards whose
+  // selected state changed
+  const appearance: CardAppearance = useMemo(() => ({
+    cardClassName: cardStylesheet.cardClassName,
+    iconStyle,
+    iconImgStyle,
+    iconPlaceholderStyle,
+    altTextStyle,
+    spriteStyle,
+    atlasOffsets: atlas?.offsets,
+    scrollRoot: clipsCards ? containerRef : null,
+  }), [cardStylesheet, iconStyle, iconImgStyle, iconPlaceholderStyle, altTextStyle, spriteStyle, atlas?.offsets, clipsCards])
+
+  const renderCard = (index: number, placement: { gridRow: number; gridColumn: number }): ReactElement => {
+    const [itemId, item] = itemEntries[index]
+    return (
+      <IconCard
+        key={itemId}
+        index={index}
+        itemId={itemId}
+        item={item}
+        isSelected={selection.has(index)}
+        gridRow={placement.gridRow}
+        gridColumn={placement.gridColumn}
+        appearance={appearance}
+        onSelect={handleItemClick}
+      />
+    )
+  }
+
+  recordCards(groupSections
+    ? groupSections.reduce((count, section) => count + section.window.end - section.window.start, 0)
+    : gridWindow.end - gridWindow.start)
+
+  const grid = grouped && groupSections ? (
+    <div ref={containerRef} style={groupedContainerStyle}>
+      {groupSections.map(section => {
+        const selectedCount = groupCounts[section.group]
+        return (
+          <section key={section.name}>
+            <button
+              type="button"
+              style={groupHeaderStyle}
+              onClick={() => toggleGroup(section.name)}
+              aria-expanded={!section.collapsed}
+            >
+              <span aria-hidden="true">{section.collapsed ? "\u25B8" : "\u25BE"}</span>
+              <span style={{ flex: 1, overflow: "hidden", textOverflow: "ellipsis", whiteSpace: "nowrap" }}>
+                {section.name}
+              </span>
+              <span style={{ fontWeight: 400, opacity: 0.7 }}>
+                {selectedCount > 0 ? `${selectedCount} / ${section.total}` : section.total}
+              </span>
+            </button>
+            {section.bodyHeight > 0 ? (
+              <div style={groupBodyStyle(section.bodyHeight, Math.ceil(section.indices.length / Math.max(1, maxColumns)))}>
+                {Array.from({ length: section.window.end - section.window.start }, (_, offset) => {
+                  const position = section.window.start + offset
+                  return renderCard(section.indices[position], gridPlacement(position, maxColumns, "column"))
+                })}
               </div>
             ) : null}
-            <div style={labelStyle(isSelected)}>
-              {item.label}
-            </div>
-              </div>
-            )
-          })}
+          </section>
+        )
+      })}
+    </div>
+  ) : (
+    <div ref={containerRef} style={containerStyle}>
+      {Array.from({ length: gridWindow.end - gridWindow.start }, (_, offset) => {
+        // Grid position, and the item's index in the catalog (they differ
+        // while a search filters the grid)
+        const position = gridWindow.start + offset
+        const index = visibleIndices ? visibleIndices[position] : position
+        return renderCard(index, gridPlacement(position, lanes, layout))
+      })}
+    </div>
+  )
+
+  return (
+    <div ref={rootRef} style={{ width: componentWidth ? `${componentWidth}px` : "100%" }}>
+      <style>{cardStylesheet.css}</style>
+      {searchable ? (
+        <input
+          type="search"
+          value={query}
+          onChange={handleQueryChange}
+          placeholder="Search..."
+          aria-label="Search icons"
+          style={searchInputStyle}
+        />
+      ) : null}
+      {bulkActions ? (
+        <div style={bulkBarStyle}>
+          <button type="button" style={bulkButtonStyle} disabled={disabled} onClick={() => handleBulkAction("all")}>
+            Select all
+          </button>
+          <button type="button" style={bulkButtonStyle} disabled={disabled} onClick={() => handleBulkAction("none")}>
+            Select none
+          </button>
+          <button type="button" style={bulkButtonStyle} disabled={disabled} onClick={() => handleBulkAction("invert")}>
+            Invert
+          </button>
+          <span style={{ marginLeft: "auto" }}>{selection.size} selected</span>
+        </div>
+      ) : null}
+      {grid}
+      {watchEndMarker ? <div ref={endMarkerRef} style={{ height: 1 }} aria-hidden="true" /> : null}
+      {commitMode === "submit" ? (
+        <div style={submitBarStyle}>
+          <span>{selection.size} selected</span>
+          <button
+            type="button"
+            style={applyButtonStyle}
+            disabled={disabled || !hasPendingChanges}
+            onClick={commitSelection}
+          >
+            Apply
+          </button>
+        </div>
+      ) : null}
+    </div>
+  )
+}
+
+// A catalog registered with `register_catalog` is fetched before the selector
+// mounts, so `selected_items` resolve against the full catalog
+function RegisteredCatalogGate(props: ComponentProps): ReactElement | null {
+  const catalogRef = (props.args.catalog_ref as CatalogRef | null) || undefined
+  const { catalog: registeredCatalog, error } = useRegisteredCatalog(catalogRef)
+  if (catalogRef && error) return <CatalogError message={error} url={catalogRef.url} />
+  if (catalogRef && !registeredCatalog) return null
+  return <MyComponent {...props} registeredCatalog={registeredCatalog} />
+}
+
+// Shown instead of the grid when a registered catalog's file can't be
+// fetched, e.g. because the app's static folder is not served
+function CatalogError({ message, url }: { message: string; url: string }): ReactElement {
+  const rootRef = useRef<HTMLDivElement>(null)
+  useFrameHeight(rootRef)
+  return (
+    <div ref={rootRef} role="alert" style={{
+      padding: "12px 16px",
+      borderRadius: 8,
+      border: "1px solid #ff4b4b",
+      background: "#fff0f0",
+      color: "#7d1a1a",
+      fontFamily: "sans-serif",
+      fontSize: 14,
+    }}>
+      Could not load the icon catalog from <code>{url}</code>: {message}.
+      Check that static file serving is enabled for the app.
     </div>
   )
 }
@@ -285,4 +760,4 @@ function MyComponent({ args, disabled, theme }: ComponentProps): ReactElement {
  *
  * You don't need to modify this wrapper unless you need custom connection behavior.
  */
-export default withStreamlitConnection(MyComponent)
+export default withStreamlitConnection(RegisteredCatalogGate)
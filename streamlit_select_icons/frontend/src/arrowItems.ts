@@ -0,0 +1,34 @@
+import { tableFromIPC, Vector } from "apache-arrow"
+import { CatalogEntry, ParsedCatalog } from "./catalog"
+
+// Items sent as a DataFrame or Arrow table arrive as one Arrow IPC stream
+// with string columns: "id", and optionally "label", "icon", "alt_text",
+// "search_text" and "icon_srcset" (JSON-encoded [path, ratio] pairs).
+const stringColumn = (vector: Vector | null): Array<string | null> | undefined =>
+  vector ? Array.from(vector as Iterable<string | null>) : undefined
+
+export const parseArrowItems = (payload: Uint8Array): ParsedCatalog => {
+  const table = tableFromIPC(payload)
+  const ids = stringColumn(table.getChild("id")) ?? []
+  const labels = stringColumn(table.getChild("label"))
+  const icons = stringColumn(table.getChild("icon"))
+  const altTexts = stringColumn(table.getChild("alt_text"))
+  const searchTexts = stringColumn(table.getChild("search_text"))
+  const srcsets = stringColumn(table.getChild("icon_srcset"))
+
+  const entries: CatalogEntry[] = ids.map((itemId, i) => {
+    const id = itemId as string
+    const srcset = srcsets?.[i]
+    return [
+      id,
+      {
+        label: labels?.[i] ?? id,
+        icon: icons?.[i] ?? null,
+        alt_text: altTexts?.[i] ?? undefined,
+        icon_srcset: srcset ? JSON.parse(srcset) : undefined,
+        search_text: searchTexts?.[i] ?? undefined,
+      },
+    ]
+  })
+  return { entries }
+}
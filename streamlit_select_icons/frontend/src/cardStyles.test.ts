@@ -0,0 +1,46 @@
+import { describe, expect, it } from "vitest"
+import { buildCardStylesheet, CardStylesheetOptions } from "./cardStyles"
+
+const OPTIONS: CardStylesheetOptions = {
+  itemStyles: {},
+  accentColor: "#1f77b4",
+  textColor: "#333",
+  cardSize: 96,
+  cardHeight: 110,
+  labelFontSize: 12,
+  boldSelected: false,
+  disabled: false,
+}
+
+describe("buildCardStylesheet", () => {
+  it("shares one class between items with the same colors", () => {
+    const sheet = buildCardStylesheet({
+      ...OPTIONS,
+      itemStyles: {
+        a: { border_color: "red", selected_background_color: "pink" },
+        b: { border_color: "red", selected_background_color: "pink" },
+        c: { background_color: "blue" },
+      },
+    })
+
+    expect(sheet.cardClassName("a", false)).toBe(sheet.cardClassName("b", false))
+    expect(sheet.cardClassName("a", false)).not.toBe(sheet.cardClassName("c", false))
+    expect(sheet.css.match(/\.ssi-v\d+\{/g)).toHaveLength(2)
+  })
+
+  it("falls back to the unselected color, then the theme default", () => {
+    const sheet = buildCardStylesheet({ ...OPTIONS, itemStyles: { a: { border_color: "red" } } })
+
+    expect(sheet.css).toContain(".ssi-card.ssi-v0.ssi-selected{border-color:red}")
+    expect(sheet.cardClassName("other", true)).toBe("ssi-card ssi-selected")
+  })
+
+  it("keeps item colors from escaping their declaration", () => {
+    const sheet = buildCardStylesheet({
+      ...OPTIONS,
+      itemStyles: { a: { border_color: "red;} body{display:none" } },
+    })
+
+    expect(sheet.css).not.toContain("body{")
+  })
+})
@@ -0,0 +1,126 @@
+// Card colors and layout compiled into one stylesheet. Every card shares the
+// base class; each distinct `item_style` combination gets one generated
+// class, however many items use it. Selecting a card toggles a class
+// instead of rebuilding its inline style.
+
+export const CARD_CLASS = "ssi-card"
+export const SELECTED_CLASS = "ssi-selected"
+export const LABEL_CLASS = "ssi-label"
+
+// Per-item colors, as passed to `select_icons(item_style=...)`
+export type ItemStyle = {
+  border_color?: string
+  background_color?: string
+  selected_border_color?: string
+  selected_background_color?: string
+}
+
+export type CardStylesheetOptions = {
+  itemStyles: Record<string, ItemStyle>
+  accentColor: string  // Theme primary color, used for the default colors
+  textColor: string
+  cardSize: number
+  cardHeight: number
+  labelFontSize: number
+  boldSelected: boolean
+  disabled: boolean
+}
+
+export type CardStylesheet = {
+  css: string
+  cardClassName: (itemId: string, isSelected: boolean) => string
+}
+
+const DEFAULT_CLASS_NAMES: [string, string] = [CARD_CLASS, `${CARD_CLASS} ${SELECTED_CLASS}`]
+
+// Colors come from Python as free-form strings; keep them from closing the
+// declaration or rule they are written into
+const cssValue = (value?: string): string => (value || "").replace(/[;{}<>\\]/g, "").trim()
+
+const rule = (selector: string, declarations: Array<[string, string | number]>): string =>
+  `${selector}{${declarations.map(([name, value]) => `${name}:${value}`).join(";")}}`
+
+export const buildCardStylesheet = ({
+  itemStyles,
+  accentColor,
+  textColor,
+  cardSize,
+  cardHeight,
+  labelFontSize,
+  boldSelected,
+  disabled,
+}: CardStylesheetOptions): CardStylesheet => {
+  const rules = [
+    rule(`.${CARD_CLASS}`, [
+      ["width", `${cardSize}px`],
+      ["height", `${cardHeight}px`],
+      ["border", `2px solid ${accentColor}33`],
+      ["border-radius", "8px"],
+      ["padding", "8px"],
+      ["text-align", "center"],
+      ["background", "#ffffff"],
+      ["cursor", disabled ? "not-allowed" : "pointer"],
+      ["user-select", "none"],
+      ["display", "flex"],
+      ["flex-direction", "column"],
+      ["gap", "6px"],
+      ["align-items", "center"],
+      ["justify-content", "center"],
+      ["box-sizing", "border-box"],
+      ["transition", "all 0.2s ease"],
+      ["opacity", disabled ? 0.6 : 1],
+    ]),
+    rule(`.${CARD_CLASS}.${SELECTED_CLASS}`, [
+      ["border-color", accentColor],
+      ["background", `${accentColor}15`],
+    ]),
+    rule(`.${LABEL_CLASS}`, [
+      ["font-size", `${labelFontSize}px`],
+      ["font-weight", 500],
+      ["overflow", "hidden"],
+      ["text-overflow", "ellipsis"],
+      ["width", "100%"],
+      ["text-align", "center"],
+      ["line-height", 1.3],
+      ["color", textColor],
+    ]),
+  ]
+  if (boldSelected) {
+    rules.push(rule(`.${SELECTED_CLASS} .${LABEL_CLASS}`, [["font-weight", 700]]))
+  }
+
+  // One class per distinct color combination; a selected card falls back to
+  // the unselected custom color, then to the theme default
+  const variantByKey = new Map<string, string>()
+  const classNamesByItem = new Map<string, [string, string]>()
+  for (const [itemId, itemStyle] of Object.entries(itemStyles)) {
+    const border = cssValue(itemStyle.border_color)
+    const background = cssValue(itemStyle.background_color)
+    const selectedBorder = cssValue(itemStyle.selected_border_color) || border
+    const selectedBackground = cssValue(itemStyle.selected_background_color) || background
+    if (!border && !background && !selectedBorder && !selectedBackground) continue
+
+    const key = [border, background, selectedBorder, selectedBackground].join("\n")
+    let variant = variantByKey.get(key)
+    if (!variant) {
+      variant = `ssi-v${variantByKey.size}`
+      variantByKey.set(key, variant)
+      const unselected: Array<[string, string]> = []
+      if (border) unselected.push(["border-color", border])
+      if (background) unselected.push(["background", background])
+      if (unselected.length > 0) rules.push(rule(`.${CARD_CLASS}.${variant}`, unselected))
+      const selected: Array<[string, string]> = []
+      if (selectedBorder) selected.push(["border-color", selectedBorder])
+      if (selectedBackground) selected.push(["background", selectedBackground])
+      if (selected.length > 0) rules.push(rule(`.${CARD_CLASS}.${variant}.${SELECTED_CLASS}`, selected))
+    }
+    const className = `${CARD_CLASS} ${variant}`
+    classNamesByItem.set(itemId, [className, `${className} ${SELECTED_CLASS}`])
+  }
+
+  return {
+    css: rules.join("\n"),
+    cardClassName: (itemId, isSelected) =>
+      (classNamesByItem.get(itemId) ?? DEFAULT_CLASS_NAMES)[isSelected ? 1 : 0],
+  }
+}
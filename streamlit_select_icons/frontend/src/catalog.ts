@@ -0,0 +1,56 @@
+import { SearchIndex } from "./search"
+
+export type ItemRecord = {
+  label: string
+  icon?: string | null  // Can be None/null for no icon
+  alt_text?: string     // Text to display instead of icon when icon is None
+  icon_srcset?: Array<[string, number]>  // Pre-scaled thumbnails: [path, device pixel ratio]
+  search_text?: string  // Values of the searchable properties
+}
+
+export type ItemsMap = Record<string, ItemRecord>
+
+// Catalog items in display order
+export type CatalogEntry = [string, ItemRecord]
+
+// Column-wise JSON payload serialized once by `IconCatalog` on the Python side
+type CatalogColumns = {
+  ids: string[]
+  labels: string[]
+  icons: Array<string | null>
+  alt_texts: Array<string | null>
+  icon_srcsets?: Array<Array<[string, number]> | null>
+  search_texts?: Array<string | null>
+  search_index?: SearchIndex  // Prebuilt with `IconCatalog.from_items(..., search_index=True)`
+}
+
+export type ParsedCatalog = {
+  entries: CatalogEntry[]
+  searchIndex?: SearchIndex
+}
+
+const decoder = new TextDecoder()
+
+// `order` is sent by Python when the ids include integer-like keys, which
+// object enumeration would move to the front
+export const entriesFromItems = (items: ItemsMap, order?: string[]): CatalogEntry[] =>
+  order ? order.map((itemId) => [itemId, items[itemId]]) : Object.entries(items)
+
+export const parseCatalogPayload = (payload: Uint8Array): ParsedCatalog =>
+  parseCatalogJson(decoder.decode(payload))
+
+// Same payload, as text (a registered catalog fetched from its static file)
+export const parseCatalogJson = (text: string): ParsedCatalog => {
+  const columns: CatalogColumns = JSON.parse(text)
+  const entries: CatalogEntry[] = columns.ids.map((itemId, i) => [
+    itemId,
+    {
+      label: columns.labels[i],
+      icon: columns.icons[i],
+      alt_text: columns.alt_texts[i] ?? undefined,
+      icon_srcset: columns.icon_srcsets?.[i] ?? undefined,
+      search_text: columns.search_texts?.[i] ?? undefined,
+    },
+  ])
+  return { entries, searchIndex: columns.search_index }
+}
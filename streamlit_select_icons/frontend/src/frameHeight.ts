@@ -0,0 +1,38 @@
+import { RefObject, useEffect } from "react"
+import { Streamlit } from "streamlit-component-lib"
+
+// Report the rendered height of the component's root element as the iframe
+// height. The element is observed rather than re-measured after every
+// render, size changes are coalesced to one report per animation frame, and
+// nothing is posted while the height stays the same, so clicks that don't
+// change the layout never make the host page re-layout the iframe.
+export const useFrameHeight = (ref: RefObject<HTMLElement>): void => {
+  useEffect(() => {
+    const element = ref.current
+    if (!element) return
+
+    let frame = 0
+    let reportedHeight = -1
+    const report = () => {
+      frame = 0
+      const height = Math.ceil(element.getBoundingClientRect().height)
+      if (height === reportedHeight) return
+      reportedHeight = height
+      Streamlit.setFrameHeight(height)
+    }
+    const schedule = () => {
+      if (!frame) frame = requestAnimationFrame(report)
+    }
+
+    report()
+    const observer = typeof ResizeObserver !== "undefined" ? new ResizeObserver(schedule) : undefined
+    observer?.observe(element)
+    if (!observer) window.addEventListener("resize", schedule)
+
+    return () => {
+      observer?.disconnect()
+      if (!observer) window.removeEventListener("resize", schedule)
+      if (frame) cancelAnimationFrame(frame)
+    }
+  }, [ref])
+}
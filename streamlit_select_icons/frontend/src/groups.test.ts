@@ -0,0 +1,59 @@
+import { renderHook } from "@testing-library/react"
+import { describe, expect, it } from "vitest"
+import { ItemGroup, SelectionToggle, useGroupCounts } from "./groups"
+import { Selection, toggleSelection } from "./selection"
+
+const GROUPS: ItemGroup[] = [
+  ["a", [0, 1, 2]],
+  ["b", [3, 4]],
+  ["c", [5]],
+]
+
+// A selection that fails the test if anything iterates over it
+const unwalkable = (selection: Selection): Selection => {
+  const guarded = new Set(selection)
+  guarded[Symbol.iterator] = () => {
+    throw new Error("the selection was recounted")
+  }
+  return guarded
+}
+
+type Props = { selection: Selection; toggle?: SelectionToggle }
+
+describe("useGroupCounts", () => {
+  it("counts the selection per group", () => {
+    const { result } = renderHook(({ selection }: Props) => useGroupCounts(GROUPS, selection), {
+      initialProps: { selection: new Set([0, 2, 4]) },
+    })
+    expect(result.current).toEqual([2, 1, 0])
+  })
+
+  it("moves only the toggled item's counter on a click", () => {
+    const initial = new Set([0, 4])
+    const { result, rerender } = renderHook(
+      ({ selection, toggle }: Props) => useGroupCounts(GROUPS, selection, toggle),
+      { initialProps: { selection: initial } as Props }
+    )
+
+    const added = unwalkable(toggleSelection(initial, 5, true))
+    rerender({ selection: added, toggle: { previous: initial, next: added, index: 5 } })
+    expect(result.current).toEqual([1, 1, 1])
+
+    const removed = unwalkable(new Set([4, 5]))
+    rerender({ selection: removed, toggle: { previous: added, next: removed, index: 0 } })
+    expect(result.current).toEqual([0, 1, 1])
+  })
+
+  it("recounts a selection that did not come from the reported toggle", () => {
+    const initial = new Set([0])
+    const { result, rerender } = renderHook(
+      ({ selection, toggle }: Props) => useGroupCounts(GROUPS, selection, toggle),
+      { initialProps: { selection: initial } as Props }
+    )
+    const stale: SelectionToggle = { previous: initial, next: toggleSelection(initial, 1, true), index: 1 }
+
+    // e.g. a bulk action or a value set from Python
+    rerender({ selection: new Set([1, 3, 5]), toggle: stale })
+    expect(result.current).toEqual([1, 1, 1])
+  })
+})
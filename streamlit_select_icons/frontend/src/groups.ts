@@ -0,0 +1,177 @@
+import { useMemo, useRef } from "react"
+import { Selection } from "./selection"
+import { computeGridWindow, GridWindow } from "./virtualGrid"
+
+// A group sent by the Python side for `group_by`: its name and the
+// ascending indices of its items in the catalog order
+export type ItemGroup = [string, number[]]
+
+// One collapsible section of the grouped view, positioned along the
+// scroll axis so only the cards near the viewport are mounted
+export type GroupSection = {
+  group: number        // Position of the group in `groups`
+  name: string
+  indices: number[]    // Items shown in the section, after search filtering
+  total: number        // Items in the group, before filtering
+  collapsed: boolean
+  top: number          // Offset of the header within the scroll content
+  bodyTop: number      // Offset of the first card row
+  bodyHeight: number   // Zero when collapsed
+  window: GridWindow   // Range of positions in `indices` to mount
+}
+
+export type GroupLayoutOptions = {
+  groups: readonly ItemGroup[]
+  visible?: Uint8Array // visible[index] is 1 for items matching the search
+  collapsed: ReadonlySet<string>
+  lanes: number
+  trackSize: number
+  gap: number
+  padding: number
+  headerHeight: number
+  scrollOffset: number
+  viewportSize: number
+}
+
+const EMPTY_WINDOW: GridWindow = { start: 0, end: 0 }
+
+// Stack the sections vertically: header, then (unless collapsed) a grid of
+// card rows. Collapsed sections mount no cards, and expanded ones only mount
+// the rows near the viewport. Groups with no search matches are hidden.
+export const layoutGroups = ({
+  groups,
+  visible,
+  collapsed,
+  lanes,
+  trackSize,
+  gap,
+  padding,
+  headerHeight,
+  scrollOffset,
+  viewportSize,
+}: GroupLayoutOptions): GroupSection[] => {
+  const lanesPerTrack = Math.max(1, lanes)
+  const sections: GroupSection[] = []
+  let offset = padding
+  groups.forEach(([name, groupIndices], group) => {
+    const indices = visible ? groupIndices.filter(index => visible[index]) : groupIndices
+    if (visible && indices.length === 0) return
+
+    const isCollapsed = collapsed.has(name)
+    const tracks = Math.ceil(indices.length / lanesPerTrack)
+    const bodyTop = offset + headerHeight + gap
+    const bodyHeight = isCollapsed || tracks === 0 ? 0 : tracks * (trackSize + gap) - gap
+    sections.push({
+      group,
+      name,
+      indices,
+      total: groupIndices.length,
+      collapsed: isCollapsed,
+      top: offset,
+      bodyTop,
+      bodyHeight,
+      window: bodyHeight === 0 ? EMPTY_WINDOW : computeGridWindow({
+        itemCount: indices.length,
+        lanes: lanesPerTrack,
+        trackSize,
+        gap,
+        padding: 0,
+        scrollOffset: scrollOffset - bodyTop,
+        viewportSize,
+      }),
+    })
+    offset = bodyHeight === 0 ? offset + headerHeight + gap : bodyTop + bodyHeight + gap
+  })
+  return sections
+}
+
+const sameGroups = (a: readonly ItemGroup[], b: readonly ItemGroup[]): boolean =>
+  a.length === b.length && a.every(([name, indices], group) => {
+    const [otherName, otherIndices] = b[group]
+    return name === otherName &&
+      indices.length === otherIndices.length &&
+      indices.every((index, i) => index === otherIndices[i])
+  })
+
+// Streamlit re-sends the args on every rerun, so keep the previous groups
+// (and everything memoized on them) while their contents are unchanged
+export const useStableGroups = (groups: readonly ItemGroup[]): readonly ItemGroup[] => {
+  const previous = useRef(groups)
+  if (previous.current !== groups && !sameGroups(previous.current, groups)) {
+    previous.current = groups
+  }
+  return previous.current
+}
+
+// Group position of each item index, or -1 for items in no group
+const groupPositions = (groups: readonly ItemGroup[]): Int32Array => {
+  let itemCount = 0
+  for (const [, indices] of groups) {
+    if (indices.length > 0) itemCount = Math.max(itemCount, indices[indices.length - 1] + 1)
+  }
+  const groupOf = new Int32Array(itemCount).fill(-1)
+  groups.forEach(([, indices], group) => {
+    for (const index of indices) groupOf[index] = group
+  })
+  return groupOf
+}
+
+// A click that added or removed one item: `next` is `previous` with
+// `index` toggled. Reported by the click handler so the group counts can
+// follow it without a recount.
+export type SelectionToggle = {
+  previous: Selection
+  next: Selection
+  index: number
+}
+
+type GroupCountState = {
+  groups: readonly ItemGroup[]
+  selection: Selection
+  counts: number[]
+}
+
+const countSelected = (groups: readonly ItemGroup[], groupOf: Int32Array, selection: Selection): number[] => {
+  const counts = new Array<number>(groups.length).fill(0)
+  for (const index of selection) {
+    if (index < groupOf.length && groupOf[index] >= 0) counts[groupOf[index]]++
+  }
+  return counts
+}
+
+// Selected items per group, in `groups` order. The item -> group table is
+// built once per set of groups. When `toggle` describes the change from the
+// previous selection, only the toggled item's group counter moves by one;
+// any other change (ranges, bulk actions, values set from Python) recounts.
+export const useGroupCounts = (
+  groups: readonly ItemGroup[],
+  selection: Selection,
+  toggle?: SelectionToggle
+): number[] => {
+  const groupOf = useMemo(() => groupPositions(groups), [groups])
+  const state = useRef<GroupCountState | undefined>(undefined)
+  const current = state.current
+
+  if (current && current.groups === groups && current.selection === selection) {
+    return current.counts
+  }
+  let counts: number[]
+  if (
+    current &&
+    current.groups === groups &&
+    toggle &&
+    toggle.previous === current.selection &&
+    toggle.next === selection
+  ) {
+    counts = current.counts
+    const group = toggle.index < groupOf.length ? groupOf[toggle.index] : -1
+    if (group >= 0) {
+      counts = counts.slice()
+      counts[group] += selection.has(toggle.index) ? 1 : -1
+    }
+  } else {
+    counts = countSelected(groups, groupOf, selection)
+  }
+  state.current = { groups, selection, counts }
+  return counts
+}
@@ -0,0 +1,36 @@
+// Resolve icon paths passed from Python. Supports absolute URLs and
+// maps "static/icon.png" and "static/group.png" to Streamlit's /app/static folder.
+export const resolveIconSrc = (iconPath?: string): string | undefined => {
+  if (!iconPath) return undefined
+  const trimmed = iconPath.trim()
+  // If it's already an absolute URL (http/https/data), use as-is
+  if (/^(https?:)?\/\//i.test(trimmed) || /^data:/i.test(trimmed)) {
+    return trimmed
+  }
+  // Normalize leading slashes
+  const normalized = trimmed.replace(/^\/+/, "")
+  if (normalized === "static/icon.png") {
+    return "/app/static/icon.png"
+  }
+  if (normalized === "static/group.png") {
+    return "/app/static/group.png"
+  }
+  // For other static files, assume they're in Streamlit's /app/static folder
+  if (normalized.startsWith("static/")) {
+    return `/app/${normalized}`
+  }
+  // Fallback: try relative to current module (will 404 if not bundled)
+  try {
+    return new URL(normalized, import.meta.url).toString()
+  } catch {
+    return undefined
+  }
+}
+
+// Build a srcset attribute from thumbnail paths shipped by the Python side
+export const resolveIconSrcSet = (srcset?: Array<[string, number]>): string | undefined => {
+  if (!srcset || srcset.length === 0) return undefined
+  return srcset
+    .map(([path, ratio]) => `${resolveIconSrc(path)} ${ratio}x`)
+    .join(", ")
+}
@@ -0,0 +1,83 @@
+import { act, renderHook } from "@testing-library/react"
+import { createRef, RefObject, useMemo } from "react"
+import { afterEach, describe, expect, it, vi } from "vitest"
+import { PageArg, useEndInView, usePagedEntries } from "./pages"
+import { useSelection } from "./selection"
+
+const page = (index: number, ids: string[]): PageArg => ({
+  index,
+  items: Object.fromEntries(ids.map((id) => [id, { label: id }])),
+})
+
+// The paged source as MyComponent wires it: entries, then the selection
+const usePagedSelection = (current: PageArg, initialIds: string[]) => {
+  const { entries } = usePagedEntries(current)
+  const itemIds = useMemo(() => entries.map(([itemId]) => itemId), [entries])
+  const indexById = useMemo(() => new Map(itemIds.map((itemId, index) => [itemId, index])), [itemIds])
+  return useSelection(itemIds, indexById, initialIds)
+}
+
+describe("paged selection", () => {
+  it("selects initially selected ids once their page is delivered", () => {
+    const { result, rerender } = renderHook(
+      ({ current }) => usePagedSelection(current, ["a", "d"]),
+      { initialProps: { current: page(0, ["a", "b"]) } }
+    )
+    expect(Array.from(result.current[0])).toEqual([0])
+    expect(result.current[2]).toEqual(["d"])
+
+    rerender({ current: page(1, ["c", "d"]) })
+
+    expect(Array.from(result.current[0])).toEqual([0, 3])
+    expect(result.current[2]).toEqual([])
+  })
+})
+
+describe("useEndInView", () => {
+  type Callback = (entries: Array<{ isIntersecting: boolean }>) => void
+  let notify: Callback = () => undefined
+  let roots: Array<Element | null | undefined> = []
+
+  const endMarker = (): RefObject<HTMLDivElement> => {
+    const ref = createRef<HTMLDivElement>() as { current: HTMLDivElement }
+    ref.current = document.createElement("div")
+    return ref
+  }
+
+  const stubObserver = () => {
+    roots = []
+    vi.stubGlobal("IntersectionObserver", class {
+      constructor(callback: Callback, options: { root?: Element | null } = {}) {
+        notify = callback
+        roots.push(options.root)
+      }
+      observe() {}
+      disconnect() {}
+    })
+  }
+
+  afterEach(() => {
+    vi.unstubAllGlobals()
+  })
+
+  it("follows the marker against the browser viewport", () => {
+    stubObserver()
+    const marker = endMarker()
+    const { result } = renderHook(() => useEndInView(marker, true))
+    expect(result.current).toBe(false)
+    expect(roots).toEqual([undefined])
+
+    act(() => notify([{ isIntersecting: true }]))
+    expect(result.current).toBe(true)
+    act(() => notify([{ isIntersecting: false }]))
+    expect(result.current).toBe(false)
+  })
+
+  it("watches nothing while disabled", () => {
+    stubObserver()
+    const marker = endMarker()
+    const { result } = renderHook(() => useEndInView(marker, false))
+    expect(roots).toEqual([])
+    expect(result.current).toBe(false)
+  })
+})
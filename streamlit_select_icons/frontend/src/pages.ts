@@ -0,0 +1,70 @@
+import { RefObject, useEffect, useMemo, useRef, useState } from "react"
+import { CatalogEntry, entriesFromItems, ItemsMap } from "./catalog"
+
+// One page of a paginated item source, as sent by the Python side
+export type PageArg = {
+  index: number
+  items: ItemsMap
+  item_order?: string[]  // Dict order, when it differs from object key order
+}
+
+export type PagedEntries = {
+  entries: CatalogEntry[]
+  loadedPages: number  // Pages available contiguously from page 0
+}
+
+// Cache every page received from Python for the lifetime of the component,
+// so scrolling back never re-fetches a page. Entries are the pages that are
+// contiguous from page 0, in order; item indices stay stable as pages are
+// appended, so the selection carries across pages.
+export const usePagedEntries = (page: PageArg | null | undefined): PagedEntries => {
+  const cache = useRef(new Map<number, CatalogEntry[]>())
+  if (page && !cache.current.has(page.index)) {
+    cache.current.set(page.index, entriesFromItems(page.items, page.item_order))
+  }
+
+  let loadedPages = 0
+  while (cache.current.has(loadedPages)) loadedPages++
+
+  const entries = useMemo(() => {
+    const contiguous: CatalogEntry[] = []
+    for (let index = 0; index < loadedPages; index++) {
+      contiguous.push(...(cache.current.get(index) as CatalogEntry[]))
+    }
+    return contiguous
+  }, [loadedPages])
+
+  return { entries, loadedPages }
+}
+
+// Start requesting the next page this far before the end of the grid
+// scrolls into view
+const END_MARGIN = "200px"
+
+// Whether `ref`, an element after the last card, is near the browser
+// viewport. A grid without a fixed height grows to fit its cards and never
+// scrolls itself, so the page's own scrolling decides when its end is near.
+// Without IntersectionObserver the end always counts as near.
+export const useEndInView = (ref: RefObject<HTMLElement>, enabled: boolean): boolean => {
+  const [inView, setInView] = useState(false)
+
+  useEffect(() => {
+    const element = ref.current
+    if (!enabled || !element) return
+    if (typeof IntersectionObserver === "undefined") {
+      setInView(true)
+      return
+    }
+    const observer = new IntersectionObserver(
+      entries => setInView(entries[entries.length - 1].isIntersecting),
+      { rootMargin: END_MARGIN }
+    )
+    observer.observe(element)
+    return () => {
+      observer.disconnect()
+      setInView(false)
+    }
+  }, [ref, enabled])
+
+  return enabled && inView
+}
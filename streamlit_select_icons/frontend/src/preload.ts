@@ -0,0 +1,33 @@
+import { useLayoutEffect } from "react"
+import { resolveIconSrc, resolveIconSrcSet } from "./iconSrc"
+
+// Icons of the first screen, listed by Python with `fingerprint_icons`
+export type PreloadIcon = {
+  src: string
+  srcset?: Array<[string, number]>
+}
+
+// URLs already given a <link rel="preload">, for the life of the frame
+const preloaded = new Set<string>()
+
+// Start fetching the first screen's icons as soon as the args arrive, before
+// the grid has laid out and the cards' lazy images have asked for them.
+// Links stay in the head: fingerprinted URLs never change content, so
+// keeping them is harmless, and reruns with the same icons add nothing.
+export const usePreloadIcons = (icons?: PreloadIcon[]): void => {
+  useLayoutEffect(() => {
+    if (!icons) return
+    for (const icon of icons) {
+      const href = resolveIconSrc(icon.src)
+      if (!href || preloaded.has(href)) continue
+      preloaded.add(href)
+      const link = document.createElement("link")
+      link.rel = "preload"
+      link.as = "image"
+      link.href = href
+      const srcset = resolveIconSrcSet(icon.srcset)
+      if (srcset) link.setAttribute("imagesrcset", srcset)
+      document.head.appendChild(link)
+    }
+  }, [icons])
+}
@@ -0,0 +1,80 @@
+import { useCallback, useLayoutEffect, useMemo, useRef } from "react"
+
+// Metrics posted with the component value when `select_icons(profile=True)`
+export type FrontendMetrics = {
+  mount_ms?: number         // First render through DOM commit
+  render_ms?: number        // Latest re-render through DOM commit
+  cards_rendered: number    // Cards mounted in the latest render
+  args_bytes: number        // Size of the args received from Python
+  click_to_post_ms?: number // From the click to posting the value that carries it
+}
+
+export type Profiler = {
+  recordCards: (count: number) => void
+  markClick: () => void
+  takeMetrics: () => FrontendMetrics | undefined
+}
+
+const encoder = new TextEncoder()
+
+// Bytes args (such as an `IconCatalog` payload) are counted as sent; the
+// rest as the JSON Streamlit encodes them in
+const argsSize = (args: Record<string, unknown>): number => {
+  let bytes = 0
+  const json: Record<string, unknown> = {}
+  for (const [name, value] of Object.entries(args)) {
+    if (ArrayBuffer.isView(value)) {
+      bytes += value.byteLength
+    } else {
+      json[name] = value
+    }
+  }
+  return bytes + encoder.encode(JSON.stringify(json)).length
+}
+
+const round = (ms: number): number => Math.round(ms * 1000) / 1000
+
+// Opt-in render timing. Call it first thing in the component's render: the
+// layout effect runs once the whole tree, memoized cards included, has been
+// committed to the DOM. Metrics only ride along with values that are posted
+// anyway, so profiling never triggers a rerun by itself.
+export const useProfiler = (enabled: boolean, args: Record<string, unknown>): Profiler => {
+  const renderStart = enabled ? performance.now() : 0
+  const state = useRef<{ mountMs?: number; renderMs?: number; clickAt?: number; cards: number }>({ cards: 0 })
+  const argsBytes = useMemo(() => enabled ? argsSize(args) : 0, [enabled, args])
+  const argsBytesRef = useRef(argsBytes)
+  argsBytesRef.current = argsBytes
+
+  useLayoutEffect(() => {
+    if (!enabled) return
+    const duration = performance.now() - renderStart
+    if (state.current.mountMs === undefined) {
+      state.current.mountMs = duration
+    } else {
+      state.current.renderMs = duration
+    }
+  })
+
+  const recordCards = useCallback((count: number) => {
+    state.current.cards = count
+  }, [])
+
+  const markClick = useCallback(() => {
+    if (enabled) state.current.clickAt = performance.now()
+  }, [enabled])
+
+  const takeMetrics = useCallback((): FrontendMetrics | undefined => {
+    if (!enabled) return undefined
+    const { mountMs, renderMs, clickAt, cards } = state.current
+    state.current.clickAt = undefined
+    return {
+      ...(mountMs !== undefined ? { mount_ms: round(mountMs) } : {}),
+      ...(renderMs !== undefined ? { render_ms: round(renderMs) } : {}),
+      cards_rendered: cards,
+      args_bytes: argsBytesRef.current,
+      ...(clickAt !== undefined ? { click_to_post_ms: round(performance.now() - clickAt) } : {}),
+    }
+  }, [enabled])
+
+  return { recordCards, markClick, takeMetrics }
+}
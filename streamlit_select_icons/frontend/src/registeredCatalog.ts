@@ -0,0 +1,94 @@
+import { useEffect, useState } from "react"
+import { parseCatalogJson, ParsedCatalog } from "./catalog"
+import { resolveIconSrc } from "./iconSrc"
+
+// A catalog registered with `register_catalog`, written by Python to a
+// static file named by its content hash
+export type CatalogRef = {
+  id: string
+  hash: string
+  url: string
+}
+
+const STORAGE_PREFIX = "ssi-catalog:"
+
+// Every component instance runs in its own iframe, so the in-memory cache
+// only spans reruns of one instance. Session storage is shared by all
+// same-origin iframes of the tab: the first instance fetches the catalog and
+// the others read it from there.
+const loading = new Map<string, Promise<ParsedCatalog>>()
+
+const readStored = (hash: string): string | null => {
+  try {
+    return window.sessionStorage.getItem(STORAGE_PREFIX + hash)
+  } catch {
+    return null  // Storage disabled
+  }
+}
+
+const store = (hash: string, text: string): void => {
+  try {
+    window.sessionStorage.setItem(STORAGE_PREFIX + hash, text)
+  } catch {
+    // Over quota or disabled: the browser's HTTP cache still serves the file
+  }
+}
+
+const fetchCatalog = async (ref: CatalogRef): Promise<ParsedCatalog> => {
+  const stored = readStored(ref.hash)
+  if (stored !== null) return parseCatalogJson(stored)
+  const url = resolveIconSrc(ref.url)
+  if (!url) throw new Error(`Invalid catalog URL ${ref.url}`)
+  const response = await fetch(url)
+  if (!response.ok) throw new Error(`Fetching catalog ${ref.id} failed: ${response.status}`)
+  const text = await response.text()
+  store(ref.hash, text)
+  return parseCatalogJson(text)
+}
+
+export const loadRegisteredCatalog = (ref: CatalogRef): Promise<ParsedCatalog> => {
+  let promise = loading.get(ref.hash)
+  if (!promise) {
+    promise = fetchCatalog(ref)
+    // Let a later rerun retry a failed fetch
+    promise.catch(() => loading.delete(ref.hash))
+    loading.set(ref.hash, promise)
+  }
+  return promise
+}
+
+export type RegisteredCatalogState = {
+  catalog?: ParsedCatalog  // Undefined while loading or after a failure
+  error?: string           // Why the catalog could not be loaded
+}
+
+// The parsed catalog for `ref`, or an error if it could not be fetched.
+// Both are empty while it loads. Parsing happens once per content hash,
+// not on every rerun.
+export const useRegisteredCatalog = (ref: CatalogRef | null | undefined): RegisteredCatalogState => {
+  const [loaded, setLoaded] = useState<{ hash: string } & RegisteredCatalogState | undefined>(undefined)
+  const hash = ref?.hash
+  const id = ref?.id
+  const url = ref?.url
+
+  useEffect(() => {
+    if (!hash || !id || !url) return
+    let cancelled = false
+    loadRegisteredCatalog({ id, hash, url }).then(
+      catalog => {
+        if (!cancelled) setLoaded({ hash, catalog })
+      },
+      error => {
+        console.error(error)
+        if (!cancelled) setLoaded({ hash, error: error instanceof Error ? error.message : String(error) })
+      }
+    )
+    return () => {
+      cancelled = true
+    }
+  }, [hash, id, url])
+
+  return loaded && loaded.hash === hash ? loaded : NOT_LOADED
+}
+
+const NOT_LOADED: RegisteredCatalogState = {}
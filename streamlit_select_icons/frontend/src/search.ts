@@ -0,0 +1,75 @@
+import { CatalogEntry } from "./catalog"
+
+// Prefix index over the tokens of each item's label and searchable
+// properties: a sorted token list and, for each token, the sorted indices
+// of the items containing it. Built once per catalog here, or prebuilt on
+// the Python side (`IconCatalog.from_items(..., search_index=True)`).
+export type SearchIndex = {
+  tokens: string[]
+  postings: number[][]
+}
+
+// Must match `tokenize` in streamlit_select_icons/_search.py
+export const tokenize = (text: string): string[] =>
+  text.toLowerCase().split(/[^\p{L}\p{N}]+/u).filter(Boolean)
+
+const itemSearchText = ([, item]: CatalogEntry): string =>
+  item.search_text ? `${item.label} ${item.search_text}` : item.label
+
+export const buildSearchIndex = (entries: readonly CatalogEntry[]): SearchIndex => {
+  const postingsByToken = new Map<string, number[]>()
+  entries.forEach((entry, index) => {
+    for (const token of new Set(tokenize(itemSearchText(entry)))) {
+      const postings = postingsByToken.get(token)
+      if (postings) {
+        postings.push(index)
+      } else {
+        postingsByToken.set(token, [index])
+      }
+    }
+  })
+  const tokens = Array.from(postingsByToken.keys()).sort()
+  return { tokens, postings: tokens.map(token => postingsByToken.get(token) as number[]) }
+}
+
+// First position in the sorted token list that is >= `prefix`
+const lowerBound = (tokens: readonly string[], prefix: string): number => {
+  let low = 0
+  let high = tokens.length
+  while (low < high) {
+    const mid = (low + high) >>> 1
+    if (tokens[mid] < prefix) {
+      low = mid + 1
+    } else {
+      high = mid
+    }
+  }
+  return low
+}
+
+// Return the indices (in catalog order) of items that have, for every
+// query token, some token starting with it. Each query token costs a
+// binary search plus one pass over the postings it matches.
+export const searchItems = (index: SearchIndex, query: string, itemCount: number): number[] => {
+  const queryTokens = tokenize(query)
+  if (queryTokens.length === 0) {
+    return Array.from({ length: itemCount }, (_, i) => i)
+  }
+
+  // hits[i] counts the query tokens item i has matched so far
+  const hits = new Uint8Array(itemCount)
+  queryTokens.forEach((queryToken, round) => {
+    for (let t = lowerBound(index.tokens, queryToken); t < index.tokens.length; t++) {
+      if (!index.tokens[t].startsWith(queryToken)) break
+      for (const item of index.postings[t]) {
+        if (hits[item] === round) hits[item] = round + 1
+      }
+    }
+  })
+
+  const matches: number[] = []
+  for (let i = 0; i < itemCount; i++) {
+    if (hits[i] === queryTokens.length) matches.push(i)
+  }
+  return matches
+}
@@ -0,0 +1,104 @@
+import { act, renderHook } from "@testing-library/react"
+import { describe, expect, it } from "vitest"
+import { applyBulkAction, encodeSelection, sameMembers, selectRange, toggleSelection, useSelection } from "./selection"
+
+const sorted = (selection: ReadonlySet<number>): number[] => Array.from(selection).sort((a, b) => a - b)
+
+describe("selectRange", () => {
+  it("adds every item between the anchor and the click in catalog order", () => {
+    expect(sorted(selectRange(new Set([9]), 5, 2))).toEqual([2, 3, 4, 5, 9])
+  })
+
+  it("follows the display order when one is given", () => {
+    const order = [7, 3, 5, 1]
+    expect(sorted(selectRange(new Set(), 3, 1, order))).toEqual([1, 3, 5])
+  })
+
+  it("starts at the clicked item when the anchor is no longer shown", () => {
+    expect(sorted(selectRange(new Set(), 8, 5, [7, 3, 5, 1]))).toEqual([5])
+  })
+})
+
+describe("applyBulkAction", () => {
+  it("selects, clears and inverts all items", () => {
+    const selection = new Set([1, 3])
+    expect(sorted(applyBulkAction(selection, "all", 5))).toEqual([0, 1, 2, 3, 4])
+    expect(sorted(applyBulkAction(selection, "none", 5))).toEqual([])
+    expect(sorted(applyBulkAction(selection, "invert", 5))).toEqual([0, 2, 4])
+  })
+
+  it("only touches the shown items", () => {
+    const selection = new Set([1, 3])
+    const shown = [0, 1]
+    expect(sorted(applyBulkAction(selection, "all", 5, shown))).toEqual([0, 1, 3])
+    expect(sorted(applyBulkAction(selection, "none", 5, shown))).toEqual([3])
+    expect(sorted(applyBulkAction(selection, "invert", 5, shown))).toEqual([0, 3])
+  })
+
+  it("returns a new set", () => {
+    const selection = new Set([1])
+    expect(applyBulkAction(selection, "all", 2)).not.toBe(selection)
+  })
+})
+
+describe("sameMembers", () => {
+  it("ignores identity and order", () => {
+    const committed = new Set([1, 3])
+    const toggledBack = toggleSelection(toggleSelection(committed, 2, true), 2, true)
+    expect(toggledBack).not.toBe(committed)
+    expect(sameMembers(toggledBack, committed)).toBe(true)
+    expect(sameMembers(new Set([3, 1]), committed)).toBe(true)
+  })
+
+  it("tells selections with different items apart", () => {
+    expect(sameMembers(new Set([1, 2]), new Set([1, 3]))).toBe(false)
+    expect(sameMembers(new Set([1]), new Set([1, 3]))).toBe(false)
+  })
+})
+
+const indexOf = (ids: string[]): Map<string, number> => new Map(ids.map((id, index) => [id, index]))
+
+describe("useSelection", () => {
+  it("keeps selected ids that are not among the items and posts them", () => {
+    const itemIds = ["a", "b"]
+    const { result } = renderHook(() => useSelection(itemIds, indexOf(itemIds), ["hidden", "b"]))
+
+    const [selection, , unresolved] = result.current
+    expect(Array.from(selection)).toEqual([1])
+    expect(unresolved).toEqual(["hidden"])
+    expect(encodeSelection(selection, itemIds, "ids", unresolved)).toEqual({ selected_items: ["b", "hidden"] })
+    expect(encodeSelection(selection, itemIds, "ranges", unresolved)).toEqual({
+      selected_ranges: [[1, 2]],
+      unresolved_items: ["hidden"],
+    })
+  })
+
+  it("carries ids that leave the items and selects them again when they return", () => {
+    const all = ["a", "b", "c"]
+    const filtered = ["a", "c"]
+    const { result, rerender } = renderHook(
+      ({ itemIds }) => useSelection(itemIds, indexOf(itemIds), ["b", "c"]),
+      { initialProps: { itemIds: all } }
+    )
+
+    rerender({ itemIds: filtered })
+    expect(Array.from(result.current[0])).toEqual([1])
+    expect(result.current[2]).toEqual(["b"])
+
+    rerender({ itemIds: all })
+    expect(Array.from(result.current[0])).toEqual([2, 1])
+    expect(result.current[2]).toEqual([])
+  })
+
+  it("lets a single selection replace the hidden ones", () => {
+    const itemIds = ["a", "b"]
+    const { result } = renderHook(() => useSelection(itemIds, indexOf(itemIds), ["hidden"]))
+    const before = result.current[0]
+
+    act(() => result.current[1](prev => toggleSelection(prev, 0, false), []))
+
+    expect(Array.from(result.current[0])).toEqual([0])
+    expect(result.current[2]).toEqual([])
+    expect(result.current[0]).not.toBe(before)
+  })
+})
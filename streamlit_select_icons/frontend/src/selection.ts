@@ -0,0 +1,257 @@
+import { useCallback, useState } from "react"
+
+// Selection state is a set of item indices into the catalog order. Sets keep
+// insertion order, so iterating one yields items in the order they were
+// selected, matching the list of ids the component has always returned.
+export type Selection = ReadonlySet<number>
+
+export type SelectionEncoding = "ids" | "ranges" | "bitset"
+
+export const selectionFromIds = (
+  ids: readonly string[],
+  indexById: ReadonlyMap<string, number>
+): Set<number> => {
+  const selection = new Set<number>()
+  for (const id of ids) {
+    const index = indexById.get(id)
+    if (index !== undefined) selection.add(index)
+  }
+  return selection
+}
+
+// Selected ids that are not among the current items, kept in selection order
+export const unresolvedIds = (
+  ids: readonly string[],
+  indexById: ReadonlyMap<string, number>
+): string[] => ids.filter(id => !indexById.has(id))
+
+export const selectionToIds = (
+  selection: Selection,
+  itemIds: readonly string[]
+): string[] => {
+  const ids: string[] = []
+  selection.forEach(index => {
+    if (index < itemIds.length) ids.push(itemIds[index])
+  })
+  return ids
+}
+
+// Toggle one item. Returns a new set so React sees the change; membership
+// checks stay O(1) regardless of how many items are selected.
+export const toggleSelection = (
+  selection: Selection,
+  index: number,
+  multiSelect: boolean
+): Set<number> => {
+  if (!multiSelect) return new Set([index])
+  const next = new Set(selection)
+  if (next.has(index)) {
+    next.delete(index)
+  } else {
+    next.add(index)
+  }
+  return next
+}
+
+// Shift-click: add every item shown between the anchor (the previous
+// click) and `index`. `order` lists the shown items in display order when
+// it differs from the catalog order (search, `visible` or groups).
+export const selectRange = (
+  selection: Selection,
+  anchor: number,
+  index: number,
+  order?: readonly number[]
+): Set<number> => {
+  const next = new Set(selection)
+  if (!order) {
+    for (let i = Math.min(anchor, index); i <= Math.max(anchor, index); i++) next.add(i)
+    return next
+  }
+  const end = order.indexOf(index)
+  // An anchor that is no longer shown starts the range at the clicked item
+  const start = anchor === index ? end : order.indexOf(anchor)
+  const from = start < 0 ? end : Math.min(start, end)
+  const to = start < 0 ? end : Math.max(start, end)
+  for (let position = from; position <= to; position++) next.add(order[position])
+  return next
+}
+
+export type BulkAction = "all" | "none" | "invert"
+
+// Select, clear or invert every shown item (`order`, or all `itemCount`
+// items) in one pass, producing a single state change and a single commit
+export const applyBulkAction = (
+  selection: Selection,
+  action: BulkAction,
+  itemCount: number,
+  order?: readonly number[]
+): Set<number> => {
+  if (action === "none" && !order) return new Set()
+  const next = new Set(selection)
+  const apply = (index: number): void => {
+    if (action === "all") {
+      next.add(index)
+    } else if (action === "none" || next.has(index)) {
+      next.delete(index)
+    } else {
+      next.add(index)
+    }
+  }
+  if (order) {
+    for (const index of order) apply(index)
+  } else {
+    for (let index = 0; index < itemCount; index++) apply(index)
+  }
+  return next
+}
+
+const sortedIndices = (selection: Selection): number[] =>
+  Array.from(selection).sort((a, b) => a - b)
+
+// Half-open [start, end) runs over the catalog order
+export const encodeRanges = (selection: Selection): Array<[number, number]> => {
+  const ranges: Array<[number, number]> = []
+  for (const index of sortedIndices(selection)) {
+    const last = ranges[ranges.length - 1]
+    if (last && last[1] === index) {
+      last[1] = index + 1
+    } else {
+      ranges.push([index, index + 1])
+    }
+  }
+  return ranges
+}
+
+// Base64 bitmap over the catalog order; bit i lives in byte i >> 3 at
+// position i & 7 (least significant bit first).
+export const encodeBitset = (selection: Selection, itemCount: number): string => {
+  const bytes = new Uint8Array(Math.ceil(itemCount / 8))
+  selection.forEach(index => {
+    if (index < itemCount) bytes[index >> 3] |= 1 << (index & 7)
+  })
+  let binary = ""
+  for (let i = 0; i < bytes.length; i += 0x8000) {
+    binary += String.fromCharCode(...bytes.subarray(i, i + 0x8000))
+  }
+  return btoa(binary)
+}
+
+// Build the value posted back to Python for the requested wire encoding.
+// Unresolved ids can't be indexed, so the compact encodings list them apart.
+export const encodeSelection = (
+  selection: Selection,
+  itemIds: readonly string[],
+  encoding: SelectionEncoding,
+  unresolved: readonly string[] = []
+): Record<string, unknown> => {
+  const extra = unresolved.length > 0 ? { unresolved_items: unresolved } : {}
+  switch (encoding) {
+    case "ranges":
+      return { selected_ranges: encodeRanges(selection), ...extra }
+    case "bitset":
+      return { selected_bitset: encodeBitset(selection, itemIds.length), ...extra }
+    default:
+      return { selected_items: [...selectionToIds(selection, itemIds), ...unresolved] }
+  }
+}
+
+type SelectionState = {
+  itemIds: readonly string[]
+  selection: Selection
+  // Selected ids missing from the items: hidden by the script, or on pages
+  // not delivered yet. They are posted back and selected once they appear.
+  unresolved: readonly string[]
+}
+
+export const sameIds = (a: readonly string[], b: readonly string[]): boolean =>
+  a.length === b.length && a.every((id, i) => id === b[i])
+
+// Whether two selections hold the same items, in any order
+export const sameMembers = (a: Selection, b: Selection): boolean => {
+  if (a === b) return true
+  if (a.size !== b.size) return false
+  for (const index of a) {
+    if (!b.has(index)) return false
+  }
+  return true
+}
+
+const sameSelection = (a: Selection, b: Selection): boolean => {
+  if (a.size !== b.size) return false
+  const left = a.values()
+  for (const index of b) {
+    if (left.next().value !== index) return false
+  }
+  return true
+}
+
+// Adopt a selection sent from Python. Items that stay selected keep their
+// click order and new ones are appended; the set keeps its identity if
+// nothing changed.
+export const reconcileSelection = (
+  selection: Selection,
+  ids: readonly string[],
+  indexById: ReadonlyMap<string, number>
+): Selection => {
+  const target = selectionFromIds(ids, indexById)
+  const next = new Set<number>()
+  selection.forEach(index => {
+    if (target.has(index)) next.add(index)
+  })
+  target.forEach(index => next.add(index))
+  return sameSelection(next, selection) ? selection : next
+}
+
+// Replace the selection and the unresolved ids. A change to the unresolved
+// ids alone still yields a new set, so effects keyed on it post the value.
+export type SelectionUpdate = (
+  update: (prev: Selection) => Selection,
+  unresolved?: readonly string[]
+) => void
+
+// Selection state keyed by item index. When the catalog changes between
+// reruns, the selection is carried over by id; ids that are no longer in the
+// catalog are kept as unresolved, and unresolved ids that appear (such as
+// the items of a newly delivered page) are selected again. The set keeps its
+// identity if nothing moved, so effects that depend on it don't fire on
+// every rerun.
+export const useSelection = (
+  itemIds: readonly string[],
+  indexById: ReadonlyMap<string, number>,
+  initialIds: readonly string[]
+): [Selection, SelectionUpdate, readonly string[]] => {
+  const [state, setState] = useState<SelectionState>(() => ({
+    itemIds,
+    selection: selectionFromIds(initialIds, indexById),
+    unresolved: unresolvedIds(initialIds, indexById),
+  }))
+
+  let current = state
+  if (state.itemIds !== itemIds) {
+    const ids = [...selectionToIds(state.selection, state.itemIds), ...state.unresolved]
+    const remapped = selectionFromIds(ids, indexById)
+    const unresolved = unresolvedIds(ids, indexById)
+    const unchanged = sameSelection(remapped, state.selection) && sameIds(unresolved, state.unresolved)
+    current = unchanged
+      ? { ...state, itemIds }
+      : { itemIds, selection: remapped, unresolved }
+    // Adjusting state during render: React re-renders before committing
+    setState(current)
+  }
+
+  const updateSelection: SelectionUpdate = useCallback((update, unresolved) => {
+    setState(prev => {
+      const selection = update(prev.selection)
+      if (unresolved === undefined || sameIds(unresolved, prev.unresolved)) {
+        return { itemIds: prev.itemIds, selection, unresolved: prev.unresolved }
+      }
+      return {
+        itemIds: prev.itemIds,
+        selection: selection === prev.selection ? new Set(selection) : selection,
+        unresolved,
+      }
+    })
+  }, [])
+
+  return [current.selection, updateSelection, current.unresolved]
+}
@@ -0,0 +1,47 @@
+import { useRef } from "react"
+import { CatalogEntry } from "./catalog"
+
+// Structural equality for JSON args: Streamlit re-sends them on every rerun
+// as freshly parsed objects, so identity alone says nothing
+export const sameJson = (a: unknown, b: unknown): boolean => {
+  if (a === b) return true
+  if (typeof a !== "object" || typeof b !== "object" || a === null || b === null) return false
+  if (Array.isArray(a)) {
+    return Array.isArray(b) && a.length === b.length && a.every((value, i) => sameJson(value, b[i]))
+  }
+  if (Array.isArray(b)) return false
+  const aKeys = Object.keys(a)
+  const bRecord = b as Record<string, unknown>
+  return aKeys.length === Object.keys(b).length &&
+    aKeys.every(key => key in bRecord && sameJson((a as Record<string, unknown>)[key], bRecord[key]))
+}
+
+// Keep the previous value of an arg (and everything memoized on it, down to
+// the memoized cards) while its contents are unchanged
+export const useStableArg = <T,>(value: T): T => {
+  const previous = useRef(value)
+  if (previous.current !== value && !sameJson(previous.current, value)) {
+    previous.current = value
+  }
+  return previous.current
+}
+
+// Items sent as a plain dict are re-parsed on every rerun. Unchanged items
+// keep their previous objects, so their cards skip re-rendering, and the
+// entries keep their identity if no item changed or moved.
+export const useStableEntries = (entries: CatalogEntry[]): CatalogEntry[] => {
+  const previous = useRef(entries)
+  if (previous.current !== entries) {
+    const previousItems = new Map(previous.current)
+    let unchanged = entries.length === previous.current.length
+    const next = entries.map((entry, i): CatalogEntry => {
+      const [itemId, item] = entry
+      const previousItem = previousItems.get(itemId)
+      const kept = previousItem !== undefined && sameJson(previousItem, item)
+      unchanged = unchanged && kept && previous.current[i][0] === itemId
+      return kept ? [itemId, previousItem] : entry
+    })
+    if (!unchanged) previous.current = next
+  }
+  return previous.current
+}
@@ -0,0 +1,124 @@
+import { RefObject, useEffect, useState } from "react"
+
+// Number of extra tracks (rows in column layout, columns in row layout)
+// mounted on each side of the visible window so fast scrolling doesn't
+// reveal empty cells before the next frame.
+export const OVERSCAN_TRACKS = 2
+
+export type Viewport = {
+  scrollTop: number
+  scrollLeft: number
+  width: number
+  height: number
+}
+
+// Half-open range [start, end) of item indices to mount
+export type GridWindow = {
+  start: number
+  end: number
+}
+
+export type GridWindowOptions = {
+  itemCount: number
+  lanes: number        // Cards per track: columns in column layout, rows in row layout
+  trackSize: number    // Card extent along the scroll axis, in pixels
+  gap: number
+  padding: number
+  scrollOffset: number // scrollTop (column layout) or scrollLeft (row layout)
+  viewportSize: number // clientHeight (column layout) or clientWidth (row layout)
+  overscan?: number
+}
+
+export const computeGridWindow = ({
+  itemCount,
+  lanes,
+  trackSize,
+  gap,
+  padding,
+  scrollOffset,
+  viewportSize,
+  overscan = OVERSCAN_TRACKS,
+}: GridWindowOptions): GridWindow => {
+  if (itemCount <= 0) return { start: 0, end: 0 }
+  const lanesPerTrack = Math.max(1, lanes)
+  const trackCount = Math.ceil(itemCount / lanesPerTrack)
+  const pitch = trackSize + gap
+  const firstTrack = Math.max(0, Math.floor((scrollOffset - padding) / pitch) - overscan)
+  const lastTrack = Math.min(
+    trackCount - 1,
+    Math.floor((scrollOffset + viewportSize - padding) / pitch) + overscan
+  )
+  if (lastTrack < firstTrack) return { start: 0, end: 0 }
+  return {
+    start: firstTrack * lanesPerTrack,
+    end: Math.min(itemCount, (lastTrack + 1) * lanesPerTrack),
+  }
+}
+
+// Explicit grid placement for the item at `index`, matching the order the
+// browser would use with grid-auto-flow (row-major for "column" layout,
+// column-major for "row" layout). Explicit placement lets us skip mounting
+// cards outside the window without the remaining cards shifting into the gaps.
+export const gridPlacement = (
+  index: number,
+  lanes: number,
+  layout: string
+): { gridRow: number; gridColumn: number } => {
+  const lanesPerTrack = Math.max(1, lanes)
+  const track = Math.floor(index / lanesPerTrack) + 1
+  const lane = (index % lanesPerTrack) + 1
+  return layout === "row"
+    ? { gridColumn: track, gridRow: lane }
+    : { gridRow: track, gridColumn: lane }
+}
+
+// Track the scroll position and client size of a scroll container.
+// Scroll and resize events are coalesced to one update per animation frame.
+export const useScrollViewport = (ref: RefObject<HTMLElement>): Viewport => {
+  const [viewport, setViewport] = useState<Viewport>(() => ({
+    scrollTop: 0,
+    scrollLeft: 0,
+    width: typeof window !== "undefined" ? window.innerWidth : 0,
+    height: typeof window !== "undefined" ? window.innerHeight : 0,
+  }))
+
+  useEffect(() => {
+    const element = ref.current
+    if (!element) return
+
+    let frame = 0
+    const measure = () => {
+      frame = 0
+      setViewport(prev => {
+        const next: Viewport = {
+          scrollTop: element.scrollTop,
+          scrollLeft: element.scrollLeft,
+          width: element.clientWidth,
+          height: element.clientHeight,
+        }
+        return prev.scrollTop === next.scrollTop &&
+          prev.scrollLeft === next.scrollLeft &&
+          prev.width === next.width &&
+          prev.height === next.height
+          ? prev
+          : next
+      })
+    }
+    const schedule = () => {
+      if (!frame) frame = requestAnimationFrame(measure)
+    }
+
+    measure()
+    element.addEventListener("scroll", schedule, { passive: true })
+    const observer = typeof ResizeObserver !== "undefined" ? new ResizeObserver(schedule) : undefined
+    observer?.observe(element)
+
+    return () => {
+      element.removeEventListener("scroll", schedule)
+      observer?.disconnect()
+      if (frame) cancelAnimationFrame(frame)
+    }
+  }, [ref])
+
+  return viewport
+}
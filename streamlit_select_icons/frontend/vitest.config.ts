@@ -0,0 +1,13 @@
+import { defineConfig } from "vitest/config"
+import react from "@vitejs/plugin-react-swc"
+
+/**
+ * Vitest configuration for the component's unit tests (`npm test`)
+ */
+export default defineConfig({
+  plugins: [react()],
+  test: {
+    environment: "jsdom",
+    include: ["src/**/*.test.{ts,tsx}"],
+  },
+})
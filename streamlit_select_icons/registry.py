@@ -0,0 +1,97 @@
+"""Catalogs registered once and referenced by id from many `select_icons` calls.
+
+A registered catalog is written to the static folder as a JSON file named by
+its content hash. Components referencing it receive only that id and URL;
+the browser fetches the file once and caches it for the session, so pages
+with many selectors over the same items ship the catalog a single time.
+
+The registry keeps the `MAX_CATALOGS` most recently used catalogs. Older
+ones are dropped along with the static files no other catalog serves, so apps that register
+catalogs built on the fly don't grow without bound.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Set
+
+from ._static import DEFAULT_CACHE_DIR, served_path, write_atomic
+from .catalog import IconCatalog
+
+# Registered catalogs kept at most; the least recently used go first
+MAX_CATALOGS = 64
+
+# Registered catalogs by id, least recently used first, and the static
+# files written for each. Files are named by the rendered payload's hash,
+# which catalogs differing only in properties share, so each file also
+# counts the catalogs serving it.
+_REGISTERED: "OrderedDict[str, IconCatalog]" = OrderedDict()
+_FILES: Dict[str, Set[Path]] = {}
+_FILE_USERS: Dict[Path, int] = {}
+_LOCK = threading.Lock()
+
+
+def register_catalog(
+    items: "Mapping[str, Mapping[str, Any]]",
+    *,
+    search_properties: Optional[Sequence[str]] = None,
+    search_index: bool = False,
+) -> str:
+    """Register an items dict (or `IconCatalog`) and return its catalog id.
+
+    Pass the id as `select_icons(catalog=catalog_id)`. Registering the same
+    content again returns the same id, but validates, serializes and hashes
+    the items each time; register inside `st.cache_resource` (or pass an
+    `IconCatalog`, which is not rebuilt) to do that work once.
+    `search_properties` and `search_index` are as for
+    `IconCatalog.from_items`.
+    """
+    catalog = IconCatalog.from_items(items, search_properties=search_properties, search_index=search_index)
+    catalog_id = catalog.content_hash
+    with _LOCK:
+        _REGISTERED.setdefault(catalog_id, catalog)
+        _REGISTERED.move_to_end(catalog_id)
+        while len(_REGISTERED) > MAX_CATALOGS:
+            evicted, _ = _REGISTERED.popitem(last=False)
+            for file_path in _FILES.pop(evicted, ()):
+                _FILE_USERS[file_path] -= 1
+                if not _FILE_USERS[file_path]:
+                    del _FILE_USERS[file_path]
+                    file_path.unlink(missing_ok=True)
+    return catalog_id
+
+
+def registered_catalog(catalog_id: str) -> IconCatalog:
+    """Return the catalog registered under `catalog_id`.
+
+    Raises ValueError for ids that were not returned by `register_catalog`
+    in this process, or that were dropped as the least recently used.
+    """
+    with _LOCK:
+        catalog = _REGISTERED.get(catalog_id)
+        if catalog is not None:
+            _REGISTERED.move_to_end(catalog_id)
+    if catalog is None:
+        raise ValueError(f"Unknown catalog id {catalog_id!r}; register it with register_catalog()")
+    return catalog
+
+
+def catalog_file(catalog_id: str, payload: bytes, content_hash: str, cache_dir: str = DEFAULT_CACHE_DIR) -> str:
+    """Write a registered catalog's payload to the static folder once; return its URL path.
+
+    The file name carries the content hash, so browsers can cache it for
+    good and a changed catalog gets a new URL. The file is removed once no
+    catalog in the registry serves it.
+    """
+    file_path = Path(cache_dir) / f"catalog-{content_hash[:16]}.json"
+    disk_path = served_path(file_path)
+    if not disk_path.is_file():
+        write_atomic(disk_path, payload)
+    with _LOCK:
+        if catalog_id in _REGISTERED:
+            files = _FILES.setdefault(catalog_id, set())
+            if disk_path not in files:
+                files.add(disk_path)
+                _FILE_USERS[disk_path] = _FILE_USERS.get(disk_path, 0) + 1
+    return file_path.as_posix()
@@ -0,0 +1,164 @@
+"""Items given as a pandas DataFrame or pyarrow Table.
+
+The item columns are sent to the frontend as one Arrow IPC stream, so no
+per-row dict is built on the way. Any other columns are the items'
+properties; they stay in the table and are only read for grouping, search
+text, or when an item is looked up in the result's "items" mapping.
+"""
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ._groups import group_values
+
+# Columns describing an item; only "id" is required
+ITEM_COLUMNS = ("id", "label", "icon", "alt_text")
+
+
+def is_table(items: Any) -> bool:
+    """Return True if `items` is a pandas DataFrame or a pyarrow Table.
+
+    Checked by type name, so neither library is imported for other items.
+    """
+    cls = type(items)
+    package = cls.__module__.partition(".")[0]
+    return (package, cls.__name__) in (("pandas", "DataFrame"), ("pyarrow", "Table"))
+
+
+class TableItems(Mapping):
+    """A read-only mapping of item id -> item over a pyarrow Table.
+
+    Built by `select_icons` from a DataFrame or Arrow table; it is the
+    "items" entry of the result. Items are materialized one at a time, on
+    lookup, with the non-item columns as their properties.
+    """
+
+    __slots__ = ("table", "ids", "_index", "_groups")
+
+    def __init__(self, table: "Any", ids: List[str]):
+        # Use `TableItems.from_table`, which validates the columns
+        self.table = table
+        self.ids = ids
+        self._index: Optional[Dict[str, int]] = None
+        self._groups: Dict[str, List[Tuple[str, List[int]]]] = {}
+
+    @classmethod
+    def from_table(cls, data: Any) -> "TableItems":
+        """Wrap a DataFrame (converted to Arrow without its index) or Arrow table.
+
+        Raises ValueError if the "id" column is missing or has null or
+        duplicate ids, and TypeError if an item column does not hold strings.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+        if "id" not in table.column_names:
+            raise ValueError("Items table needs an 'id' column")
+        for name in ITEM_COLUMNS:
+            if name in table.column_names:
+                column_type = table.schema.field(name).type
+                if not (pa.types.is_string(column_type) or pa.types.is_large_string(column_type)
+                        or pa.types.is_null(column_type)):
+                    raise TypeError(f"Items table column {name!r} must hold strings, got {column_type}")
+        id_column = table.column("id")
+        if id_column.null_count or pc.count_distinct(id_column).as_py() != len(id_column):
+            raise ValueError("Items table 'id' column must hold unique, non-null ids")
+        return cls(table, id_column.to_pylist())
+
+    def payload(
+        self,
+        icon_updates: Optional[Callable[[Optional[str]], Dict[str, Any]]] = None,
+        search_properties: Optional[Sequence[str]] = None,
+    ) -> Tuple[bytes, str]:
+        """Return the Arrow IPC stream sent to the frontend and its hash.
+
+        The stream holds the item columns as 32-bit offset strings, which
+        every Arrow JS version reads. `icon_updates` maps an icon path to the
+        fields overriding it (called once per distinct icon), and
+        `search_properties` adds a "search_text" column from those columns.
+        """
+        import pyarrow as pa
+
+        columns = {
+            name: self.table.column(name).cast(pa.string())
+            for name in ITEM_COLUMNS
+            if name in self.table.column_names
+        }
+        if icon_updates is not None and "icon" in columns:
+            icons = columns["icon"].to_pylist()
+            updates = {icon: icon_updates(icon) for icon in set(icons)}
+            columns["icon"] = pa.array([updates[icon].get("icon", icon) for icon in icons], pa.string())
+            srcsets = [updates[icon].get("icon_srcset") for icon in icons]
+            if any(srcsets):
+                columns["icon_srcset"] = pa.array(
+                    [json.dumps(srcset, separators=(",", ":")) if srcset else None for srcset in srcsets],
+                    pa.string(),
+                )
+        if search_properties:
+            texts = self._search_texts(search_properties)
+            if any(texts):
+                columns["search_text"] = pa.array(texts, pa.string())
+
+        sink = pa.BufferOutputStream()
+        transport = pa.table(columns)
+        with pa.ipc.new_stream(sink, transport.schema) as writer:
+            writer.write_table(transport)
+        payload = sink.getvalue().to_pybytes()
+        return payload, hashlib.sha256(payload).hexdigest()
+
+    def _search_texts(self, search_properties: Sequence[str]) -> List[Optional[str]]:
+        # Same text as `search_text` builds from an item's properties
+        names = [name for name in search_properties if name in self.table.column_names]
+        if not names:
+            return [None] * len(self.ids)
+        values = [self.table.column(name).to_pylist() for name in names]
+        return [
+            " ".join(str(value) for value in row if value is not None) or None
+            for row in zip(*values)
+        ]
+
+    def position(self, item_id: str) -> int:
+        """Return the index of an item in the table order; KeyError if missing."""
+        if self._index is None:
+            self._index = {item_id: i for i, item_id in enumerate(self.ids)}
+        return self._index[item_id]
+
+    def groups(self, group_by: str) -> List[Tuple[str, List[int]]]:
+        """Return the items' groups by the `group_by` column, memoized per name."""
+        groups = self._groups.get(group_by)
+        if groups is None:
+            if group_by in self.table.column_names:
+                values = self.table.column(group_by).to_pylist()
+            else:
+                values = [None] * len(self.ids)
+            groups = self._groups[group_by] = group_values(values)
+        return groups
+
+    def __getitem__(self, item_id: str) -> Dict[str, Any]:
+        row = self.table.slice(self.position(item_id), 1).to_pylist()[0]
+        label = row.pop("label", None)
+        return {
+            "label": item_id if label is None else label,
+            "icon": row.pop("icon", None),
+            "alt_text": row.pop("alt_text", None),
+            "properties": {name: value for name, value in row.items() if name != "id"},
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        try:
+            self.position(item_id)  # type: ignore[arg-type]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"TableItems({len(self)} items)"
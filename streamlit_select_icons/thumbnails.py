@@ -0,0 +1,104 @@
+"""Downscaled icon thumbnails for each card size and device pixel ratio.
+
+Cards draw icons at a few dozen pixels, but source images are often
+hundreds of kilobytes. Thumbnails are generated once per source file and
+target size, written to a disk cache under ``static/`` and offered to the
+browser through ``srcset``.
+
+Requires Pillow (``pip install streamlit-select-icons[images]``).
+"""
+
+import io
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from ._static import (
+    DEFAULT_CACHE_DIR,
+    file_digest,
+    local_icon_path,
+    served_path,
+    write_atomic,
+)
+
+DEFAULT_PIXEL_RATIOS = (1, 2, 3)
+
+
+def icon_display_size(card_size: Optional[int]) -> int:
+    """Return the CSS pixel size icons are drawn at for a card size.
+
+    Mirrors `iconStyle` in the frontend.
+    """
+    return int(min(max((card_size or 96) * 0.4, 24), 64))
+
+
+def icon_srcset(
+    icon: Optional[str],
+    display_size: int,
+    *,
+    pixel_ratios: Sequence[int] = DEFAULT_PIXEL_RATIOS,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+) -> Optional[List[Tuple[str, int]]]:
+    """Return ``[(thumbnail path, pixel ratio), ...]`` for a local icon.
+
+    Thumbnails are cached on disk, keyed by the source file's contents and
+    the target size, and memoized per process by path and mtime. Returns
+    None for remote icons, missing files and images Pillow cannot read
+    (e.g. SVG, which needs no thumbnail).
+    """
+    path = local_icon_path(icon)
+    if path is None:
+        return None
+    stat = path.stat()
+    srcset = _icon_srcset(
+        str(path), stat.st_mtime_ns, stat.st_size, display_size, tuple(pixel_ratios), cache_dir
+    )
+    return list(srcset) if srcset is not None else None
+
+
+@lru_cache(maxsize=4096)
+def _icon_srcset(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    display_size: int,
+    pixel_ratios: Tuple[int, ...],
+    cache_dir: str,
+) -> Optional[Tuple[Tuple[str, int], ...]]:
+    try:
+        from PIL import Image
+    except ImportError as ex:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "Icon thumbnails require Pillow. Install it with "
+            "`pip install streamlit-select-icons[images]`."
+        ) from ex
+
+    digest = file_digest(Path(path))[:16]
+    srcset = []
+    try:
+        with Image.open(path) as image:
+            source_size = max(image.width, image.height)
+            for ratio in pixel_ratios:
+                target = display_size * ratio
+                if target >= source_size:
+                    # Never upscale; the source is already small enough
+                    srcset.append((Path(path).as_posix(), ratio))
+                    break
+                thumbnail_path = Path(cache_dir) / f"thumb-{digest}-{target}.png"
+                disk_path = served_path(thumbnail_path)
+                if not disk_path.is_file():
+                    write_atomic(disk_path, _render_thumbnail(image, target))
+                srcset.append((thumbnail_path.as_posix(), ratio))
+    except OSError:
+        return None
+    return tuple(srcset)
+
+
+def _render_thumbnail(image, target: int) -> bytes:
+    from PIL import Image
+
+    thumbnail = image.convert("RGBA")
+    thumbnail.thumbnail((target, target), Image.LANCZOS)
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
@@ -14,6 +14,7 @@ def test_resolve_icon_src():
         ("static/group.png", "/app/static/group.png"),
         ("static/my-icon.svg", "/app/static/my-icon.svg"),
         ("static/folder/icon.png", "/app/static/folder/icon.png"),
+        ("static/icon.png?v=0123456789ab", "/app/static/icon.png?v=0123456789ab"),
         
         # Paths with leading slashes
         ("/static/icon.png", "/app/static/icon.png"),
@@ -0,0 +1,29 @@
+"""Shared fixtures for the select_icons tests."""
+
+import pytest
+
+import streamlit_select_icons
+
+
+@pytest.fixture
+def component_value():
+    """What the fake component returns for a call's kwargs; None means the default.
+
+    Override it in a module, or per test with
+    ``@pytest.mark.parametrize("component_value", [...])``.
+    """
+    return lambda kwargs: None
+
+
+@pytest.fixture
+def component_calls(monkeypatch, component_value):
+    """Replace the declared component with a recorder of the kwargs it gets."""
+    calls = []
+
+    def fake_component_func(**kwargs):
+        calls.append(kwargs)
+        value = component_value(kwargs)
+        return kwargs["default"] if value is None else value
+
+    monkeypatch.setattr(streamlit_select_icons, "_component_func", fake_component_func)
+    return calls
@@ -0,0 +1,82 @@
+"""Tests for the icon atlas builder."""
+
+import pytest
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image
+
+from streamlit_select_icons import atlas as atlas_module
+from streamlit_select_icons import build_icon_atlas, select_icons
+
+
+@pytest.fixture
+def icon_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    static = tmp_path / "static"
+    static.mkdir()
+    Image.new("RGBA", (128, 128), (255, 0, 0, 255)).save(static / "red.png")
+    Image.new("RGBA", (32, 16), (0, 0, 255, 255)).save(static / "blue.png")
+    return static
+
+
+def test_build_icon_atlas_packs_local_icons(icon_dir):
+    atlas = build_icon_atlas(
+        ["static/red.png", "static/blue.png", "static/red.png", None, "https://example.com/x.png"],
+        cell_size=32,
+    )
+
+    assert atlas.offsets == {"static/blue.png": (0, 0), "static/red.png": (32, 0)}
+    assert (atlas.width, atlas.height) == (64, 32)
+    assert atlas.src.startswith("static/_select_icons/atlas-")
+    with Image.open(atlas.src) as sprite:
+        assert sprite.size == (64, 32)
+        assert sprite.getpixel((48, 16)) == (255, 0, 0, 255)
+
+
+def test_build_icon_atlas_skips_icons_pillow_cannot_read(icon_dir):
+    (icon_dir / "a.svg").write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="8" height="8"/>'
+    )
+
+    atlas = build_icon_atlas(["static/red.png", "static/a.svg"], cell_size=32)
+
+    assert atlas.offsets == {"static/red.png": (0, 0)}
+    assert (atlas.width, atlas.height) == (32, 32)
+
+
+def test_build_icon_atlas_is_cached_by_content(icon_dir):
+    first = build_icon_atlas(["static/red.png", "static/blue.png"], cell_size=32)
+    sprite_path = icon_dir / "_select_icons" / first.src.rsplit("/", 1)[1]
+    mtime = sprite_path.stat().st_mtime_ns
+
+    assert build_icon_atlas(["static/blue.png", "static/red.png"], cell_size=32) == first
+    assert sprite_path.stat().st_mtime_ns == mtime
+
+    Image.new("RGBA", (128, 128), (0, 255, 0, 255)).save(icon_dir / "red.png")
+    assert build_icon_atlas(["static/red.png", "static/blue.png"], cell_size=32).src != first.src
+
+
+def test_build_icon_atlas_is_memoized_by_file_stats(icon_dir, monkeypatch):
+    first = build_icon_atlas(["static/red.png", "static/blue.png"], cell_size=32)
+    opened = []
+    monkeypatch.setattr(
+        atlas_module, "_is_image", lambda Image, path: opened.append(path) or True
+    )
+
+    assert build_icon_atlas(["static/blue.png", "static/red.png"], cell_size=32) == (
+        first
+    )
+    assert opened == []
+
+    Image.new("RGBA", (64, 64), (0, 255, 0, 255)).save(icon_dir / "red.png")
+    build_icon_atlas(["static/red.png", "static/blue.png"], cell_size=32)
+    assert len(opened) == 2
+
+
+def test_select_icons_ships_offset_table(icon_dir, component_calls):
+    atlas = build_icon_atlas(["static/red.png"], cell_size=32)
+
+    select_icons({"red": {"label": "Red", "icon": "static/red.png"}}, atlas=atlas)
+
+    assert component_calls[0]["atlas"]["offsets"] == {"static/red.png": [0, 0]}
+    assert component_calls[0]["atlas"]["src"] == atlas.src
@@ -0,0 +1,132 @@
+"""Tests for the IconCatalog type."""
+
+import json
+
+import pytest
+
+from streamlit_select_icons import IconCatalog, select_icons
+from streamlit_select_icons import catalog as catalog_module
+
+ITEMS = {
+    "home": {"label": "Home", "icon": "static/icon.png", "properties": {"category": "navigation"}},
+    "status": {"label": "Active", "icon": None, "alt_text": "🟢"},
+}
+
+
+
+def test_catalog_behaves_like_the_items_dict():
+    catalog = IconCatalog.from_items(ITEMS)
+
+    assert list(catalog) == ["home", "status"]
+    assert len(catalog) == 2
+    assert catalog["home"] == {
+        "label": "Home",
+        "icon": "static/icon.png",
+        "alt_text": None,
+        "properties": {"category": "navigation"},
+    }
+    assert catalog["status"]["alt_text"] == "🟢"
+    assert "missing" not in catalog
+
+
+def test_identical_catalogs_share_one_instance():
+    first = IconCatalog.from_items(ITEMS)
+    second = IconCatalog.from_items({key: dict(value) for key, value in ITEMS.items()})
+
+    assert second is first
+    assert IconCatalog.from_items(first) is first
+    assert IconCatalog.from_items({"home": ITEMS["home"]}) is not first
+
+
+def test_catalog_payload_is_columnar_json():
+    catalog = IconCatalog.from_items(ITEMS)
+
+    columns = json.loads(catalog.payload)
+    assert columns["ids"] == ["home", "status"]
+    assert columns["labels"] == ["Home", "Active"]
+    assert columns["icons"] == ["static/icon.png", None]
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        {"a": "not a dict"},
+        {"a": {"label": 3}},
+        {"a": {"label": "A", "icon": 5}},
+        {"a": {"label": "A", "properties": ["x"]}},
+    ],
+)
+def test_catalog_validates_items(items):
+    with pytest.raises(TypeError):
+        IconCatalog.from_items(items)
+
+
+def test_select_icons_ships_catalog_payload(component_calls):
+    catalog = IconCatalog.from_items(ITEMS)
+
+    result = select_icons(catalog, selected_items=["status"])
+
+    call = component_calls[0]
+    assert call["items"] is None
+    assert call["catalog"] is catalog.payload
+    assert call["catalog_hash"] == catalog.content_hash
+    assert result == {"items": catalog, "selected_items": ["status"]}
+
+
+def test_catalog_payload_leaves_out_properties():
+    catalog = IconCatalog.from_items(ITEMS)
+    recategorized = IconCatalog.from_items({**ITEMS, "home": {**ITEMS["home"], "properties": {"category": "other"}}})
+
+    assert "properties" not in json.loads(catalog.payload)
+    assert recategorized.payload == catalog.payload
+    assert recategorized is not catalog
+    assert recategorized["home"]["properties"] == {"category": "other"}
+
+
+def test_select_icons_memoizes_rendered_catalog(component_calls, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "static").mkdir()
+    (tmp_path / "static" / "icon.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    catalog = IconCatalog.from_items(ITEMS)
+
+    select_icons(catalog, inline_icons=True)
+    select_icons(catalog, inline_icons=True)
+
+    first, second = component_calls
+    assert first["catalog"] is second["catalog"]
+    assert first["catalog_hash"] != catalog.content_hash
+    assert json.loads(first["catalog"])["icons"][0].startswith("data:image/png;base64,")
+
+
+def test_rendering_a_catalog_does_not_copy_properties(
+    component_calls, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "static").mkdir()
+    (tmp_path / "static" / "icon.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    catalog = IconCatalog.from_items(
+        {"big": {"label": "Big", "icon": "static/icon.png", "properties": {"n": 7}}}
+    )
+
+    def no_deepcopy(value):
+        raise AssertionError("properties were copied")
+
+    monkeypatch.setattr(catalog_module.copy, "deepcopy", no_deepcopy)
+    select_icons(catalog, inline_icons=True)
+
+    assert json.loads(component_calls[0]["catalog"])["icons"][0].startswith("data:")
+
+
+def test_catalog_properties_cannot_be_changed_from_outside():
+    items = {"a": {"label": "A", "icon": None, "properties": {"n": 1, "tags": ["x"]}}}
+    catalog = IconCatalog.from_items(items)
+
+    looked_up = catalog["a"]["properties"]
+    looked_up["n"] = 999
+    looked_up["tags"].append("y")
+    items["a"]["properties"]["tags"].append("z")
+
+    assert catalog["a"]["properties"] == {"n": 1, "tags": ["x"]}
+    assert IconCatalog.from_items({"a": {"label": "A", "icon": None, "properties": {"n": 1, "tags": ["x"]}}}) is catalog
+    with pytest.raises(TypeError):
+        catalog.properties[0]["n"] = 2
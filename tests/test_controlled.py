@@ -0,0 +1,106 @@
+"""Tests for the controlled `selected_items` input."""
+
+import uuid
+
+import pytest
+import streamlit as st
+
+from streamlit_select_icons import select_icons
+
+ITEMS = {item_id: {"label": item_id.title(), "icon": None} for item_id in ("a", "b", "c")}
+
+
+@pytest.fixture
+def component_value():
+    # Like Streamlit, return the last value posted by the frontend
+    return lambda kwargs: st.session_state.get(kwargs["key"])
+
+
+@pytest.fixture
+def key():
+    return f"controlled-{uuid.uuid4()}"
+
+
+def post(key, selected, version):
+    st.session_state[key] = {"selected_items": selected, "selection_version": version}
+
+
+def test_echoing_the_users_selection_keeps_the_version(component_calls, key):
+    # The usual pattern: feed the previous result back in as selected_items
+    chosen = select_icons(ITEMS, selected_items=[], key=key)["selected_items"]
+    post(key, ["a"], 0)
+    chosen = select_icons(ITEMS, selected_items=chosen, key=key)["selected_items"]
+    post(key, ["a", "b"], 0)
+    chosen = select_icons(ITEMS, selected_items=chosen, key=key)["selected_items"]
+
+    assert chosen == ["a", "b"]
+    assert [call["selection_version"] for call in component_calls] == [0, 0, 0]
+
+
+def test_python_side_change_bumps_the_version(component_calls, key):
+    select_icons(ITEMS, selected_items=["a"], key=key)
+    post(key, ["a", "b"], 0)
+
+    result = select_icons(ITEMS, selected_items=[], key=key)
+
+    assert component_calls[-1]["selection_version"] == 1
+    assert component_calls[-1]["selected_items"] == []
+    # Until the frontend reports version 1, the result follows Python
+    assert result["selected_items"] == []
+
+
+def test_adopted_selection_is_reported_back(component_calls, key):
+    select_icons(ITEMS, selected_items=["a"], key=key)
+    post(key, ["a", "b"], 0)
+    select_icons(ITEMS, selected_items=["c"], key=key)
+    post(key, ["c", "a"], 1)  # adopted, then the user clicked "a"
+
+    result = select_icons(ITEMS, selected_items=["c"], key=key)
+
+    assert component_calls[-1]["selection_version"] == 1
+    assert result["selected_items"] == ["c", "a"]
+
+
+def test_without_key_selection_is_not_versioned(component_calls):
+    select_icons(ITEMS, selected_items=["a"])
+    select_icons(ITEMS, selected_items=["b"])
+
+    assert [call["selection_version"] for call in component_calls] == [0, 0]
+
+
+def test_readme_reset_after_a_click_rerun(component_calls, key):
+    state = {}
+
+    def run(reset=False):
+        # The README example, with `state` standing in for st.session_state
+        chosen = state.get("chosen", [])
+        if reset:
+            chosen = []
+        result = select_icons(ITEMS, selected_items=chosen, key=key)
+        state["chosen"] = result["selected_items"]
+        return result
+
+    run()
+    post(key, ["a"], 0)
+    assert run()["selected_items"] == ["a"]  # the click's rerun passes [] again
+
+    result = run(reset=True)
+
+    assert component_calls[-1]["selection_version"] == 1
+    assert result["selected_items"] == []
+    post(key, [], 1)
+    assert run()["selected_items"] == []
+    assert component_calls[-1]["selection_version"] == 1
+
+
+def test_constant_selection_is_only_the_initial_one(component_calls, key):
+    select_icons(ITEMS, selected_items=["a"], key=key)
+    post(key, ["a", "b"], 0)
+    select_icons(ITEMS, selected_items=["a"], key=key)
+    post(key, ["a", "b", "c"], 0)
+
+    result = select_icons(ITEMS, selected_items=["a"], key=key)
+    result = select_icons(ITEMS, selected_items=["a"], key=key)
+
+    assert result["selected_items"] == ["a", "b", "c"]
+    assert [call["selection_version"] for call in component_calls] == [0, 0, 0, 0]
@@ -0,0 +1,175 @@
+"""Tests for content-fingerprinted icon URLs and first-screen preloading."""
+
+import json
+import os
+
+import pytest
+
+import streamlit_select_icons
+from streamlit_select_icons import PRELOAD_LIMIT, IconCatalog, select_icons
+from streamlit_select_icons import _static
+from streamlit_select_icons._static import fingerprinted_icon
+from streamlit_select_icons.atlas import IconAtlas
+
+
+@pytest.fixture
+def icon_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    static = tmp_path / "static"
+    static.mkdir()
+    for name in ("a", "b", "c"):
+        (static / f"{name}.svg").write_text(f"<svg xmlns='http://www.w3.org/2000/svg' id='{name}'/>")
+    return static
+
+
+def test_fingerprinted_icon_tracks_file_content(icon_dir):
+    url = fingerprinted_icon("static/a.svg")
+    path, _, version = url.partition("?v=")
+
+    assert path == "static/a.svg"
+    assert len(version) == 12
+    assert fingerprinted_icon("/static/a.svg") == url
+    assert fingerprinted_icon("static/b.svg") != url
+
+    icon = icon_dir / "a.svg"
+    icon.write_text("<svg xmlns='http://www.w3.org/2000/svg' id='changed'/>")
+    stat = icon.stat()
+    os.utime(icon, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert fingerprinted_icon("static/a.svg") != url
+
+
+def test_digests_of_large_icon_sets_survive_a_rerun(icon_dir, monkeypatch):
+    icons = [f"static/many/{i}.svg" for i in range(5_000)]
+    (icon_dir / "many").mkdir()
+    for i, icon in enumerate(icons):
+        (icon_dir.parent / icon).write_text(f"<svg id='{i}'/>")
+    hashed = []
+    hash_file = _static._hash_file
+    monkeypatch.setattr(
+        _static, "_hash_file", lambda path: hashed.append(path) or hash_file(path)
+    )
+
+    first = [fingerprinted_icon(icon) for icon in icons]
+    assert len(hashed) == len(icons)
+    assert [fingerprinted_icon(icon) for icon in icons] == first
+    assert len(hashed) == len(icons)
+
+
+def test_fingerprinted_icon_skips_remote_and_missing_icons(icon_dir):
+    assert fingerprinted_icon("https://example.com/a.svg") is None
+    assert fingerprinted_icon("data:image/svg+xml;utf8,<svg/>") is None
+    assert fingerprinted_icon("static/missing.svg") is None
+    assert fingerprinted_icon(None) is None
+
+
+def test_select_icons_fingerprints_icons_when_enabled(icon_dir, component_calls):
+    items = {
+        "a": {"label": "A", "icon": "static/a.svg"},
+        "remote": {"label": "Remote", "icon": "https://example.com/r.svg"},
+    }
+
+    select_icons(items)
+    select_icons(items, fingerprint_icons=True)
+
+    assert component_calls[0]["items"]["a"]["icon"] == "static/a.svg"
+    assert "preload" not in component_calls[0]
+    shipped = component_calls[1]["items"]
+    assert shipped["a"]["icon"] == fingerprinted_icon("static/a.svg")
+    assert shipped["remote"]["icon"] == "https://example.com/r.svg"
+    assert items["a"]["icon"] == "static/a.svg"
+    assert component_calls[1]["preload"] == [
+        {"src": fingerprinted_icon("static/a.svg")},
+        {"src": "https://example.com/r.svg"},
+    ]
+
+
+def test_preload_lists_distinct_icons_in_display_order(icon_dir, component_calls):
+    items = {
+        "a1": {"label": "A1", "icon": "static/a.svg", "properties": {"kind": "z"}},
+        "b": {"label": "B", "icon": "static/b.svg", "properties": {"kind": "y"}},
+        "a2": {"label": "A2", "icon": "static/a.svg", "properties": {"kind": "z"}},
+        "c": {"label": "C", "icon": "static/c.svg", "properties": {"kind": "y"}},
+    }
+
+    select_icons(items, fingerprint_icons=True, visible=["c", "a2", "a1"])
+    select_icons(items, fingerprint_icons=True, group_by="kind")
+
+    assert [entry["src"] for entry in component_calls[0]["preload"]] == [
+        fingerprinted_icon("static/c.svg"),
+        fingerprinted_icon("static/a.svg"),
+    ]
+    assert [entry["src"] for entry in component_calls[1]["preload"]] == [
+        fingerprinted_icon(f"static/{name}.svg") for name in ("a", "b", "c")
+    ]
+
+
+def test_preload_is_limited_to_the_first_screen(icon_dir, component_calls):
+    for i in range(100):
+        (icon_dir / f"icon{i}.svg").write_text(f"<svg xmlns='http://www.w3.org/2000/svg' id='{i}'/>")
+    items = {f"item{i}": {"label": str(i), "icon": f"static/icon{i}.svg"} for i in range(100)}
+
+    # 2 rows of 110px cards (plus gaps) fit in 240px, across 3 columns
+    select_icons(items, fingerprint_icons=True, columns=3, height=240)
+    # 96px cards in 120px row-layout tracks: ceil(400 / 132) columns of 2 rows
+    select_icons(items, fingerprint_icons=True, layout="row", rows=2, width=400)
+    select_icons(items, fingerprint_icons=True, columns=6)
+
+    assert len(component_calls[0]["preload"]) == 6
+    assert len(component_calls[1]["preload"]) == 8
+    assert len(component_calls[2]["preload"]) == PRELOAD_LIMIT
+
+
+def test_preload_skips_inlined_and_atlas_icons(icon_dir, component_calls):
+    items = {
+        "a": {"label": "A", "icon": "static/a.svg"},
+        "b": {"label": "B", "icon": "static/b.svg"},
+        "c": {"label": "C", "icon": "static/c.svg"},
+    }
+    atlas = IconAtlas(
+        src="static/_select_icons/atlas.png", cell_size=32, width=64, height=32,
+        offsets={"static/b.svg": (0, 0), "static/c.svg": (32, 0)},
+    )
+
+    select_icons(items, fingerprint_icons=True, atlas=atlas)
+    select_icons(items, fingerprint_icons=True, inline_icons=True)
+
+    assert component_calls[0]["preload"] == [{"src": fingerprinted_icon("static/a.svg")}]
+    # The frontend looks sprites up by the icon path it receives
+    assert set(component_calls[0]["atlas"]["offsets"]) == {
+        fingerprinted_icon("static/b.svg"), fingerprinted_icon("static/c.svg")
+    }
+    assert component_calls[0]["items"]["b"]["icon"] == fingerprinted_icon("static/b.svg")
+    assert component_calls[1]["preload"] == []
+    assert component_calls[1]["items"]["a"]["icon"].startswith("data:")
+
+
+def test_catalog_fingerprints_follow_icon_changes(icon_dir, component_calls):
+    catalog = IconCatalog.from_items({"a": {"label": "A", "icon": "static/a.svg"}})
+
+    select_icons(catalog, fingerprint_icons=True)
+    select_icons(catalog, fingerprint_icons=True)
+    icon = icon_dir / "a.svg"
+    icon.write_text("<svg xmlns='http://www.w3.org/2000/svg' id='changed'/>")
+    stat = icon.stat()
+    os.utime(icon, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    select_icons(catalog, fingerprint_icons=True)
+
+    first, second, third = component_calls
+    assert second["catalog"] is first["catalog"]
+    assert third["catalog_hash"] != first["catalog_hash"]
+    assert json.loads(third["catalog"])["icons"] == [fingerprinted_icon("static/a.svg")]
+
+
+def test_catalog_without_fingerprints_stats_no_icon_files(
+    icon_dir, component_calls, monkeypatch
+):
+    catalog = IconCatalog.from_items({"b": {"label": "B", "icon": "static/b.svg"}})
+    select_icons(catalog, inline_icons=True)
+
+    def no_stamp(icons):
+        raise AssertionError("icon files were stat'ed")
+
+    monkeypatch.setattr(streamlit_select_icons, "icon_files_stamp", no_stamp)
+    select_icons(catalog, inline_icons=True)
+
+    assert component_calls[1]["catalog"] is component_calls[0]["catalog"]
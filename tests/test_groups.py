@@ -0,0 +1,69 @@
+"""Tests for grouping items into collapsible sections."""
+
+import pytest
+
+from streamlit_select_icons import IconCatalog, select_icons
+from streamlit_select_icons._groups import UNGROUPED, group_indices
+
+ITEMS = {
+    "home": {"label": "Home", "properties": {"category": "navigation"}},
+    "profile": {"label": "Profile", "properties": {"category": "user"}},
+    "dashboard": {"label": "Dashboard", "properties": {"category": "navigation"}},
+    "status": {"label": "Active"},
+    "priority": {"label": "Priority", "properties": {"category": 1}},
+}
+
+
+
+def test_group_indices_in_order_of_first_appearance():
+    groups = group_indices((item.get("properties") for item in ITEMS.values()), "category")
+
+    assert groups == [("navigation", [0, 2]), ("user", [1]), (UNGROUPED, [3]), ("1", [4])]
+
+
+def test_group_by_sends_groups(component_calls):
+    select_icons(ITEMS, group_by="category", key="groups")
+
+    assert component_calls[0]["groups"][0] == ("navigation", [0, 2])
+
+
+def test_group_indices_follow_the_sent_order_for_numeric_ids(component_calls):
+    items = {
+        "b": {"label": "B", "properties": {"category": "letters"}},
+        "10": {"label": "Ten", "properties": {"category": "numbers"}},
+        "2": {"label": "Two", "properties": {"category": "numbers"}},
+    }
+
+    select_icons(items, group_by="category")
+
+    order = component_calls[0]["item_order"]
+    assert [(name, [order[i] for i in indices]) for name, indices in component_calls[0]["groups"]] == [
+        ("letters", ["b"]),
+        ("numbers", ["10", "2"]),
+    ]
+
+
+def test_no_groups_arg_without_group_by(component_calls):
+    select_icons(ITEMS, key="groups")
+
+    assert "groups" not in component_calls[0]
+
+
+def test_catalog_groups_are_memoized(component_calls):
+    catalog = IconCatalog.from_items(ITEMS)
+    select_icons(catalog, group_by="category", key="groups")
+
+    assert component_calls[0]["groups"] is catalog.groups("category")
+    assert catalog.groups("category") == group_indices(
+        (item.get("properties") for item in ITEMS.values()), "category"
+    )
+
+
+def test_group_by_requires_the_column_layout():
+    with pytest.raises(ValueError):
+        select_icons(ITEMS, layout="row", group_by="category")
+
+
+def test_group_by_rejects_page_sources():
+    with pytest.raises(ValueError):
+        select_icons(lambda page_index: None, group_by="category", key="pages")
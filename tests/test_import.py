@@ -0,0 +1,49 @@
+"""Tests for the cost of importing the package."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import streamlit_select_icons
+
+ROOT = Path(__file__).resolve().parent.parent
+# Heavy dependencies only loaded once the component renders (or uses them)
+DEFERRED_MODULES = ("streamlit", "pandas", "pyarrow", "PIL")
+# Cumulative `-X importtime` budget for the package, far above its own cost
+# but well below that of importing Streamlit
+IMPORT_BUDGET_MS = 150
+
+
+def import_in_subprocess():
+    script = "import sys, streamlit_select_icons; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    modules = set(result.stdout.split())
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == "streamlit_select_icons"
+    )
+    return modules, cumulative_us / 1000
+
+
+def test_import_defers_heavy_dependencies():
+    modules, _ = import_in_subprocess()
+
+    loaded = sorted(name for name in modules if name.partition(".")[0] in DEFERRED_MODULES)
+    assert loaded == []
+
+
+def test_import_time_budget():
+    _, import_ms = import_in_subprocess()
+
+    assert import_ms < IMPORT_BUDGET_MS
+
+
+def test_component_is_declared_once():
+    assert streamlit_select_icons._declared_component() is streamlit_select_icons._declared_component()
@@ -0,0 +1,56 @@
+"""Tests for inlining small local icons as data URIs."""
+
+import base64
+
+import pytest
+
+from streamlit_select_icons import select_icons
+from streamlit_select_icons._static import _encode_data_uri, inline_icon
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 56
+
+
+@pytest.fixture
+def icon_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    static = tmp_path / "static"
+    static.mkdir()
+    (static / "small.png").write_bytes(PNG_BYTES)
+    (static / "large.png").write_bytes(PNG_BYTES * 100)
+    return static
+
+
+def test_inline_icon_respects_size_threshold(icon_dir):
+    data_uri = inline_icon("static/small.png", max_bytes=1024)
+
+    assert data_uri == "data:image/png;base64," + base64.b64encode(PNG_BYTES).decode()
+    assert inline_icon("static/large.png", max_bytes=1024) is None
+    assert inline_icon("https://example.com/icon.png", max_bytes=1024) is None
+    assert inline_icon("static/missing.png", max_bytes=1024) is None
+
+
+def test_inline_icon_is_cached_until_file_changes(icon_dir):
+    _encode_data_uri.cache_clear()
+    inline_icon("static/small.png", max_bytes=1024)
+    inline_icon("static/small.png", max_bytes=1024)
+    assert _encode_data_uri.cache_info().hits == 1
+
+    (icon_dir / "small.png").write_bytes(PNG_BYTES + b"\x01")
+    assert inline_icon("static/small.png", max_bytes=1024).endswith(
+        base64.b64encode(PNG_BYTES + b"\x01").decode()
+    )
+
+
+def test_select_icons_inlines_only_when_enabled(icon_dir, component_calls):
+    items = {
+        "small": {"label": "Small", "icon": "static/small.png"},
+        "large": {"label": "Large", "icon": "static/large.png"},
+    }
+
+    select_icons(items)
+    result = select_icons(items, inline_icons=True, inline_max_bytes=1024)
+
+    assert component_calls[0]["items"] is items
+    assert component_calls[1]["items"]["small"]["icon"].startswith("data:image/png;base64,")
+    assert component_calls[1]["items"]["large"]["icon"] == "static/large.png"
+    assert result["items"]["small"]["icon"] == "static/small.png"
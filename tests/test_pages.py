@@ -0,0 +1,95 @@
+"""Tests for paginated item sources."""
+
+import uuid
+
+import pytest
+import streamlit as st
+
+from streamlit_select_icons import select_icons
+
+
+def make_page(page_index, size=3):
+    return {
+        f"item_{page_index}_{i}": {"label": f"Item {page_index}.{i}", "icon": None}
+        for i in range(size)
+    }
+
+
+@pytest.fixture
+def component_value():
+    # Like Streamlit, return the last value posted by the frontend
+    return lambda kwargs: st.session_state.get(kwargs["key"])
+
+
+@pytest.fixture
+def key():
+    return f"pages-{uuid.uuid4()}"
+
+
+def test_loader_sends_first_page(component_calls, key):
+    requested = []
+
+    def loader(page_index):
+        requested.append(page_index)
+        return make_page(page_index) if page_index < 3 else None
+
+    result = select_icons(loader, key=key)
+
+    call = component_calls[0]
+    assert call["items"] is None
+    assert call["page"] == {"index": 0, "items": make_page(0)}
+    assert call["has_more"] is True
+    assert requested == [0]
+    assert result["items"] == make_page(0)
+
+
+def test_requested_page_is_loaded_once_and_kept(component_calls, key):
+    requested = []
+
+    def loader(page_index):
+        requested.append(page_index)
+        return make_page(page_index) if page_index < 2 else None
+
+    select_icons(loader, key=key)
+    st.session_state[key] = {"selected_items": ["item_0_1", "item_1_2"], "page_request": 1}
+    result = select_icons(lambda page_index: pytest.fail("source is kept per session"), key=key)
+
+    assert component_calls[-1]["page"]["index"] == 1
+    assert result["selected_items"] == ["item_0_1", "item_1_2"]
+    assert list(result["items"]) == list(make_page(0)) + list(make_page(1))
+
+    st.session_state[key] = {"selected_items": [], "page_request": 2}
+    select_icons(loader, key=key)
+    select_icons(loader, key=key)
+
+    assert requested == [0, 1, 2]
+    assert component_calls[-1]["page"]["index"] == 1
+    assert component_calls[-1]["has_more"] is False
+
+
+def test_iterator_source(component_calls, key):
+    select_icons(iter([make_page(0), make_page(1)]), key=key)
+    st.session_state[key] = {"page_request": 1}
+    select_icons(iter([]), key=key)
+
+    assert component_calls[-1]["page"] == {"index": 1, "items": make_page(1)}
+    assert component_calls[-1]["has_more"] is True
+
+
+def test_empty_source(component_calls, key):
+    result = select_icons(iter([]), key=key)
+
+    assert component_calls[0]["page"] is None
+    assert component_calls[0]["has_more"] is False
+    assert result == {"items": {}, "selected_items": []}
+
+
+def test_loader_requires_key():
+    with pytest.raises(ValueError):
+        select_icons(make_page)
+
+
+def test_page_with_numeric_ids_sends_its_order(component_calls, key):
+    select_icons(iter([{"b": {"label": "B"}, "10": {"label": "Ten"}}]), key=key)
+
+    assert component_calls[-1]["page"]["item_order"] == ["b", "10"]
@@ -0,0 +1,71 @@
+"""Payload-size regression tests for the select_icons wire format."""
+
+import json
+
+import pytest
+
+from streamlit_select_icons import select_icons
+
+# What the frontend posts after a click: selection state only.
+FRONTEND_VALUE = {"selected_items": ["item_3"]}
+
+
+def make_items(count):
+    return {
+        f"item_{i}": {
+            "label": f"Item {i}",
+            "icon": "static/icon.png",
+            "properties": {"category": f"group_{i % 10}", "priority": i},
+        }
+        for i in range(count)
+    }
+
+
+@pytest.mark.parametrize("count", [1_000, 10_000])
+def test_default_value_does_not_hold_items(component_calls, count):
+    select_icons(make_items(count), selected_items=["item_1", "item_2"])
+
+    default = component_calls[0]["default"]
+    assert "items" not in default
+    assert len(json.dumps(default)) < 100
+
+
+@pytest.mark.parametrize("component_value", [lambda kwargs: FRONTEND_VALUE])
+def test_selection_args_size_is_independent_of_catalog_size(component_calls):
+    results = [
+        select_icons(make_items(count), selected_items=["item_1", "item_2"])
+        for count in (1_000, 10_000)
+    ]
+
+    small, large = component_calls
+    assert json.dumps(small["default"]) == json.dumps(large["default"])
+    assert small["selected_items"] == large["selected_items"] == ["item_1", "item_2"]
+    assert [result["selected_items"] for result in results] == [["item_3"]] * 2
+
+
+def test_result_falls_back_to_initial_selection(component_calls):
+    items = make_items(3)
+
+    result = select_icons(items, selected_items=["item_0"])
+
+    assert result == {"items": items, "selected_items": ["item_0"]}
+
+
+def test_properties_are_not_sent_to_the_frontend(component_calls):
+    items = make_items(3)
+    items["item_0"]["properties"]["notes"] = "x" * 10_000
+
+    result = select_icons(items)
+
+    sent = component_calls[0]["items"]
+    assert sent["item_0"] == {"label": "Item 0", "icon": "static/icon.png"}
+    assert len(json.dumps(sent)) < 500
+    assert result["items"]["item_0"]["properties"]["notes"] == "x" * 10_000
+
+
+def test_items_without_properties_are_passed_through(component_calls):
+    items = {"a": {"label": "A", "icon": None, "alt_text": "🅰"}}
+
+    select_icons(items)
+
+    assert component_calls[0]["items"] is items
@@ -0,0 +1,33 @@
+"""Tests for the opt-in performance metrics in the select_icons result."""
+
+import pytest
+
+from streamlit_select_icons import select_icons
+
+ITEMS = {f"item_{i}": {"label": f"Item {i}"} for i in range(10)}
+FRONTEND_METRICS = {"mount_ms": 12.5, "cards_rendered": 10, "args_bytes": 900, "click_to_post_ms": 3.2}
+
+
+def test_no_metrics_by_default(component_calls):
+    result = select_icons(ITEMS)
+
+    assert "metrics" not in result
+    assert component_calls[0]["profile"] is False
+
+
+def test_profile_reports_python_timing_before_the_frontend_posts(component_calls):
+    result = select_icons(ITEMS, profile=True)
+
+    assert component_calls[0]["profile"] is True
+    assert set(result["metrics"]) == {"python_args_ms"}
+    assert result["metrics"]["python_args_ms"] >= 0
+
+
+@pytest.mark.parametrize(
+    "component_value", [lambda kwargs: {"selected_items": ["item_1"], "metrics": FRONTEND_METRICS}]
+)
+def test_profile_merges_frontend_metrics(component_calls):
+    result = select_icons(ITEMS, profile=True)
+
+    assert result["selected_items"] == ["item_1"]
+    assert result["metrics"] == {**FRONTEND_METRICS, "python_args_ms": result["metrics"]["python_args_ms"]}
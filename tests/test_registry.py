@@ -0,0 +1,139 @@
+"""Tests for catalogs registered once and referenced by id."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from streamlit_select_icons import (
+    IconCatalog,
+    _static,
+    register_catalog,
+    registry,
+    select_icons,
+)
+
+ITEMS = {
+    "home": {"label": "Home", "icon": "static/icon.png", "properties": {"category": "navigation"}},
+    "search": {"label": "Search", "icon": "static/icon.png", "properties": {"category": "tools"}},
+    "status": {"label": "Active", "icon": None, "alt_text": "🟢"},
+}
+
+
+@pytest.fixture(autouse=True)
+def app_dir(monkeypatch, tmp_path):
+    # Catalog files are written under the app's static folder
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_register_catalog_is_idempotent():
+    catalog_id = register_catalog(ITEMS)
+
+    assert register_catalog({key: dict(value) for key, value in ITEMS.items()}) == catalog_id
+    assert register_catalog(IconCatalog.from_items(ITEMS)) == catalog_id
+    assert register_catalog({"home": ITEMS["home"]}) != catalog_id
+
+
+def test_catalog_reference_ships_only_id_and_url(component_calls):
+    catalog_id = register_catalog(ITEMS)
+
+    result = select_icons(catalog=catalog_id, selected_items=["search"], key="icons")
+
+    kwargs = component_calls[0]
+    assert kwargs["items"] is None
+    assert "catalog" not in kwargs
+    ref = kwargs["catalog_ref"]
+    assert ref["id"] == catalog_id
+    assert ref["hash"] == IconCatalog.from_items(ITEMS).content_hash
+    assert json.loads(Path(ref["url"]).read_bytes())["ids"] == ["home", "search", "status"]
+    assert "visible" not in kwargs
+    assert result["selected_items"] == ["search"]
+    assert result["items"] is IconCatalog.from_items(ITEMS)
+
+
+def test_catalog_file_is_written_once(component_calls):
+    catalog_id = register_catalog(ITEMS)
+    select_icons(catalog=catalog_id, key="first")
+    path = Path(component_calls[0]["catalog_ref"]["url"])
+    written = path.stat().st_mtime_ns
+
+    select_icons(catalog=catalog_id, visible=["home"], key="second")
+
+    assert component_calls[1]["catalog_ref"]["url"] == path.as_posix()
+    assert path.stat().st_mtime_ns == written
+
+
+def test_visible_subset_is_sent_as_indices_in_order(component_calls):
+    catalog_id = register_catalog(ITEMS)
+
+    select_icons(catalog=catalog_id, visible=["status", "home"], key="icons")
+    select_icons(ITEMS, visible=["search"], key="dict")
+
+    assert component_calls[0]["visible"] == [2, 0]
+    assert component_calls[1]["visible"] == [1]
+
+
+def test_invalid_catalog_references(component_calls):
+    catalog_id = register_catalog(ITEMS)
+
+    with pytest.raises(ValueError, match="Unknown catalog id"):
+        select_icons(catalog="missing", key="icons")
+    with pytest.raises(ValueError, match="not both"):
+        select_icons(ITEMS, catalog=catalog_id, key="icons")
+    with pytest.raises(ValueError, match="unknown item id 'missing'"):
+        select_icons(catalog=catalog_id, visible=["home", "missing"], key="icons")
+
+
+def test_least_recently_used_catalogs_are_dropped_with_their_files(component_calls, monkeypatch):
+    monkeypatch.setattr(registry, "MAX_CATALOGS", 2)
+    first, second = (register_catalog({item_id: ITEMS[item_id]}) for item_id in ("home", "search"))
+    select_icons(catalog=first, key="first")
+    select_icons(catalog=second, key="second")
+    first_file, second_file = (Path(kwargs["catalog_ref"]["url"]) for kwargs in component_calls)
+
+    # Using the first catalog again makes the second the least recently used
+    select_icons(catalog=first, key="first")
+    register_catalog({"status": ITEMS["status"]})
+
+    assert first_file.is_file()
+    assert not second_file.exists()
+    with pytest.raises(ValueError, match="Unknown catalog id"):
+        select_icons(catalog=second, key="second")
+    assert register_catalog({"search": ITEMS["search"]}) == second
+
+
+def test_files_shared_by_catalogs_outlive_one_of_them(component_calls, monkeypatch):
+    monkeypatch.setattr(registry, "MAX_CATALOGS", 2)
+    # Different properties, so two catalogs; rendered, their payloads match
+    first, second = (
+        register_catalog(
+            {"shared": {"label": "Shared", "icon": None, "properties": {"n": n}}}
+        )
+        for n in (1, 2)
+    )
+    select_icons(catalog=first, key="first", fingerprint_icons=True)
+    select_icons(catalog=second, key="second", fingerprint_icons=True)
+    first_url, second_url = (kwargs["catalog_ref"]["url"] for kwargs in component_calls)
+    assert first != second and first_url == second_url
+
+    register_catalog({"status": ITEMS["status"]})
+
+    assert Path(second_url).is_file()
+    register_catalog({"home": ITEMS["home"]})
+    assert not Path(second_url).exists()
+
+
+def test_catalog_file_is_written_next_to_the_main_script(
+    component_calls, monkeypatch, tmp_path
+):
+    app = tmp_path / "app"
+    monkeypatch.setattr(_static, "_main_script_path", lambda: str(app / "main.py"))
+    catalog_id = register_catalog({"search": ITEMS["search"]})
+
+    select_icons(catalog=catalog_id, key="icons")
+
+    url = component_calls[0]["catalog_ref"]["url"]
+    assert url.startswith("static/_select_icons/catalog-")
+    assert (app / url).is_file()
+    assert not Path(url).exists()
@@ -0,0 +1,63 @@
+"""Tests for the search text and prefix index sent to the frontend."""
+
+import json
+
+import pytest
+
+from streamlit_select_icons import IconCatalog, select_icons
+from streamlit_select_icons._search import build_search_index, search_text, tokenize
+
+ITEMS = {
+    "home": {"label": "Home", "properties": {"category": "navigation", "rank": 1}},
+    "house": {"label": "House-Boat", "properties": {"category": "Buildings"}},
+    "status": {"label": "Étoile", "properties": {}},
+}
+
+
+
+def test_tokenize_lowercases_and_splits_on_punctuation():
+    assert tokenize("House-Boat_2 (Étoile)") == ["house", "boat", "2", "étoile"]
+    assert tokenize("  ") == []
+
+
+def test_search_text_joins_selected_properties():
+    assert search_text(ITEMS["home"], ["category", "rank", "missing"]) == "navigation 1"
+    assert search_text(ITEMS["status"], ["category"]) is None
+    assert search_text(ITEMS["home"], None) is None
+
+
+def test_build_search_index_sorts_tokens_and_lists_postings():
+    labels = [ITEMS[item_id]["label"] for item_id in ITEMS]
+    texts = [search_text(ITEMS[item_id], ["category"]) for item_id in ITEMS]
+    index = build_search_index(labels, texts)
+
+    assert index["tokens"] == sorted(index["tokens"], key=lambda t: t.encode("utf-16-be"))
+    postings = dict(zip(index["tokens"], index["postings"]))
+    assert postings["home"] == [0]
+    assert postings["boat"] == [1]
+    assert postings["navigation"] == [0]
+    assert postings["étoile"] == [2]
+
+
+def test_searchable_items_carry_search_text(component_calls):
+    select_icons(ITEMS, searchable=True, search_properties=["category"], key="search")
+
+    call = component_calls[0]
+    assert call["searchable"] is True
+    assert call["items"]["home"]["search_text"] == "navigation"
+    assert "search_text" not in call["items"]["status"]
+
+
+def test_catalog_ships_a_prebuilt_search_index():
+    catalog = IconCatalog.from_items(ITEMS, search_properties=["category"], search_index=True)
+    payload = json.loads(catalog.payload)
+
+    assert payload["search_texts"] == ["navigation", "Buildings", None]
+    assert payload["search_index"] == catalog.search_index
+    assert "search_index" not in json.loads(IconCatalog.from_items(ITEMS).payload)
+
+
+def test_search_properties_with_a_catalog_raise():
+    catalog = IconCatalog.from_items(ITEMS)
+    with pytest.raises(ValueError):
+        select_icons(catalog, searchable=True, search_properties=["category"])
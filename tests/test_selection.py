@@ -0,0 +1,107 @@
+"""Tests for decoding the compact selection encodings."""
+
+import base64
+
+import pytest
+
+from streamlit_select_icons import select_icons
+from streamlit_select_icons._selection import decode_bitset, decode_ranges, decode_selection
+
+ITEM_IDS = [f"item_{i}" for i in range(20)]
+
+
+def encode_bitset(indices, count):
+    """Mirror of encodeBitset in the frontend."""
+    data = bytearray((count + 7) // 8)
+    for index in indices:
+        data[index >> 3] |= 1 << (index & 7)
+    return base64.b64encode(bytes(data)).decode("ascii")
+
+
+def test_decode_ranges():
+    assert decode_ranges([[0, 2], [5, 6], [18, 25]], ITEM_IDS) == [
+        "item_0", "item_1", "item_5", "item_18", "item_19",
+    ]
+
+
+def test_decode_bitset():
+    indices = [0, 7, 8, 13, 19]
+    assert decode_bitset(encode_bitset(indices, len(ITEM_IDS)), ITEM_IDS) == [
+        ITEM_IDS[i] for i in indices
+    ]
+
+
+def test_decode_selection_defaults_to_ids():
+    assert decode_selection({"selected_items": ["item_3", "item_1"]}, ITEM_IDS) == ["item_3", "item_1"]
+    assert decode_selection(None, ITEM_IDS) == []
+
+
+def test_compact_encodings_stay_small_for_large_selections():
+    item_ids = [f"item_{i}" for i in range(20_000)]
+    indices = [i for i in range(20_000) if i % 1000 != 0]
+    bitset = encode_bitset(indices, len(item_ids))
+
+    assert decode_bitset(bitset, item_ids) == [item_ids[i] for i in indices]
+    assert len(bitset) < 4_000
+
+
+@pytest.mark.parametrize("component_value", [lambda kwargs: {"selected_ranges": [[2, 4]]}])
+def test_select_icons_decodes_ranges(component_calls):
+    items = {item_id: {"label": item_id} for item_id in ITEM_IDS}
+
+    result = select_icons(items, selection_encoding="ranges")
+
+    assert result["selected_items"] == ["item_2", "item_3"]
+
+
+def test_select_icons_rejects_unknown_encoding():
+    with pytest.raises(ValueError):
+        select_icons({}, selection_encoding="gzip")
+
+
+@pytest.mark.parametrize("commit_mode", ["immediate", "debounced", "submit"])
+def test_select_icons_passes_commit_mode(component_calls, commit_mode):
+    select_icons({}, commit_mode=commit_mode, debounce_ms=750)
+
+    assert component_calls[0]["commit_mode"] == commit_mode
+    assert component_calls[0]["debounce_ms"] == 750
+
+
+def test_select_icons_rejects_unknown_commit_mode():
+    with pytest.raises(ValueError):
+        select_icons({}, commit_mode="later")
+
+
+def test_select_icons_passes_bulk_actions(component_calls):
+    select_icons({})
+    select_icons({}, bulk_actions=True)
+
+    assert [call["bulk_actions"] for call in component_calls] == [False, True]
+
+
+def test_bulk_actions_require_multi_select():
+    with pytest.raises(ValueError, match="multi_select"):
+        select_icons({}, bulk_actions=True, multi_select=False)
+
+
+@pytest.mark.parametrize("component_value", [lambda kwargs: {"selected_bitset": encode_bitset([2], 3)}])
+def test_numeric_ids_keep_the_dict_order(component_calls):
+    # A JavaScript object would list these as "2", "10", "b"
+    items = {item_id: {"label": item_id, "icon": None} for item_id in ("b", "10", "2")}
+
+    result = select_icons(items, selection_encoding="bitset", visible=["2", "b"])
+    select_icons({"a": {"label": "A", "icon": None}})
+
+    assert component_calls[0]["item_order"] == ["b", "10", "2"]
+    assert component_calls[0]["visible"] == [2, 0]
+    assert result["selected_items"] == ["2"]
+    assert "item_order" not in component_calls[1]
+
+
+def test_unresolved_ids_follow_the_compact_encodings():
+    value = {"selected_ranges": [[1, 2]], "unresolved_items": ["hidden"]}
+
+    assert decode_selection(value, ITEM_IDS) == ["item_1", "hidden"]
+    assert decode_selection({"selected_bitset": encode_bitset([3], 20), "unresolved_items": ["x"]}, ITEM_IDS) == [
+        "item_3", "x",
+    ]
@@ -0,0 +1,102 @@
+"""Tests for items given as a DataFrame or Arrow table."""
+
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import streamlit_select_icons
+from streamlit_select_icons import select_icons
+from streamlit_select_icons.table import TableItems
+
+FRAME = pd.DataFrame(
+    {
+        "id": ["home", "search", "status"],
+        "label": ["Home", "Search", "Active"],
+        "icon": ["static/icon.png", "static/icon.png", None],
+        "alt_text": [None, None, "🟢"],
+        "category": ["navigation", "tools", None],
+    }
+)
+
+
+
+def read_payload(payload: bytes) -> pa.Table:
+    return pa.ipc.open_stream(payload).read_all()
+
+
+def test_dataframe_is_sent_as_arrow_columns(component_calls):
+    result = select_icons(FRAME, selected_items=["status"], key="icons")
+
+    kwargs = component_calls[0]
+    assert kwargs["items"] is None
+    sent = read_payload(kwargs["table"])
+    assert sent.column_names == ["id", "label", "icon", "alt_text"]
+    assert all(field.type == pa.string() for field in sent.schema)
+    assert sent.column("id").to_pylist() == ["home", "search", "status"]
+    assert result["selected_items"] == ["status"]
+    assert list(result["items"]) == ["home", "search", "status"]
+    assert result["items"]["status"] == {
+        "label": "Active",
+        "icon": None,
+        "alt_text": "🟢",
+        "properties": {"category": None},
+    }
+
+
+def test_table_hash_is_stable_across_reruns_and_input_types(component_calls):
+    select_icons(FRAME, key="frame")
+    select_icons(FRAME.copy(), key="frame")
+    select_icons(pa.Table.from_pandas(FRAME, preserve_index=False), key="table")
+
+    hashes = {kwargs["table_hash"] for kwargs in component_calls}
+    assert len(hashes) == 1
+
+
+def test_label_defaults_to_id():
+    items = TableItems.from_table(pa.table({"id": ["a", "b"], "label": [None, "B"]}))
+
+    assert items["a"]["label"] == "a"
+    assert items["b"]["label"] == "B"
+    assert "a" in items and "c" not in items
+
+
+def test_groups_search_and_visible_use_columns(component_calls):
+    select_icons(
+        FRAME,
+        searchable=True,
+        search_properties=["category"],
+        group_by="category",
+        visible=["status", "home"],
+        key="icons",
+    )
+
+    kwargs = component_calls[0]
+    assert kwargs["groups"] == [("navigation", [0]), ("tools", [1]), ("Other", [2])]
+    assert kwargs["visible"] == [2, 0]
+    assert read_payload(kwargs["table"]).column("search_text").to_pylist() == ["navigation", "tools", None]
+
+
+def test_thumbnail_srcsets_are_json_encoded(component_calls, monkeypatch):
+    monkeypatch.setattr(
+        streamlit_select_icons, "icon_srcset", lambda icon, size: [[f"{icon}@1x", 1]] if icon else None
+    )
+
+    select_icons(FRAME, thumbnails=True, key="icons")
+
+    srcsets = read_payload(component_calls[0]["table"]).column("icon_srcset").to_pylist()
+    assert [json.loads(srcset) if srcset else None for srcset in srcsets] == [
+        [["static/icon.png@1x", 1]],
+        [["static/icon.png@1x", 1]],
+        None,
+    ]
+
+
+def test_invalid_tables():
+    with pytest.raises(ValueError, match="'id' column"):
+        TableItems.from_table(pa.table({"label": ["A"]}))
+    with pytest.raises(ValueError, match="unique"):
+        TableItems.from_table(pa.table({"id": ["a", "a"]}))
+    with pytest.raises(TypeError, match="'icon' must hold strings"):
+        TableItems.from_table(pa.table({"id": ["a"], "icon": [1]}))
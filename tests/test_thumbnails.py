@@ -0,0 +1,59 @@
+"""Tests for the icon thumbnail pipeline."""
+
+import pytest
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image
+
+from streamlit_select_icons import select_icons
+from streamlit_select_icons.thumbnails import icon_display_size, icon_srcset
+
+
+@pytest.fixture
+def icon_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    static = tmp_path / "static"
+    static.mkdir()
+    Image.new("RGBA", (512, 256), (255, 0, 0, 255)).save(static / "large.png")
+    Image.new("RGBA", (48, 48), (0, 0, 255, 255)).save(static / "small.png")
+    return static
+
+
+def test_icon_display_size_matches_frontend():
+    assert icon_display_size(None) == 38
+    assert icon_display_size(40) == 24
+    assert icon_display_size(300) == 64
+
+
+def test_icon_srcset_writes_scaled_thumbnails(icon_dir):
+    srcset = icon_srcset("static/large.png", 32)
+
+    assert [ratio for _, ratio in srcset] == [1, 2, 3]
+    for path, ratio in srcset:
+        assert path.startswith("static/_select_icons/thumb-")
+        with Image.open(path) as thumbnail:
+            assert thumbnail.size == (32 * ratio, 16 * ratio)
+
+
+def test_icon_srcset_never_upscales(icon_dir):
+    srcset = icon_srcset("static/small.png", 32)
+
+    assert srcset[0][0].startswith("static/_select_icons/thumb-")
+    assert srcset[1:] == [("static/small.png", 2)]
+
+
+def test_icon_srcset_skips_unreadable_and_remote_icons(icon_dir):
+    (icon_dir / "vector.svg").write_text("<svg xmlns='http://www.w3.org/2000/svg'/>")
+
+    assert icon_srcset("static/vector.svg", 32) is None
+    assert icon_srcset("https://example.com/icon.png", 32) is None
+
+
+def test_select_icons_ships_srcset_when_enabled(icon_dir, component_calls):
+    items = {"large": {"label": "Large", "icon": "static/large.png"}}
+
+    select_icons(items, size=80, thumbnails=True)
+
+    sent = component_calls[0]["items"]["large"]
+    assert sent["icon"] == "static/large.png"
+    assert [ratio for _, ratio in sent["icon_srcset"]] == [1, 2, 3]